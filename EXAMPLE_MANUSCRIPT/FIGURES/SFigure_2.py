@@ -12,6 +12,7 @@ Usage:
     python SFigure_2.py --help    # Show help message
 """
 
+import csv
 import sys
 from pathlib import Path
 
@@ -19,7 +20,7 @@ import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-import pandas as pd
+import numpy as np
 
 # Set backend based on command line arguments
 if "--show" not in sys.argv:
@@ -48,43 +49,52 @@ plt.rcParams.update(
 
 
 def load_and_process_data():
-    """Load and process the arXiv submission data."""
+    """Load and process the arXiv submission data.
+
+    The CSV is small, so it is read with the standard library and converted
+    straight to NumPy arrays; this avoids importing pandas just to parse it.
+
+    Returns:
+        Tuple of (dates, submissions) arrays sorted chronologically.
+    """
     # Define the path to the data file
     data_path = (
         Path(__file__).parent / "DATA" / "SFigure_2" / "arxiv_monthly_submissions.csv"
     )
 
     # Load the data
-    df = pd.read_csv(data_path)
+    with open(data_path, newline="", encoding="utf-8") as data_file:
+        rows = list(csv.DictReader(data_file))
 
-    # Convert month column to datetime
-    df["date"] = pd.to_datetime(df["month"], format="%Y-%m")
+    # Convert month column to monthly datetimes
+    dates = np.array([row["month"] for row in rows], dtype="datetime64[M]")
+    submissions = np.array([int(row["submissions"]) for row in rows])
 
     # Sort by date to ensure proper chronological order
-    df = df.sort_values("date").reset_index(drop=True)
+    order = np.argsort(dates, kind="stable")
 
-    return df
+    return dates[order], submissions[order]
 
 
 def create_figure():
     """Create the publication-ready figure."""
     # Load data
-    df = load_and_process_data()
+    dates, submissions = load_and_process_data()
 
     # Create figure and axis - optimized for single column format
     fig, ax = plt.subplots(figsize=(3.5, 4))
 
     # Plot the data with thinner line for compact format
     ax.plot(
-        df["date"],
-        df["submissions"],
+        dates,
+        submissions,
         linewidth=1.2,
         color="#2E86AB",  # Professional blue color
         alpha=0.8,
     )
 
     # Fill area under the curve for visual appeal
-    ax.fill_between(df["date"], df["submissions"], alpha=0.2, color="#2E86AB")
+    ax.fill_between(dates, submissions, alpha=0.2, color="#2E86AB")
 
     # Customize axes with smaller fonts for column format
     ax.set_xlabel("Year", fontsize=9, fontweight="bold")
@@ -120,10 +130,9 @@ def create_figure():
     # Add compact annotations for column format
 
     # Find peak values with proper type handling
-    peak_idx = df["submissions"].idxmax()
-    peak_submissions = int(df.iloc[peak_idx]["submissions"])
-    peak_month = df.iloc[peak_idx]["month"]
-    peak_date = pd.to_datetime(peak_month)
+    peak_idx = int(np.argmax(submissions))
+    peak_submissions = int(submissions[peak_idx])
+    peak_date = dates[peak_idx].item()
 
     # Add compact annotation for peak
     ax.text(
@@ -149,31 +158,21 @@ def save_figure(fig, output_path=None):
     # when called by generate_figures.py)
     output_path = Path.cwd() if output_path is None else Path(output_path)
 
-    # Save as PDF (vector format for LaTeX)
-    fig.savefig(
-        output_path / "SFigure_2.pdf",
-        dpi=300,
-        bbox_inches="tight",
-        facecolor="white",
-        edgecolor="none",
-    )
-
-    # Save as SVG (vector format for web)
-    fig.savefig(
-        output_path / "SFigure_2.svg",
-        bbox_inches="tight",
-        facecolor="white",
-        edgecolor="none",
-    )
-
-    # Save as high-resolution PNG (raster format for LaTeX compatibility)
-    fig.savefig(
-        output_path / "SFigure_2.png",
-        dpi=300,
-        bbox_inches="tight",
-        facecolor="white",
-        edgecolor="none",
-    )
+    # Compute the tight bounding box once and reuse it for every format.
+    # Passing bbox_inches="tight" to each savefig call would trigger an
+    # extra layout render per format just to measure the figure extents.
+    bbox = fig.get_tightbbox().padded(plt.rcParams["savefig.pad_inches"])
+
+    # PDF (vector format for LaTeX), SVG (vector format for web) and
+    # high-resolution PNG (raster format for LaTeX compatibility)
+    for extension in ("pdf", "svg", "png"):
+        fig.savefig(
+            output_path / f"SFigure_2.{extension}",
+            dpi=300,
+            bbox_inches=bbox,
+            facecolor="white",
+            edgecolor="none",
+        )
 
     # Print save locations
     print("Figure saved to:")
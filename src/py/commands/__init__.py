@@ -1,11 +1,39 @@
 """Command-line interface modules for Rxiv-Maker.
 
 This package contains the main executable scripts for article and figure generation.
+
+The public names are resolved lazily (PEP 562), so importing one command module
+does not pull in the import chains of all the others. As with any package, a
+submodule imported directly (``import src.py.commands.generate_preprint``)
+before the package export is accessed is bound under its own name.
 """
 
-from .generate_figures import FigureGenerator
-from .generate_figures import main as figures_main
-from .generate_preprint import generate_preprint
-from .generate_preprint import main as preprint_main
+import importlib
+
+# Public name -> (submodule, attribute)
+_LAZY_ATTRIBUTES = {
+    "FigureGenerator": ("generate_figures", "FigureGenerator"),
+    "figures_main": ("generate_figures", "main"),
+    "generate_preprint": ("generate_preprint", "generate_preprint"),
+    "preprint_main": ("generate_preprint", "main"),
+}
 
 __all__ = ["generate_preprint", "preprint_main", "FigureGenerator", "figures_main"]
+
+
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    # Importing generate_preprint binds the submodule under the same name as
+    # the function; rebinding the name keeps the function exported
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily provided names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
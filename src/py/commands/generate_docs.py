@@ -11,32 +11,87 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Options shared by every lazydocs run
+LAZYDOCS_OPTIONS = (
+    "--no-watermark",
+    "--remove-package-prefix",
+    "--src-base-url",
+    "https://github.com/henriqueslab/rxiv-maker/blob/main",
+)
+
+# Keeps messages from concurrent lazydocs runs from interleaving
+_PRINT_LOCK = threading.Lock()
+
+
+def _lazydocs_command(docs_dir, module_paths):
+    """Build the lazydocs command line for one or more modules."""
+    return [
+        "lazydocs",
+        *map(str, module_paths),
+        "--output-path",
+        str(docs_dir),
+        *LAZYDOCS_OPTIONS,
+    ]
+
+
+def generate_all_module_docs(docs_dir, module_paths):
+    """Generate documentation for all modules with a single lazydocs run.
+
+    This pays the lazydocs start-up cost once instead of once per module.
+    lazydocs stops at the first module it cannot import, so a False return
+    means the caller should fall back to documenting modules one by one.
+
+    Args:
+        docs_dir: Path to the docs directory
+        module_paths: Paths of the modules to document
+
+    Returns:
+        True if every module was documented, False otherwise
+    """
+    cmd = _lazydocs_command(docs_dir, module_paths)
+    print(f"Running: lazydocs on {len(module_paths)} modules")
+    try:
+        # Failures are diagnosed by the per-module fallback, so the batch
+        # run's output is not kept
+        subprocess.run(  # nosec B603
+            cmd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
 
 def generate_module_docs(docs_dir, module_path):
     """Generate documentation for a specific module using lazydocs."""
     try:
         # Generate documentation for the specific module
-        cmd = [
-            "lazydocs",
-            str(module_path),
-            "--output-path",
-            str(docs_dir),
-            "--no-watermark",
-            "--remove-package-prefix",
-            "--src-base-url",
-            "https://github.com/henriqueslab/rxiv-maker/blob/main",
-        ]
-
-        print(f"Running: {' '.join(cmd)}")
-        subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec B603
+        cmd = _lazydocs_command(docs_dir, [module_path])
+
+        with _PRINT_LOCK:
+            print(f"Running: {' '.join(cmd)}")
+        # Only stderr is reported (on failure), so stdout is discarded and
+        # stderr is kept as bytes until it is needed
+        subprocess.run(  # nosec B603
+            cmd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
         return True
 
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error generating documentation for {module_path}: {e}")
-        if e.stderr:
-            print(f"STDERR: {e.stderr}")
+        with _PRINT_LOCK:
+            print(f"❌ Error generating documentation for {module_path}: {e}")
+            if e.stderr:
+                print(f"STDERR: {e.stderr.decode(errors='replace')}")
         return False
 
 
@@ -60,36 +115,120 @@ def generate_enhanced_index(docs_dir, successful_modules):
         "core": [],  # For modules at the root level
     }
 
-    # Categorize the modules
+    # Categorize the modules as (link text, file name) pairs derived from the
+    # path components once per module
     for module_path in successful_modules:
-        parts = str(module_path).split("/")
+        parts = Path(module_path).parts
+        entry = (".".join(parts), "_".join(parts) + ".md")
         if len(parts) > 1 and parts[0] in categories:
-            categories[parts[0]].append(module_path)
+            categories[parts[0]].append(entry)
         else:
-            categories["core"].append(module_path)
-
-    # Generate the index.md file
-    with open(index_path, "w") as f:
-        f.write("# API Documentation\n\n")
-        f.write("Welcome to the API documentation for rxiv-maker.\n\n")
-
-        # Generate sections for each category
-        for category, modules in categories.items():
-            if modules:
-                f.write(f"## {category.capitalize()} Modules\n\n")
-                for module in sorted(modules):
-                    module_name = str(module).replace("/", ".")
-                    file_name = str(module).replace("/", "_") + ".md"
-                    f.write(f"- [{module_name}]({file_name})\n")
-                f.write("\n")
-
-    # Copy the same content to README.md for GitHub browsing
-    if index_path.exists():
-        shutil.copy(index_path, readme_path)
+            categories["core"].append(entry)
+
+    # Build the index.md content
+    lines = [
+        "# API Documentation\n\n",
+        "Welcome to the API documentation for rxiv-maker.\n\n",
+    ]
+
+    # Generate sections for each category
+    for category, modules in categories.items():
+        if modules:
+            lines.append(f"## {category.capitalize()} Modules\n\n")
+            lines.extend(
+                f"- [{module_name}]({file_name})\n"
+                for module_name, file_name in sorted(modules)
+            )
+            lines.append("\n")
+    content = "".join(lines)
+
+    # Write it once, and the same content to README.md for GitHub browsing
+    index_path.write_text(content)
+    readme_path.write_text(content)
 
     return index_path
 
 
+def _reset_docs_dir(docs_dir):
+    """Replace ``docs_dir`` with an empty directory, keeping ``.gitkeep``.
+
+    The existing directory is renamed aside, which is a single metadata
+    operation, and removed on a background thread.
+
+    Returns:
+        The started cleanup thread (join it before exiting), or None if
+        there was nothing to remove
+    """
+    if not docs_dir.exists():
+        docs_dir.mkdir(parents=True)
+        return None
+
+    trash_dir = Path(
+        tempfile.mkdtemp(prefix=f".{docs_dir.name}-old-", dir=docs_dir.parent)
+    )
+    old_docs_dir = trash_dir / docs_dir.name
+    docs_dir.rename(old_docs_dir)
+    docs_dir.mkdir()
+    if (old_docs_dir / ".gitkeep").exists():
+        (old_docs_dir / ".gitkeep").rename(docs_dir / ".gitkeep")
+
+    cleanup = threading.Thread(
+        target=shutil.rmtree, args=(trash_dir,), kwargs={"ignore_errors": True}
+    )
+    cleanup.start()
+    return cleanup
+
+
+def _iter_python_modules(root):
+    """Yield the Python modules under ``root`` that should be documented.
+
+    Uses ``os.scandir`` so file types come from the cached directory entries,
+    and prunes ``__pycache__`` directories instead of descending into them.
+    Test modules (``test_*.py``) are skipped.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    yield from _iter_python_modules(entry.path)
+            elif (
+                entry.name.endswith(".py")
+                and not entry.name.startswith("test_")
+                and entry.is_file()
+            ):
+                yield Path(entry.path)
+
+
+def _generate_docs_individually(docs_dir, src_dir, python_files):
+    """Document each module with its own lazydocs run.
+
+    Every lazydocs run is a separate subprocess, so they are launched
+    concurrently; results are reported in file order.
+
+    Returns:
+        Tuple of (successful, failed) module paths relative to src_dir
+    """
+    successful_files = []
+    failed_files = []
+    max_workers = min(len(python_files), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(generate_module_docs, docs_dir, py_file)
+            for py_file in python_files
+        ]
+        for py_file, future in zip(python_files, futures):
+            rel_path = py_file.relative_to(src_dir)
+            if future.result():
+                successful_files.append(rel_path)
+                with _PRINT_LOCK:
+                    print(f"✅ {rel_path} documented successfully")
+            else:
+                failed_files.append(rel_path)
+                with _PRINT_LOCK:
+                    print(f"❌ Failed to document {rel_path}")
+    return successful_files, failed_files
+
+
 def main():
     """Generate API documentation using lazydocs with enhancements."""
     # Get the project root directory (script is in src/py/commands/)
@@ -97,16 +236,9 @@ def main():
     src_dir = project_root / "src" / "py"
     docs_dir = project_root / "docs" / "api"
 
-    # Ensure docs directory exists
-    docs_dir.mkdir(parents=True, exist_ok=True)
-
-    # Clean existing generated docs (except .gitkeep)
-    for item in docs_dir.iterdir():
-        if item.name != ".gitkeep":
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
+    # Start from an empty docs directory (except .gitkeep); the old contents
+    # are deleted in the background while the new docs are generated
+    cleanup = _reset_docs_dir(docs_dir)
 
     print("🚀 Generating API documentation with lazydocs...")
 
@@ -114,32 +246,34 @@ def main():
     os.chdir(project_root)
 
     # Find all Python files to document
-    python_files = []
-
-    # Collect all Python modules excluding __pycache__ and test files
-    for py_file in src_dir.rglob("*.py"):
-        if "__pycache__" not in str(py_file) and not py_file.name.startswith("test_"):
-            python_files.append(py_file)
+    python_files = list(_iter_python_modules(src_dir))
 
     successful_files = []
     failed_files = []
 
-    print(f"Found {len(python_files)} Python files to document:")
-    for py_file in python_files:
-        rel_path = py_file.relative_to(src_dir)
-        print(f"  - {rel_path}")
-
-    # Generate documentation for each file
-    for py_file in python_files:
-        rel_path = py_file.relative_to(src_dir)
-        print(f"\n📦 Generating docs for {rel_path}...")
-
-        if generate_module_docs(docs_dir, py_file):
-            successful_files.append(rel_path)
-            print(f"✅ {rel_path} documented successfully")
-        else:
-            failed_files.append(rel_path)
-            print(f"❌ Failed to document {rel_path}")
+    print(
+        "\n".join(
+            [f"Found {len(python_files)} Python files to document:"]
+            + [f"  - {py_file.relative_to(src_dir)}" for py_file in python_files]
+        )
+    )
+
+    # Try to document everything in a single lazydocs run first
+    print("\n📦 Generating docs...")
+    if python_files and generate_all_module_docs(docs_dir, python_files):
+        successful_files = [py_file.relative_to(src_dir) for py_file in python_files]
+        print(
+            "\n".join(
+                f"✅ {rel_path} documented successfully"
+                for rel_path in successful_files
+            )
+        )
+    else:
+        if python_files:
+            print("⚠️  Batch run failed, documenting modules individually...")
+        successful_files, failed_files = _generate_docs_individually(
+            docs_dir, src_dir, python_files
+        )
 
     print(f"\n📁 Documentation saved to: {docs_dir}")
 
@@ -147,10 +281,13 @@ def main():
     print("\n📄 Generated files:")
     md_files = list(docs_dir.rglob("*.md"))
     if md_files:
-        for file in sorted(md_files):
-            if file.name != "README.md":
-                rel_path = file.relative_to(docs_dir)
-                print(f"  - {rel_path}")
+        print(
+            "\n".join(
+                f"  - {file.relative_to(docs_dir)}"
+                for file in sorted(md_files)
+                if file.name != "README.md"
+            )
+        )
     else:
         print("  No markdown files generated")
 
@@ -159,6 +296,9 @@ def main():
     index_path = generate_enhanced_index(docs_dir, successful_files)
     print(f"✅ Enhanced index created at {index_path}")
 
+    if cleanup is not None:
+        cleanup.join()
+
     # Summary
     print("\n📊 Summary:")
     print(f"  ✅ Successful: {len(successful_files)} files")
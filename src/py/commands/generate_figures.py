@@ -9,22 +9,95 @@ publication-ready output files. It supports:
 
 Usage:
     python generate_figures.py [--output-dir OUTPUT_DIR] [--format FORMAT]
+                               [--jobs N]
 """
 
-import argparse
+import atexit
+import hashlib
+import io
+import json
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout, suppress
 from pathlib import Path
 
-PUPPETEER_CONFIG_PATH = Path(__file__).parent / "puppeteer-config.json"
+# Bump to invalidate every cached Mermaid render (e.g. when the mmdc options
+# used for a format change in a way that is not captured by the cache key)
+MERMAID_CACHE_SCHEMA = "1"
+
+# Bump to invalidate every recorded figure script run
+SCRIPT_CACHE_SCHEMA = "1"
+
+# Subdirectory owned by the cache inside a user-supplied cache directory, so
+# that clearing the cache never touches anything else stored there
+SHARED_CACHE_SUBDIR = "rxiv-figure-cache"
+
+# Files written by figure scripts that count as generated figures
+FIGURE_EXTENSIONS = (".png", ".pdf", ".svg", ".eps")
+
+# Puppeteer config passed to mmdc when running as root, written once per
+# process; creation is serialized between render threads
+_PUPPETEER_CONFIG_LOCK = threading.Lock()
+_puppeteer_config_path = None
+
+
+def _get_puppeteer_config_path():
+    """Return the path of a puppeteer config that disables the sandbox.
+
+    The file is written to the temporary directory on first use, shared by
+    every later render, and removed when the process exits.
+    """
+    global _puppeteer_config_path
+    with _PUPPETEER_CONFIG_LOCK:
+        if _puppeteer_config_path is None:
+            fd, path = tempfile.mkstemp(prefix="rxiv-puppeteer-", suffix=".json")
+            with os.fdopen(fd, "w") as f:
+                f.write('{"args": ["--no-sandbox"]}')
+            atexit.register(Path(path).unlink, missing_ok=True)
+            _puppeteer_config_path = path
+    return _puppeteer_config_path
 
 
 class FigureGenerator:
     """Main class for generating figures from various source formats."""
 
+    # Output formats accepted for --format
+    supported_formats = ("png", "svg", "pdf", "eps")
+
+    # Formats always rendered for Mermaid diagrams
+    mermaid_formats = ("svg", "png", "pdf")
+
+    # Extra mmdc options per output format (none for svg)
+    MERMAID_FORMAT_OPTIONS = {
+        "pdf": ("--backgroundColor", "transparent"),
+        "png": ("--width", "1200", "--height", "800"),
+    }
+
+    # Result of the mmdc availability check, shared by all instances so the
+    # CLI is probed at most once per process
+    _mermaid_cli_available = None
+    _mermaid_cli_version = None
+    _mermaid_cli_lock = threading.Lock()
+
+    # Same for the Rscript availability check
+    _rscript_available = None
+    _rscript_lock = threading.Lock()
+
     def __init__(
-        self, figures_dir="FIGURES", output_dir="FIGURES", output_format="png"
+        self,
+        figures_dir="FIGURES",
+        output_dir="FIGURES",
+        output_format="png",
+        cache_dir=None,
+        in_process=False,
+        jobs=None,
+        use_cache=True,
     ):
         """Initialize the figure generator.
 
@@ -32,21 +105,74 @@ class FigureGenerator:
             figures_dir: Directory containing source figure files
             output_dir: Directory for generated output files
             output_format: Default output format for figures
+            cache_dir: Directory for cached Mermaid renders and the index of
+                up-to-date figure scripts (default: $FIGURE_CACHE_DIR, or
+                OUTPUT_DIR/.figure_cache). A given directory is used through
+                its rxiv-figure-cache subdirectory. Entries are keyed by
+                content, so it can be shared between checkouts and CI runs.
+            in_process: Execute Python figure scripts inside this interpreter
+                (one at a time) instead of spawning a new one per script
+            jobs: Maximum number of figures generated concurrently
+                (default: number of CPUs)
+            use_cache: Reuse cached Mermaid renders and skip figure scripts
+                whose inputs did not change; without it everything is
+                generated again (the cache is still refreshed)
         """
         self.figures_dir = Path(figures_dir)
         self.output_dir = Path(output_dir)
+        cache_dir = cache_dir or os.environ.get("FIGURE_CACHE_DIR")
+        self.cache_dir = (
+            Path(cache_dir) / SHARED_CACHE_SUBDIR
+            if cache_dir
+            else self.output_dir / ".figure_cache"
+        )
         self.output_format = output_format.lower()
-        self.supported_formats = ["png", "svg", "pdf", "eps"]
+        self.in_process = in_process
+        self.use_cache = use_cache
+        self.jobs = (os.cpu_count() or 1) if jobs is None else jobs
+        if self.jobs < 1:
+            raise ValueError(f"Number of jobs must be at least 1, got {jobs}")
 
         if self.output_format not in self.supported_formats:
             raise ValueError(
                 f"Unsupported format: {self.output_format}. "
-                f"Supported: {self.supported_formats}"
+                f"Supported: {list(self.supported_formats)}"
             )
 
+        # Mermaid diagrams are rendered in every standard format, plus the
+        # requested one if it is not among them
+        self._mermaid_formats = self.mermaid_formats
+        if self.output_format not in self._mermaid_formats:
+            self._mermaid_formats += (self.output_format,)
+        # (format, extra mmdc options) for each Mermaid render
+        self._mermaid_renders = tuple(
+            (format_type, self.MERMAID_FORMAT_OPTIONS.get(format_type, ()))
+            for format_type in self._mermaid_formats
+        )
+
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Per-thread output buffer used while figures render in parallel
+        self._output = threading.local()
+
+        # Fingerprints and outputs of the figure scripts that last ran
+        # successfully, keyed by resolved script path so that manuscripts
+        # sharing a cache directory do not overwrite each other's entries
+        self._script_cache_file = self.cache_dir / "scripts.json"
+        self._script_cache = self._load_script_cache()
+        self._script_cache_dirty = False
+        self._script_cache_lock = threading.Lock()
+
+        # Latest Mermaid render of each diagram content, keyed by the
+        # version-independent content key
+        self._mermaid_index_file = self.cache_dir / "index.json"
+        self._mermaid_index = self._load_json(self._mermaid_index_file)
+        self._mermaid_index_dirty = False
+        self._mermaid_cache_lock = threading.Lock()
+        self._mermaid_cache_stats = {"hits": 0, "misses": 0}
+        self._mermaid_render_locks = {}
+
     def generate_all_figures(self):
         """Generate all figures found in the figures directory."""
         if not self.figures_dir.exists():
@@ -60,114 +186,270 @@ class FigureGenerator:
         print(f"Output format: {self.output_format}")
         print("-" * 50)
 
-        # Find all figure files
-        mermaid_files = list(self.figures_dir.glob("*.mmd"))
-        python_files = list(self.figures_dir.glob("*.py"))
-        r_files = list(self.figures_dir.glob("*.R"))  # Add support for R files
+        # Find all figure files in a single directory scan (hidden files are
+        # skipped, as glob would)
+        sources = {".mmd": [], ".py": [], ".R": []}
+        with os.scandir(self.figures_dir) as entries:
+            for entry in entries:
+                files = sources.get(os.path.splitext(entry.name)[1])
+                if (
+                    files is not None
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ):
+                    files.append(Path(entry.path))
+        mermaid_files, python_files, r_files = sources.values()
 
         if not mermaid_files and not python_files and not r_files:
             print("No figure files found (.mmd, .py, or .R)")
             return
 
-        # Process Mermaid files
+        # Each figure is produced by independent subprocesses (mmdc, python,
+        # Rscript), so the files of each kind are generated concurrently
         if mermaid_files:
             print(f"Found {len(mermaid_files)} Mermaid file(s):")
-            for mmd_file in mermaid_files:
-                print(f"  - {mmd_file.name}")
-                self.generate_mermaid_figure(mmd_file)
+            self._generate_concurrently(mermaid_files, self.generate_mermaid_figure)
+            stats = self._mermaid_cache_stats
+            print(
+                f"Mermaid cache: {stats['hits']} hit(s), {stats['misses']} miss(es)"
+                f" ({self.cache_dir})"
+            )
 
-        # Process Python files
         if python_files:
             print(f"\nFound {len(python_files)} Python file(s):")
-            for py_file in python_files:
-                print(f"  - {py_file.name}")
-                self.generate_python_figure(py_file)
+            # In-process execution changes the working directory and the
+            # standard streams, so those scripts must run one at a time
+            self._generate_concurrently(
+                python_files,
+                self.generate_python_figure,
+                parallel=not self.in_process,
+            )
 
-        # Process R files
         if r_files:
             print(f"\nFound {len(r_files)} R file(s):")
-            for r_file in r_files:
-                print(f"  - {r_file.name}")
-                self.generate_r_figure(r_file)
+            self._generate_concurrently(r_files, self.generate_r_figure)
+
+        self._save_script_cache()
+        self._save_mermaid_index()
 
         print("\nFigure generation completed!")
 
+    def _generate_concurrently(self, source_files, generate, parallel=True):
+        """Run ``generate`` for each source file on a thread pool.
+
+        Messages logged by each task are buffered and printed once it
+        finishes, in the original file order, so output is not interleaved.
+        With ``parallel=False`` the files are processed one by one on the
+        calling thread instead, and messages are printed as they come.
+        """
+        if not parallel or self.jobs == 1:
+            for source_file in source_files:
+                print(f"  - {source_file.name}")
+                generate(source_file)
+            return
+
+        max_workers = min(len(source_files), self.jobs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._run_buffered, generate, source_file)
+                for source_file in source_files
+            ]
+            # One write per file keeps each block contiguous on the terminal
+            for source_file, future in zip(source_files, futures):
+                print("\n".join([f"  - {source_file.name}", *future.result()]))
+
     def generate_mermaid_figure(self, mmd_file):
-        """Generate figure from Mermaid diagram file."""
+        """Generate figure from Mermaid diagram file.
+
+        Renders are cached by content hash and Mermaid CLI version, so
+        unchanged diagrams are copied from the cache instead of being rendered
+        again. Without the CLI, the latest cached render is reused.
+        """
         try:
-            # Check if mmdc (Mermaid CLI) is available
-            if not self._check_mermaid_cli():
-                print(
-                    f"  ⚠️  Skipping {mmd_file.name}: Mermaid CLI not available"
-                )
-                print(
-                    "     Install with: npm install -g @mermaid-js/mermaid-cli"
-                )
-                return
+            source = mmd_file.read_bytes()
 
             # Create subdirectory for this figure
             figure_dir = self.output_dir / mmd_file.stem
             figure_dir.mkdir(parents=True, exist_ok=True)
 
-            # Always generate SVG, PNG, and PDF for Mermaid diagrams
-            formats_to_generate = ["svg", "png", "pdf"]
-
-            # Add the requested format if it's not already included
-            if self.output_format not in formats_to_generate:
-                formats_to_generate.append(self.output_format)
-
             generated_files = []
+            mmdc_version = self._mermaid_version()
 
-            for format_type in formats_to_generate:
+            for format_type, format_options in self._mermaid_renders:
                 output_file = figure_dir / f"{mmd_file.stem}.{format_type}"
+                display_name = f"{figure_dir.name}/{output_file.name}"
 
-                # Generate the figure using Mermaid CLI
-                cmd = ["mmdc", "-i", str(mmd_file), "-o", str(output_file)]
-
-                # Add --no-sandbox if running as root (UID 0)
-                if os.geteuid() == 0:
-                    if not PUPPETEER_CONFIG_PATH.exists():
-                        PUPPETEER_CONFIG_PATH.write_text(
-                            '{"args": ["--no-sandbox"]}'
-                        )
-                    cmd.extend(
-                        ["--puppeteerConfigFile", str(PUPPETEER_CONFIG_PATH)]
-                    )
-
-                # Add format-specific options
-                if format_type == "pdf":
-                    cmd.extend(["--backgroundColor", "transparent"])
-                elif format_type == "png":
-                    cmd.extend(["--width", "1200", "--height", "800"])
-                # No extra options needed for svg
-
-                print(
-                    f"  🎨 Generating {figure_dir.name}/{output_file.name}..."
+                content_key = self._mermaid_content_key(
+                    source, format_type, format_options
                 )
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True
-                )  # nosec B603
-
-                if result.returncode == 0:
-                    success_msg = f"Successfully generated {figure_dir.name}/"
-                    success_msg += f"{output_file.name}"
-                    print(f"  ✅ {success_msg}")
-                    generated_files.append(
-                        f"{figure_dir.name}/{output_file.name}"
+                # Diagrams with identical sources share cache entries; holding
+                # the entry's lock makes duplicates wait for one render and
+                # then reuse it
+                with self._mermaid_render_lock(content_key):
+                    cache_file = self._mermaid_cache_file(
+                        content_key, format_type, mmdc_version
                     )
-                else:
-                    print(
-                        f"  ❌ Error generating {format_type} for {mmd_file.name}:"
+                    cache_hit = (
+                        self.use_cache
+                        and cache_file is not None
+                        and cache_file.exists()
                     )
-                    print(f"     {result.stderr}")
+                    self._count_mermaid_cache_lookup(cache_hit)
+                    if cache_hit:
+                        shutil.copyfile(cache_file, output_file)
+                        self._log(f"  ♻️  Reused cached {display_name}")
+                        generated_files.append(display_name)
+                        continue
+
+                    # Check if mmdc (Mermaid CLI) is available
+                    if mmdc_version is None:
+                        self._log(
+                            f"  ⚠️  Skipping {mmd_file.name}: Mermaid CLI not available"
+                        )
+                        self._log(
+                            "     Install with: npm install -g @mermaid-js/mermaid-cli"
+                        )
+                        return
+
+                    # Generate the figure using Mermaid CLI
+                    cmd = ["mmdc", "-i", str(mmd_file), "-o", str(output_file)]
+
+                    # Add --no-sandbox if running as root (UID 0)
+                    if os.geteuid() == 0:
+                        cmd += ("--puppeteerConfigFile", _get_puppeteer_config_path())
+
+                    cmd += format_options
+
+                    self._log(f"  🎨 Generating {display_name}...")
+                    # mmdc's stdout is never used; keep stderr as raw bytes and
+                    # only decode it when reporting a failure
+                    result = subprocess.run(
+                        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+                    )  # nosec B603
+
+                    if result.returncode == 0:
+                        self._log(f"  ✅ Successfully generated {display_name}")
+                        generated_files.append(display_name)
+                        if self._store_mermaid_cache_file(output_file, cache_file):
+                            self._record_mermaid_render(
+                                content_key, cache_file, mmd_file, mmdc_version
+                            )
+                    else:
+                        self._log(
+                            f"  ❌ Error generating {format_type} for {mmd_file.name}:"
+                        )
+                        self._log(f"     {result.stderr.decode(errors='replace')}")
 
             if generated_files:
-                print(
-                    f"     Total files generated: {', '.join(generated_files)}"
-                )
+                self._log(f"     Total files generated: {', '.join(generated_files)}")
 
         except Exception as e:
-            print(f"  ❌ Error processing {mmd_file.name}: {e}")
+            self._log(f"  ❌ Error processing {mmd_file.name}: {e}")
+
+    def _log(self, message=""):
+        """Print a progress message, or buffer it inside ``_run_buffered``."""
+        buffer = getattr(self._output, "lines", None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.append(message)
+
+    def _run_buffered(self, func, *args):
+        """Run ``func`` and return the messages it logged instead of printing.
+
+        Used by worker threads so the output of concurrently generated
+        figures is not interleaved.
+        """
+        self._output.lines = []
+        try:
+            func(*args)
+            return self._output.lines
+        finally:
+            self._output.lines = None
+
+    def _mermaid_content_key(self, source, format_type, format_options):
+        """Return the version-independent cache key of a Mermaid render.
+
+        Args:
+            source: Raw bytes of the .mmd source file
+            format_type: Output format (svg, png, pdf, ...)
+            format_options: Extra mmdc options used for this format
+
+        Returns:
+            Hex digest identifying the diagram content and render options
+        """
+        key = hashlib.blake2b(digest_size=16)
+        key.update(MERMAID_CACHE_SCHEMA.encode())
+        key.update(b"\0" + format_type.encode())
+        key.update(b"\0" + " ".join(format_options).encode())
+        key.update(b"\0" + source)
+        return key.hexdigest()
+
+    def _mermaid_cache_file(self, content_key, format_type, mmdc_version):
+        """Return the cache path for a Mermaid render.
+
+        Args:
+            content_key: Key returned by ``_mermaid_content_key``
+            format_type: Output format (svg, png, pdf, ...)
+            mmdc_version: Version of the Mermaid CLI, or None if unavailable
+
+        Returns:
+            Path of the cached render inside the cache directory. Without a
+            Mermaid CLI this is the latest recorded render of the content, or
+            None if there is none.
+        """
+        if mmdc_version is None:
+            entry = self._mermaid_index.get(content_key)
+            return self.cache_dir / entry["file"] if entry else None
+        key = hashlib.blake2b(content_key.encode(), digest_size=16)
+        key.update(b"\0" + mmdc_version.encode())
+        return self.cache_dir / f"{key.hexdigest()}.{format_type}"
+
+    def _record_mermaid_render(self, content_key, cache_file, mmd_file, version):
+        """Record a cached Mermaid render in the cache index."""
+        with self._mermaid_cache_lock:
+            self._mermaid_index[content_key] = {
+                "file": cache_file.name,
+                "figure": mmd_file.stem,
+                "mmdc": version,
+            }
+            self._mermaid_index_dirty = True
+
+    def _mermaid_render_lock(self, content_key):
+        """Return the lock serializing renders of one diagram content."""
+        with self._mermaid_cache_lock:
+            return self._mermaid_render_locks.setdefault(content_key, threading.Lock())
+
+    def _count_mermaid_cache_lookup(self, hit):
+        """Count a Mermaid cache hit or miss for the end-of-run summary."""
+        with self._mermaid_cache_lock:
+            self._mermaid_cache_stats["hits" if hit else "misses"] += 1
+
+    def _save_mermaid_index(self):
+        """Write the Mermaid cache index if it changed."""
+        if self._mermaid_index_dirty:
+            self._write_json(self._mermaid_index_file, self._mermaid_index)
+            self._mermaid_index_dirty = False
+
+    def _store_mermaid_cache_file(self, output_file, cache_file):
+        """Copy a freshly rendered figure into the Mermaid cache.
+
+        The copy goes through a temporary file and ``os.replace`` so readers
+        never see a partially written cache entry.
+
+        Returns:
+            True if the render was stored in the cache
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(output_file, tmp_path)
+            os.replace(tmp_path, cache_file)
+            return True
+        except OSError as e:
+            self._log(f"  ⚠️  Could not cache {output_file.name}: {e}")
+            return False
 
     def generate_python_figure(self, py_file):
         """Generate figure from Python script."""
@@ -176,185 +458,383 @@ class FigureGenerator:
             figure_dir = self.output_dir / py_file.stem
             figure_dir.mkdir(parents=True, exist_ok=True)
 
-            print(f"  🐍 Executing {py_file.name}...")
+            fingerprint, stamp = self._script_fingerprint(py_file)
+            if self._script_is_up_to_date(py_file, fingerprint, figure_dir):
+                self._log(f"  ♻️  {py_file.name} is unchanged, keeping its figures")
+                return
+
+            self._log(f"  🐍 Executing {py_file.name}...")
+            before = self._snapshot_outputs(figure_dir)
 
             # Execute the Python script in the figure-specific subdirectory
-            result = subprocess.run(  # nosec B603 B607
-                [sys.executable, str(py_file.absolute())],
-                capture_output=True,
-                text=True,
-                cwd=str(figure_dir.absolute()),
-            )
+            if self.in_process:
+                result = self._exec_python_script(py_file, figure_dir)
+                if result.returncode != 0:
+                    # State left behind by earlier scripts in this interpreter
+                    # can break a script, so a fresh interpreter has the last
+                    # word
+                    self._log(
+                        f"  🔁 {py_file.name} failed in-process, "
+                        "retrying in a subprocess..."
+                    )
+                    result = self._run_python_script(py_file, figure_dir)
+            else:
+                result = self._run_python_script(py_file, figure_dir)
 
             if result.stdout:
                 # Print any output from the script (like success messages)
                 for line in result.stdout.strip().split("\n"):
                     if line.strip():
-                        print(f"     {line}")
+                        self._log(f"     {line}")
 
             if result.returncode != 0:
-                print(f"  ❌ Error executing {py_file.name}:")
+                self._log(f"  ❌ Error executing {py_file.name}:")
                 if result.stderr:
-                    print(f"     {result.stderr}")
+                    self._log(f"     {result.stderr}")
                 return
 
-            # Check for generated files by scanning the figure subdirectory
-            current_files = set()
-            for ext in ["png", "pdf", "svg", "eps"]:
-                current_files.update(figure_dir.glob(f"*.{ext}"))
-
-            # Look for files that might have been created by this script
-            base_name = py_file.stem
-            potential_files = []
-            for file_path in current_files:
-                # Check if filename contains the base name or is a common figure pattern
-                if (
-                    base_name.lower() in file_path.stem.lower()
-                    or file_path.stem.lower().startswith("figure")
-                    or file_path.stem.lower().startswith("fig")
-                ):
-                    potential_files.append(file_path)
+            # Figures written or rewritten by this script
+            potential_files = self._detect_outputs(figure_dir, before, py_file.stem)
 
             if potential_files:
-                print("  ✅ Generated figures:")
+                self._log("  ✅ Generated figures:")
                 for gen_file in sorted(potential_files):
-                    print(f"     - {figure_dir.name}/{gen_file.name}")
+                    self._log(f"     - {figure_dir.name}/{gen_file.name}")
+                self._record_script_run(py_file, fingerprint, stamp, potential_files)
             else:
-                print(f"  ⚠️  No output files detected for {py_file.name}")
+                self._log(f"  ⚠️  No output files detected for {py_file.name}")
 
         except Exception as e:
-            print(f"  ❌ Error executing {py_file.name}: {e}")
+            self._log(f"  ❌ Error executing {py_file.name}: {e}")
+
+    def _snapshot_outputs(self, figure_dir):
+        """Map each figure file in ``figure_dir`` to its (mtime, size)."""
+        snapshot = {}
+        with os.scandir(figure_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(FIGURE_EXTENSIONS) and entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _detect_outputs(self, figure_dir, before, base_name):
+        """Return the figure files a script created or rewrote.
+
+        Compares the directory against the snapshot taken before the script
+        ran. If nothing appears to have changed (e.g. on a filesystem with
+        coarse timestamps), falls back to matching figure-like file names.
+        """
+        after = self._snapshot_outputs(figure_dir)
+        changed = [name for name, stat in after.items() if before.get(name) != stat]
+        if not changed:
+            base_name = base_name.lower()
+            for name in after:
+                name_lower = name.lower()
+                if base_name in name_lower or name_lower.startswith("fig"):
+                    changed.append(name)
+        return [figure_dir / name for name in changed]
+
+    def _run_python_script(self, py_file, figure_dir):
+        """Execute a figure script in a new interpreter.
+
+        Returns:
+            subprocess.CompletedProcess with the script's stderr
+        """
+        return self._run_script([sys.executable, str(py_file.absolute())], figure_dir)
+
+    def _run_script(self, cmd, figure_dir):
+        """Run a figure script, logging its stdout as it is produced.
+
+        The stdout lines are logged while the script runs instead of being
+        collected first. stderr is spooled to a temporary file and only read
+        back if the script fails.
+
+        Returns:
+            subprocess.CompletedProcess with the script's stderr (only set on
+            failure) and no stdout
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(  # nosec B603 B607
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                bufsize=1,
+                cwd=str(figure_dir.absolute()),
+            ) as process:
+                for line in process.stdout:
+                    if line.strip():
+                        self._log(f"     {line.rstrip()}")
+            stderr = None
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+        return subprocess.CompletedProcess(cmd, process.returncode, None, stderr)
+
+    def _exec_python_script(self, py_file, figure_dir):
+        """Execute a figure script in this interpreter as ``__main__``.
+
+        Mirrors the subprocess run: the working directory is the figure
+        subdirectory, ``sys.argv`` holds only the script path, the script's
+        directory is importable, and stdout/stderr are captured. Heavy modules
+        such as matplotlib are then only imported once per process.
+
+        Returns:
+            subprocess.CompletedProcess with the captured output
+        """
+        script_path = str(py_file.absolute())
+        code = compile(py_file.read_bytes(), script_path, "exec")
+        namespace = {"__name__": "__main__", "__file__": script_path}
+        stdout, stderr = io.StringIO(), io.StringIO()
+        returncode = 0
+
+        # Select the non-interactive backend before the script imports pyplot
+        with suppress(ImportError):
+            import matplotlib
+
+            matplotlib.use("Agg")
+
+        saved_cwd, saved_argv, saved_path = os.getcwd(), sys.argv, sys.path[:]
+        try:
+            os.chdir(figure_dir)
+            sys.argv = [script_path]
+            sys.path.insert(0, str(py_file.parent.absolute()))
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    exec(code, namespace)  # nosec B102
+                except SystemExit as e:
+                    if isinstance(e.code, int):
+                        returncode = e.code
+                    elif e.code is not None:
+                        print(e.code, file=sys.stderr)
+                        returncode = 1
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        finally:
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            sys.path[:] = saved_path
+            # Figures left open would leak into the next script's pyplot state
+            pyplot = sys.modules.get("matplotlib.pyplot")
+            if pyplot is not None:
+                pyplot.close("all")
+
+        return subprocess.CompletedProcess(
+            script_path, returncode, stdout.getvalue(), stderr.getvalue()
+        )
+
+    def _script_inputs(self, script_file):
+        """List a figure script and the files it may import or read.
+
+        Figure scripts conventionally read their inputs from the DATA folder
+        next to them, so every file under FIGURES_DIR/DATA counts as an input,
+        as do the other Python files next to the script, which it may import.
+        Data read from anywhere else is not tracked; use_cache=False (or
+        --no-cache) regenerates the figures regardless.
+
+        Returns:
+            List of (name, path) tuples in a stable order
+        """
+        inputs = [(script_file.name, script_file)]
+        inputs.extend(
+            (module_file.name, module_file)
+            for module_file in sorted(script_file.parent.glob("*.py"))
+            if module_file != script_file
+        )
+        data_dir = self.figures_dir / "DATA"
+        if data_dir.is_dir():
+            inputs.extend(
+                (f"DATA/{data_file.relative_to(data_dir).as_posix()}", data_file)
+                for data_file in sorted(data_dir.rglob("*"))
+                if data_file.is_file()
+            )
+        return inputs
+
+    def _script_fingerprint(self, script_file):
+        """Return a digest of a figure script and its inputs.
+
+        The (mtime, size) stamp of every input is compared with the one stored
+        for the last run first; only when it differs are the inputs read and
+        hashed.
+
+        Returns:
+            Tuple of (fingerprint, stamp)
+        """
+        inputs = self._script_inputs(script_file)
+        stamp = []
+        for name, path in inputs:
+            stat = path.stat()
+            stamp.append([name, stat.st_mtime_ns, stat.st_size])
+
+        entry = self._script_cache.get(self._script_cache_key(script_file))
+        if entry and entry.get("stamp") == stamp:
+            return entry["fingerprint"], stamp
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(SCRIPT_CACHE_SCHEMA.encode())
+        for name, path in inputs:
+            digest.update(b"\0" + name.encode() + b"\0" + path.read_bytes())
+        fingerprint = digest.hexdigest()
+
+        # Inputs were touched but not changed: refresh the stored stamp so the
+        # next run can take the fast path again
+        if entry and entry["fingerprint"] == fingerprint:
+            with self._script_cache_lock:
+                entry["stamp"] = stamp
+                self._script_cache_dirty = True
+        return fingerprint, stamp
+
+    def _script_is_up_to_date(self, script_file, fingerprint, figure_dir):
+        """Check whether a script's recorded outputs are still current."""
+        if not self.use_cache:
+            return False
+        entry = self._script_cache.get(self._script_cache_key(script_file))
+        return bool(
+            entry
+            and entry["fingerprint"] == fingerprint
+            and entry["outputs"]
+            and all((figure_dir / name).exists() for name in entry["outputs"])
+        )
+
+    def _record_script_run(self, script_file, fingerprint, stamp, output_files):
+        """Remember the fingerprint and outputs of a successful script run."""
+        with self._script_cache_lock:
+            self._script_cache[self._script_cache_key(script_file)] = {
+                "fingerprint": fingerprint,
+                "stamp": stamp,
+                "outputs": sorted(path.name for path in output_files),
+            }
+            self._script_cache_dirty = True
+
+    @staticmethod
+    def _script_cache_key(script_file):
+        """Return the key of a figure script in the script index."""
+        return str(script_file.resolve())
+
+    def _load_script_cache(self):
+        """Load the index of up-to-date figure scripts, if any."""
+        return self._load_json(self._script_cache_file)
+
+    def _save_script_cache(self):
+        """Write the index of up-to-date figure scripts if it changed."""
+        if self._script_cache_dirty:
+            self._write_json(self._script_cache_file, self._script_cache)
+            self._script_cache_dirty = False
+
+    @staticmethod
+    def _load_json(path):
+        """Load a cache index, returning an empty one if it is missing."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_json(self, path, data):
+        """Atomically write a cache index into the cache directory."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  ⚠️  Could not save figure cache index: {e}")
 
     def generate_r_figure(self, r_file):
         """Generate figure from R script."""
         try:
+            # Create subdirectory for this figure
+            figure_dir = self.output_dir / r_file.stem
+            figure_dir.mkdir(parents=True, exist_ok=True)
+
+            fingerprint, stamp = self._script_fingerprint(r_file)
+            if self._script_is_up_to_date(r_file, fingerprint, figure_dir):
+                self._log(f"  ♻️  {r_file.name} is unchanged, keeping its figures")
+                return
+
             # Check if Rscript is available
             if not self._check_rscript():
-                print(f"  ⚠️  Skipping {r_file.name}: Rscript not available")
-                print("     Ensure R is installed and accessible in your PATH")
-                print(
+                self._log(f"  ⚠️  Skipping {r_file.name}: Rscript not available")
+                self._log("     Ensure R is installed and accessible in your PATH")
+                self._log(
                     "Check https://www.r-project.org/ for installation instructions"
                 )
                 return
 
-            # Create subdirectory for this figure
-            figure_dir = self.output_dir / r_file.stem
-            figure_dir.mkdir(parents=True, exist_ok=True)
-
-            print(f"  📊 Executing {r_file.name}...")
+            self._log(f"  📊 Executing {r_file.name}...")
+            before = self._snapshot_outputs(figure_dir)
 
             # Execute the R script in the figure-specific subdirectory
-            result = subprocess.run(  # nosec B603 B607
-                ["Rscript", str(r_file.absolute())],
-                capture_output=True,
-                text=True,
-                cwd=str(figure_dir.absolute()),
-            )
-
-            if result.stdout:
-                # Print any output from the script (like success messages)
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        print(f"     {line}")
+            result = self._run_script(["Rscript", str(r_file.absolute())], figure_dir)
 
             if result.returncode != 0:
-                print(f"  ❌ Error executing {r_file.name}:")
+                self._log(f"  ❌ Error executing {r_file.name}:")
                 if result.stderr:
-                    print(f"     {result.stderr}")
+                    self._log(f"     {result.stderr}")
                 return
 
-            # Check for generated files by scanning the figure subdirectory
-            current_files = set()
-            for ext in ["png", "pdf", "svg", "eps"]:
-                current_files.update(figure_dir.glob(f"*.{ext}"))
-
-            # Look for files that might have been created by this script
-            base_name = r_file.stem
-            potential_files = []
-            for file_path in current_files:
-                # Check if filename contains the base name or is a common figure pattern
-                if (
-                    base_name.lower() in file_path.stem.lower()
-                    or file_path.stem.lower().startswith("figure")
-                    or file_path.stem.lower().startswith("fig")
-                ):
-                    potential_files.append(file_path)
+            # Figures written or rewritten by this script
+            potential_files = self._detect_outputs(figure_dir, before, r_file.stem)
 
             if potential_files:
-                print("  ✅ Generated figures:")
+                self._log("  ✅ Generated figures:")
                 for gen_file in sorted(potential_files):
-                    print(f"     - {figure_dir.name}/{gen_file.name}")
+                    self._log(f"     - {figure_dir.name}/{gen_file.name}")
+                self._record_script_run(r_file, fingerprint, stamp, potential_files)
             else:
-                print(f"  ⚠️  No output files detected for {r_file.name}")
+                self._log(f"  ⚠️  No output files detected for {r_file.name}")
 
         except Exception as e:
-            print(f"  ❌ Error executing {r_file.name}: {e}")
+            self._log(f"  ❌ Error executing {r_file.name}: {e}")
 
     def _check_mermaid_cli(self):
         """Check if Mermaid CLI (mmdc) is available."""
-        try:
-            subprocess.run(
-                ["mmdc", "--version"], capture_output=True, check=True
-            )  # nosec B603 B607
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-
-    def _import_matplotlib(self):
-        """Safely import matplotlib."""
-        try:
-            import matplotlib
-
-            # Use non-interactive backend for headless operation
-            matplotlib.use("Agg")
-            return matplotlib
-        except ImportError:
-            print("  ⚠️  matplotlib not available for Python figures")
-            return None
-
-    def _import_seaborn(self):
-        """Safely import seaborn."""
-        try:
-            import seaborn as sns
-
-            return sns
-        except ImportError:
-            print("  ⚠️  seaborn not available")
-            return None
-
-    def _import_numpy(self):
-        """Safely import numpy."""
-        try:
-            import numpy as np
-
-            return np
-        except ImportError:
-            print("  ⚠️  numpy not available")
-            return None
-
-    def _import_pandas(self):
-        """Safely import pandas."""
-        try:
-            import pandas as pd
+        with FigureGenerator._mermaid_cli_lock:
+            if FigureGenerator._mermaid_cli_available is None:
+                try:
+                    result = subprocess.run(
+                        ["mmdc", "--version"],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        check=True,
+                    )  # nosec B603 B607
+                    FigureGenerator._mermaid_cli_version = (
+                        (result.stdout or b"").decode(errors="replace").strip()
+                    )
+                    FigureGenerator._mermaid_cli_available = True
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    FigureGenerator._mermaid_cli_available = False
+        return FigureGenerator._mermaid_cli_available
 
-            return pd
-        except ImportError:
-            print("  ⚠️  pandas not available")
-            return None
+    def _mermaid_version(self):
+        """Return the Mermaid CLI version, or None if mmdc is unavailable."""
+        if self._check_mermaid_cli():
+            return FigureGenerator._mermaid_cli_version
+        return None
 
     def _check_rscript(self):
         """Check if Rscript is available."""
-        try:
-            subprocess.run(
-                ["Rscript", "--version"], capture_output=True, check=True
-            )  # nosec B603 B607
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        with FigureGenerator._rscript_lock:
+            if FigureGenerator._rscript_available is None:
+                try:
+                    subprocess.run(
+                        ["Rscript", "--version"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=True,
+                    )  # nosec B603 B607
+                    FigureGenerator._rscript_available = True
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    FigureGenerator._rscript_available = False
+        return FigureGenerator._rscript_available
 
 
 def main():
     """Main function with command-line interface."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate figures from .mmd and .py files in FIGURES directory"
     )
@@ -377,6 +857,34 @@ def main():
         choices=["png", "svg", "pdf", "eps"],
         help="Output format for figures (default: png)",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run Python figure scripts in this interpreter instead of "
+        "spawning one per script",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for cached figure renders, used through its "
+        f"{SHARED_CACHE_SUBDIR} subdirectory (default: $FIGURE_CACHE_DIR, "
+        "or OUTPUT_DIR/.figure_cache)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Maximum number of figures generated concurrently "
+        "(default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        "--force",
+        action="store_true",
+        help="Regenerate every figure instead of reusing cached renders and "
+        "outputs of unchanged scripts",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose output"
     )
@@ -388,14 +896,16 @@ def main():
             figures_dir=args.figures_dir,
             output_dir=args.output_dir,
             output_format=args.format,
+            in_process=args.in_process,
+            cache_dir=args.cache_dir,
+            jobs=args.jobs,
+            use_cache=not args.no_cache,
         )
         generator.generate_all_figures()
 
     except Exception as e:
         print(f"Error: {e}")
         if args.verbose:
-            import traceback
-
             traceback.print_exc()
         sys.exit(1)
 
@@ -16,6 +16,7 @@ from processors.template_processor import (
     generate_supplementary_tex,
     get_template_path,
     process_template_replacements,
+    read_template,
 )
 from processors.yaml_processor import extract_yaml_metadata
 
@@ -35,14 +36,20 @@ else:
     raise ImportError("Could not load utils.py module")
 
 
-def generate_preprint(output_dir, yaml_metadata):
-    """Generate the preprint using the template."""
-    template_path = get_template_path()
-    with open(template_path) as template_file:
-        template_content = template_file.read()
+def generate_preprint(output_dir, yaml_metadata, manuscript_md=None):
+    """Generate the preprint using the template.
+
+    Args:
+        output_dir: Directory where the generated files are written
+        yaml_metadata: Metadata extracted from the manuscript
+        manuscript_md: Path to the manuscript markdown; looked up with
+            find_manuscript_md() when not given
+    """
+    template_content = read_template(get_template_path())
 
     # Find and process the manuscript markdown
-    manuscript_md = find_manuscript_md()
+    if manuscript_md is None:
+        manuscript_md = find_manuscript_md()
 
     # Process all template replacements
     template_content = process_template_replacements(
@@ -90,7 +97,7 @@ def main():
         inject_rxiv_citation(yaml_metadata)
 
         # Generate the article
-        generate_preprint(args.output_dir, yaml_metadata)
+        generate_preprint(args.output_dir, yaml_metadata, manuscript_md)
 
         print("Preprint generation completed successfully!")
 
@@ -15,27 +15,30 @@ suggestions for fixes, and optional detailed statistics.
 """
 
 import argparse
+import dataclasses
+import hashlib
+import inspect
+import io
+import json
 import os
 import sys
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
-# Add src/py to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-try:
-    from validators import (
-        CitationValidator,
-        FigureValidator,
-        LaTeXErrorParser,
-        MathValidator,
-        ReferenceValidator,
-        SyntaxValidator,
-        ValidationLevel,
-    )
+if not __package__:
+    # Run as a file (python src/py/commands/validate.py) rather than with -m:
+    # resolve the relative imports below against the repository root
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+    __package__ = "src.py.commands"
+
+# Directory inside the manuscript holding cached validator results
+VALIDATION_CACHE_DIR = ".validation_cache"
 
-    VALIDATORS_AVAILABLE = True
-except ImportError:
-    VALIDATORS_AVAILABLE = False
+# Bump to invalidate every cached validation result
+VALIDATION_CACHE_SCHEMA = "1"
 
 
 class UnifiedValidator:
@@ -47,6 +50,8 @@ class UnifiedValidator:
         verbose: bool = False,
         include_info: bool = False,
         check_latex: bool = True,
+        use_cache: bool = True,
+        fail_fast: bool = False,
     ):
         """Initialize unified validator.
 
@@ -55,27 +60,43 @@ class UnifiedValidator:
             verbose: Show detailed output
             include_info: Include informational messages
             check_latex: Parse LaTeX compilation errors
+            use_cache: Reuse validation results while no manuscript file
+                changed
+            fail_fast: Stop after the first validator that reports errors
         """
         self.manuscript_path = manuscript_path
         self.verbose = verbose
         self.include_info = include_info
         self.check_latex = check_latex
+        self.use_cache = use_cache
+        self.fail_fast = fail_fast
+        self.cache_dir = os.path.join(manuscript_path, VALIDATION_CACHE_DIR)
 
         self.all_errors: list[Any] = []
         self.validation_results: dict[str, Any] = {}
 
     def validate_all(self) -> bool:
         """Run all available validators."""
-        if not VALIDATORS_AVAILABLE:
-            print("❌ Enhanced validators not available")
-            print("   Install validation dependencies to use this command")
-            return False
-
         # Check if manuscript directory exists
         if not os.path.exists(self.manuscript_path):
             print(f"❌ Manuscript directory not found: {self.manuscript_path}")
             return False
 
+        # Imported here so that --help and the checks above stay fast
+        try:
+            from ..validators import (
+                CitationValidator,
+                FigureValidator,
+                LaTeXErrorParser,
+                MathValidator,
+                ReferenceValidator,
+                SyntaxValidator,
+            )
+        except ImportError:
+            print("❌ Enhanced validators not available")
+            print("   Install validation dependencies to use this command")
+            return False
+
         print(f"🔍 Validating manuscript: {self.manuscript_path}")
         print()
 
@@ -90,15 +111,44 @@ class UnifiedValidator:
         if self.check_latex:
             validators.append(("LaTeX Errors", LaTeXErrorParser))
 
+        def run(validator_class: Any) -> Any:
+            # The LaTeX log lives outside the manuscript, so it is never cached
+            return self._run_validator(
+                validator_class,
+                self.use_cache and validator_class is not LaTeXErrorParser,
+            )
+
+        if self.fail_fast:
+            # Each validator only starts once the previous one has passed
+            return self._report_validators(
+                validators, [partial(run, cls) for _, cls in validators]
+            )
+
+        # The validators read their files independently, so they run
+        # concurrently; results are still reported in the order above
+        with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+            outcomes = [executor.submit(run, cls).result for _, cls in validators]
+            return self._report_validators(validators, outcomes)
+
+    def _report_validators(
+        self, validators: list[tuple[str, Any]], outcomes: list[Any]
+    ) -> bool:
+        """Collect and print the result of each validator in report order.
+
+        Each outcome is called to obtain the result of the matching validator.
+        With fail-fast, reporting stops at the first failing validator.
+        """
         all_passed = True
+        # Without fail-fast the validators were all started up front, so only
+        # their results are waited for here
+        action = "Running" if self.fail_fast else "Checking results of"
 
-        for validator_name, validator_class in validators:
+        for (validator_name, _), outcome in zip(validators, outcomes):
             if self.verbose:
-                print(f"🔄 Running {validator_name} validation...")
+                print(f"🔄 {action} {validator_name} validation...")
 
             try:
-                validator = validator_class(self.manuscript_path)
-                result = validator.validate()
+                result = outcome()
                 self.validation_results[validator_name] = result
 
                 # Process results
@@ -129,10 +179,110 @@ class UnifiedValidator:
                 print(f"   ❌ ERROR: {validator_name} validation failed: {e}")
                 all_passed = False
 
+            if self.fail_fast and not all_passed:
+                print(f"⏹️  Stopping after {validator_name} (--fail-fast)")
+                break
+
         return all_passed
 
+    def _run_validator(self, validator_class: Any, use_cache: bool = False) -> Any:
+        """Run a single validator on the manuscript.
+
+        With the cache, the result of the last successful run is reused if
+        neither the validator nor any of the files it depends on changed since.
+        """
+        validator = validator_class(self.manuscript_path)
+        if not use_cache:
+            return validator.validate()
+
+        cache_file = os.path.join(self.cache_dir, f"{validator_class.__name__}.json")
+        key = self._validation_cache_key(validator)
+        result = self._load_cached_result(cache_file, key)
+        if result is None:
+            result = validator.validate()
+            self._store_cached_result(cache_file, key, result)
+        return result
+
+    def _validation_cache_key(self, validator: Any) -> str:
+        """Return the cache key of a validator run on the current manuscript.
+
+        The key digests the (path, mtime, size) of the validator's source
+        files and of every file below the paths the validator depends on.
+        Missing dependencies are recorded too, so creating them invalidates it.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{VALIDATION_CACHE_SCHEMA}\0{self.manuscript_path}".encode())
+
+        from ..validators.base_validator import BaseValidator
+
+        sources = {
+            inspect.getfile(klass)
+            for klass in type(validator).__mro__
+            if issubclass(klass, BaseValidator)
+        }
+        pending = sorted(sources) + list(validator.get_dependencies())
+        while pending:
+            path = pending.pop()
+            try:
+                stat = os.stat(path)
+            except OSError:
+                digest.update(f"\0{path}\0missing".encode())
+                continue
+            if not os.path.isdir(path):
+                digest.update(f"\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}".encode())
+                continue
+            # Directories count through their entries; their own mtime would
+            # change whenever something, this cache included, is written there
+            digest.update(f"\0{path}\0dir".encode())
+            if os.path.islink(path):
+                continue
+            try:
+                entries = sorted(os.listdir(path))
+            except OSError:
+                continue
+            children = (os.path.join(path, name) for name in entries)
+            pending.extend(child for child in children if child != self.cache_dir)
+        return digest.hexdigest()
+
+    def _load_cached_result(self, cache_file: str, key: str) -> Any:
+        """Load a cached validation result, or None if it is stale or missing."""
+        from ..validators import ValidationError, ValidationLevel, ValidationResult
+
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["key"] != key:
+                return None
+            data = cached["result"]
+            errors = [
+                ValidationError(**{**error, "level": ValidationLevel(error["level"])})
+                for error in data["errors"]
+            ]
+            return ValidationResult(data["validator_name"], errors, data["metadata"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached_result(self, cache_file: str, key: str, result: Any) -> None:
+        """Cache a validation result if it survives a JSON round trip."""
+        data = dataclasses.asdict(result)
+        for error in data["errors"]:
+            error["level"] = error["level"].value
+        try:
+            payload = json.dumps({"key": key, "result": data})
+            if json.loads(payload)["result"]["metadata"] != result.metadata:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def _filter_errors(self, errors: list[Any]) -> list[Any]:
         """Filter errors based on settings."""
+        from ..validators import ValidationLevel
+
         if self.include_info:
             return errors
         else:
@@ -140,22 +290,28 @@ class UnifiedValidator:
 
     def print_detailed_report(self) -> None:
         """Print detailed validation report."""
-        print("\n" + "=" * 70)
-        print("DETAILED VALIDATION REPORT")
-        print("=" * 70)
+        buf = io.StringIO()
+        self._write_detailed_report(buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+    def _write_detailed_report(self, buf: io.StringIO) -> None:
+        """Write the detailed validation report to a buffer."""
+        from ..validators import ValidationLevel
+
+        print("\n" + "=" * 70, file=buf)
+        print("DETAILED VALIDATION REPORT", file=buf)
+        print("=" * 70, file=buf)
 
         if not self.all_errors:
-            print("✅ No issues found!")
-            self._print_summary_statistics()
+            print("✅ No issues found!", file=buf)
+            self._print_summary_statistics(buf)
             return
 
         # Group errors by severity
-        errors_by_level: dict[Any, list[Any]] = {}
+        errors_by_level: defaultdict[Any, list[Any]] = defaultdict(list)
         for error in self.all_errors:
-            level = error.level
-            if level not in errors_by_level:
-                errors_by_level[level] = []
-            errors_by_level[level].append(error)
+            errors_by_level[error.level].append(error)
 
         # Print errors by severity
         level_order = [
@@ -175,16 +331,16 @@ class UnifiedValidator:
 
             errors = errors_by_level[level]
             icon = level_icons[level]
-            print(f"\n{icon} {level.value.upper()} ({len(errors)}):")
+            print(f"\n{icon} {level.value.upper()} ({len(errors)}):", file=buf)
 
             for i, error in enumerate(errors, 1):
-                self._print_error_detail(error, i)
+                self._print_error_detail(buf, error, i)
 
-        self._print_summary_statistics()
+        self._print_summary_statistics(buf)
 
-    def _print_error_detail(self, error: Any, number: int) -> None:
+    def _print_error_detail(self, buf: io.StringIO, error: Any, number: int) -> None:
         """Print detailed information about an error."""
-        print(f"\n  {number}. {error.message}")
+        lines = [f"\n  {number}. {error.message}"]
 
         # Location information
         if error.file_path:
@@ -193,28 +349,30 @@ class UnifiedValidator:
                 location += f":{error.line_number}"
                 if error.column:
                     location += f":{error.column}"
-            print(f"     {location}")
+            lines.append(f"     {location}")
 
         # Context
         if error.context and self.verbose:
-            print(f"     📝 Context: {error.context}")
+            lines.append(f"     📝 Context: {error.context}")
 
         # Suggestion
         if error.suggestion:
-            print(f"     💡 Suggestion: {error.suggestion}")
+            lines.append(f"     💡 Suggestion: {error.suggestion}")
+
+        buf.write("\n".join(lines) + "\n")
 
-    def _print_summary_statistics(self) -> None:
+    def _print_summary_statistics(self, buf: io.StringIO) -> None:
         """Print summary statistics."""
         if not self.verbose:
             return
 
-        print("\n📊 SUMMARY STATISTICS:")
+        print("\n📊 SUMMARY STATISTICS:", file=buf)
 
         for validator_name, result in self.validation_results.items():
             if not result.metadata:
                 continue
 
-            print(f"\n  {validator_name}:")
+            lines = [f"\n  {validator_name}:"]
 
             # Key statistics for each validator
             metadata = result.metadata
@@ -251,33 +409,42 @@ class UnifiedValidator:
             else:
                 stats = []
 
-            for stat_name, key in stats:
-                if key in metadata:
-                    print(f"    • {stat_name}: {metadata[key]}")
+            lines.extend(
+                f"    • {stat_name}: {metadata[key]}"
+                for stat_name, key in stats
+                if key in metadata
+            )
+            buf.write("\n".join(lines) + "\n")
 
     def print_summary(self) -> None:
         """Print brief validation summary."""
+        buf = io.StringIO()
+        self._write_summary(buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+    def _write_summary(self, buf: io.StringIO) -> None:
+        """Write the brief validation summary to a buffer."""
+        from ..validators import ValidationLevel
+
         if not self.all_errors:
-            print("✅ Validation completed successfully - no issues found!")
+            print("✅ Validation completed successfully - no issues found!", file=buf)
             return
 
-        error_count = sum(
-            1 for e in self.all_errors if e.level == ValidationLevel.ERROR
-        )
-        warning_count = sum(
-            1 for e in self.all_errors if e.level == ValidationLevel.WARNING
-        )
-        info_count = sum(1 for e in self.all_errors if e.level == ValidationLevel.INFO)
+        level_counts = Counter(e.level for e in self.all_errors)
+        error_count = level_counts[ValidationLevel.ERROR]
+        warning_count = level_counts[ValidationLevel.WARNING]
+        info_count = level_counts[ValidationLevel.INFO]
 
         if error_count > 0:
-            print(f"❌ Validation failed with {error_count} error(s)")
+            print(f"❌ Validation failed with {error_count} error(s)", file=buf)
         else:
-            print("⚠️  Validation passed with warnings")
+            print("⚠️  Validation passed with warnings", file=buf)
 
         if warning_count > 0:
-            print(f"   {warning_count} warning(s) found")
+            print(f"   {warning_count} warning(s) found", file=buf)
         if info_count > 0 and self.include_info:
-            print(f"   {info_count} info message(s)")
+            print(f"   {info_count} info message(s)", file=buf)
 
 
 def main():
@@ -292,6 +459,7 @@ Examples:
   %(prog)s MANUSCRIPT --include-info     # Include informational messages
   %(prog)s MANUSCRIPT --no-latex         # Skip LaTeX error parsing
   %(prog)s MANUSCRIPT --detailed         # Full detailed report
+  %(prog)s MANUSCRIPT --fail-fast        # Stop at the first failing validator
         """,
     )
 
@@ -314,12 +482,24 @@ Examples:
         "--no-latex", action="store_true", help="Skip LaTeX compilation error parsing"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every validator instead of reusing cached results",
+    )
+
     parser.add_argument(
         "--detailed",
         action="store_true",
         help="Show detailed error report with context and suggestions",
     )
 
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first validator that reports errors",
+    )
+
     args = parser.parse_args()
 
     # Create and run validator
@@ -328,6 +508,8 @@ Examples:
         verbose=args.verbose,
         include_info=args.include_info,
         check_latex=not args.no_latex,
+        use_cache=not args.no_cache,
+        fail_fast=args.fail_fast,
     )
 
     validation_passed = validator.validate_all()
@@ -9,6 +9,12 @@ import re
 
 from .types import CitationKey, LatexContent, MarkdownContent, ProtectedContent
 
+# Bracketed citations like [@citation1;@citation2]
+_BRACKETED_CITATION_PATTERN = re.compile(r"\[(@[^]]+)\]")
+# Single citations like @citation_key, excluding @fig: and @eq: references
+_SINGLE_CITATION_PATTERN = re.compile(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)")
+_CITATION_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 def convert_citations_to_latex(text: MarkdownContent) -> LatexContent:
     """Convert markdown citations to LaTeX format.
@@ -32,12 +38,12 @@ def convert_citations_to_latex(text: MarkdownContent) -> LatexContent:
                 citations.append(clean_cite)
         return "\\cite{" + ",".join(citations) + "}"
 
-    text = re.sub(r"\[(@[^]]+)\]", process_multiple_citations, text)
+    text = _BRACKETED_CITATION_PATTERN.sub(process_multiple_citations, text)
 
     # Handle single citations like @citation_key (but not figure/equation references)
     # Allow alphanumeric, underscore, and hyphen in citation keys
     # Exclude figure and equation references by not matching @fig: or @eq: patterns
-    text = re.sub(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", r"\\cite{\1}", text)
+    text = _SINGLE_CITATION_PATTERN.sub(r"\\cite{\1}", text)
 
     return text
 
@@ -113,12 +119,12 @@ def process_citations_in_text(text: MarkdownContent) -> LatexContent:
                 citations.append(clean_cite)
         return "\\cite{" + ",".join(citations) + "}"
 
-    text = re.sub(r"\[(@[^]]+)\]", process_multiple_citations, text)
+    text = _BRACKETED_CITATION_PATTERN.sub(process_multiple_citations, text)
 
     # Handle single citations like @citation_key (but not figure/equation references)
     # Allow alphanumeric, underscore, and hyphen in citation keys
     # Exclude figure and equation references by not matching @fig: or @eq: patterns
-    text = re.sub(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", r"\\cite{\1}", text)
+    text = _SINGLE_CITATION_PATTERN.sub(r"\\cite{\1}", text)
     return text
 
 
@@ -133,7 +139,7 @@ def validate_citation_key(citation_key: CitationKey) -> bool:
     """
     # Citation keys should contain only alphanumeric characters,
     # underscores, and hyphens
-    return bool(re.match(r"^[a-zA-Z0-9_-]+$", citation_key))
+    return bool(_CITATION_KEY_PATTERN.match(citation_key))
 
 
 def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
@@ -148,7 +154,7 @@ def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
     citations: list[CitationKey] = []
 
     # Find bracketed multiple citations
-    bracketed_matches = re.findall(r"\[(@[^]]+)\]", text)
+    bracketed_matches = _BRACKETED_CITATION_PATTERN.findall(text)
     for match in bracketed_matches:
         for cite in match.split(";"):
             clean_cite = cite.strip().lstrip("@")
@@ -156,7 +162,7 @@ def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
                 citations.append(clean_cite)
 
     # Find single citations (excluding figure and equation references)
-    single_matches = re.findall(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", text)
+    single_matches = _SINGLE_CITATION_PATTERN.findall(text)
     for cite in single_matches:
         if cite not in citations:
             citations.append(cite)
@@ -8,6 +8,24 @@ import re
 
 from .types import LatexContent, MarkdownContent
 
+# Fenced code blocks with an optional language: ```python ... ```
+_FENCED_CODE_BLOCK_PATTERN = re.compile(
+    r"^```(\w+)?\n(.*?)\n```$", re.MULTILINE | re.DOTALL
+)
+
+# Environments kept away from further markdown processing
+_VERBATIM_ENVIRONMENT_PATTERN = re.compile(
+    r"\\begin\{verbatim\}.*?\\end\{verbatim\}", re.DOTALL
+)
+_LISTINGS_ENVIRONMENT_PATTERN = re.compile(
+    r"\\begin\{lstlisting\}\[.*?\].*?\\end\{lstlisting\}", re.DOTALL
+)
+
+# Placeholders left by protect_code_content
+_PROTECTED_VERBATIM_PATTERN = re.compile(
+    r"XXPROTECTEDVERBATIMXX\d+XXPROTECTEDVERBATIMXX"
+)
+
 
 def convert_code_blocks_to_latex(text: MarkdownContent) -> LatexContent:
     """Convert markdown code blocks to LaTeX listings environments.
@@ -32,11 +50,10 @@ def _process_fenced_code_blocks(text: MarkdownContent) -> LatexContent:
 
     def process_fenced_code_block(match: re.Match[str]) -> str:
         # Check if language is specified
-        language_match = re.search(r"^```(\w+)", match.group(0))
-        language = ""
+        language = match.group(1) or ""
 
-        if language_match:
-            language = language_match.group(1).lower()
+        if language:
+            language = language.lower()
             # Map common language names to listings-compatible ones
             language_map = {
                 "yml": "yaml",
@@ -52,15 +69,7 @@ def _process_fenced_code_blocks(text: MarkdownContent) -> LatexContent:
             language = language_map.get(language, language)
 
         # Extract content between the triple backticks
-        full_match = match.group(0)
-        if language_match:
-            # Remove the language specification line
-            content_start = full_match.find("\n") + 1
-            content_end = full_match.rfind("\n```")
-            code_content = full_match[content_start:content_end]
-        else:
-            # No language specified
-            code_content = match.group(1)
+        code_content = match.group(2)
 
         # Use listings if language is specified and supported, otherwise use verbatim
         if language and language in _get_supported_languages():
@@ -80,12 +89,7 @@ def _process_fenced_code_blocks(text: MarkdownContent) -> LatexContent:
             )
 
     # Convert fenced code blocks first to protect them from further processing
-    return re.sub(
-        r"^```(?:\w+)?\n(.*?)\n```$",
-        process_fenced_code_block,
-        text,
-        flags=re.MULTILINE | re.DOTALL,
-    )
+    return _FENCED_CODE_BLOCK_PATTERN.sub(process_fenced_code_block, text)
 
 
 def _process_indented_code_blocks(text: MarkdownContent) -> LatexContent:
@@ -99,7 +103,7 @@ def _process_indented_code_blocks(text: MarkdownContent) -> LatexContent:
         line = lines[i]
 
         # Track code environment state (verbatim or listings)
-        if "\\begin{verbatim}" in line or re.search(r"\\begin\{lstlisting\}", line):
+        if "\\begin{verbatim}" in line or "\\begin{lstlisting}" in line:
             in_code_env = True
             result_lines.append(line)
             i += 1
@@ -117,14 +121,14 @@ def _process_indented_code_blocks(text: MarkdownContent) -> LatexContent:
 
         # Check if line is indented with 4+ spaces (code block) and not in code
         # environment
-        if re.match(r"^    ", line) and line.strip() and not in_code_env:
+        if line.startswith("    ") and line.strip() and not in_code_env:
             # Start of indented code block
             code_lines: list[str] = []
 
             # Collect all consecutive indented lines
             while i < len(lines):
                 current_line = lines[i]
-                if re.match(r"^    ", current_line) or current_line.strip() == "":
+                if current_line.startswith("    ") or current_line.strip() == "":
                     # Remove 4 spaces of indentation
                     if current_line.startswith("    "):
                         code_lines.append(current_line[4:])
@@ -189,20 +193,10 @@ def protect_code_content(text: MarkdownContent) -> tuple[LatexContent, dict[str,
         return placeholder
 
     # Protect all verbatim environments from further markdown processing
-    text = re.sub(
-        r"\\begin\{verbatim\}.*?\\end\{verbatim\}",
-        protect_verbatim_content,
-        text,
-        flags=re.DOTALL,
-    )
+    text = _VERBATIM_ENVIRONMENT_PATTERN.sub(protect_verbatim_content, text)
 
     # Protect all listings environments from further markdown processing
-    text = re.sub(
-        r"\\begin\{lstlisting\}\[.*?\].*?\\end\{lstlisting\}",
-        protect_verbatim_content,
-        text,
-        flags=re.DOTALL,
-    )
+    text = _LISTINGS_ENVIRONMENT_PATTERN.sub(protect_verbatim_content, text)
 
     return text, protected_content
 
@@ -219,9 +213,13 @@ def restore_protected_code(
     Returns:
         Text with code content restored
     """
-    for placeholder, original_content in protected_content.items():
-        text = text.replace(placeholder, original_content)
-    return text
+    if not protected_content:
+        return text
+
+    # Restore every placeholder in a single scan instead of one per block
+    return _PROTECTED_VERBATIM_PATTERN.sub(
+        lambda match: protected_content.get(match.group(0), match.group(0)), text
+    )
 
 
 def validate_code_block_syntax(code_block: str, language: str = "") -> bool:
@@ -260,8 +258,7 @@ def extract_code_blocks_from_text(text: MarkdownContent) -> list[tuple[str, str]
     code_blocks: list[tuple[str, str]] = []
 
     # Find fenced code blocks
-    fenced_pattern = r"^```(\w+)?\n(.*?)\n```$"
-    for match in re.finditer(fenced_pattern, text, re.MULTILINE | re.DOTALL):
+    for match in _FENCED_CODE_BLOCK_PATTERN.finditer(text):
         language = match.group(1) or ""
         content = match.group(2)
         code_blocks.append((language, content))
@@ -270,11 +267,11 @@ def extract_code_blocks_from_text(text: MarkdownContent) -> list[tuple[str, str]
     lines = text.split("\n")
     i = 0
     while i < len(lines):
-        if re.match(r"^    ", lines[i]) and lines[i].strip():
+        if lines[i].startswith("    ") and lines[i].strip():
             # Start of indented code block
             code_lines: list[str] = []
             while i < len(lines) and (
-                re.match(r"^    ", lines[i]) or not lines[i].strip()
+                lines[i].startswith("    ") or not lines[i].strip()
             ):
                 if lines[i].startswith("    "):
                     code_lines.append(lines[i][4:])
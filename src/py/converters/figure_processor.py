@@ -4,7 +4,9 @@ This module handles conversion of markdown figures to LaTeX figure environments,
 including figure attributes, captions, and references.
 """
 
+import os
 import re
+from functools import lru_cache
 from typing import Optional
 
 from .types import (
@@ -18,6 +20,42 @@ from .types import (
     MarkdownContent,
 )
 
+# Code that must not be touched by figure processing
+_INLINE_CODE_PATTERN = re.compile(r"`[^`]+`")
+_FENCED_CODE_PATTERN = re.compile(r"```.*?```", re.DOTALL)
+_PROTECTED_CODE_PATTERN = re.compile(r"XXFIGURECODEXX(\d+)XXFIGURECODEXX")
+
+# All figure formats in one pass, in order of precedence:
+# ![](path)\n{attributes} Caption, then ![caption](path){attributes}, then
+# ![caption](path)
+_FIGURE_PATTERN = re.compile(
+    r"!\[\]\((?P<new_path>[^)]+)\)\s*\n\{(?P<new_attributes>[^}]+)\}\s*"
+    r"(?P<new_caption>.+?)(?=\n\n|\n$|$)"
+    r"|!\[(?P<caption>[^\]]*)\]\((?P<path>[^)]+)\)(?:\{(?P<attributes>[^}]+)\})?",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Figure attributes such as {#fig:1 tex_position="!ht" width="0.8"}
+_ATTRIBUTE_TOKEN_PATTERN = re.compile(
+    r"#(?P<id>[a-zA-Z0-9_:-]+)"
+    r"|(?P<key>\w+)=(?P<quote>[\"'])(?P<value>[^\"']*)(?P=quote)"
+)
+_ATTRIBUTE_BLOCK_ID_PATTERN = re.compile(r"\{#([a-zA-Z0-9_:-]+)[^}]*\}")
+
+# Markdown emphasis in captions. Bold is matched first and may be nested in
+# italics; an italic span never closes on the opening of a bold span, as
+# converting all bold before any italics would have it
+_BOLD_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+_EMPHASIS_PATTERN = re.compile(
+    r"\*\*(?P<bold>[^*]+)\*\*"
+    r"|\*(?P<italic>(?:[^*]|\*\*[^*]+\*\*)+)\*(?!\*[^*]+\*\*)"
+)
+
+# Cross-references
+_FIGURE_REF_PATTERN = re.compile(r"@fig:([a-zA-Z0-9_-]+)")
+_SUPPLEMENTARY_FIGURE_REF_PATTERN = re.compile(r"@sfig:([a-zA-Z0-9_-]+)")
+_EQUATION_REF_PATTERN = re.compile(r"@eq:([a-zA-Z0-9_-]+)")
+
 
 def convert_figures_to_latex(
     text: MarkdownContent, is_supplementary: bool = False
@@ -31,34 +69,34 @@ def convert_figures_to_latex(
     Returns:
         Text with figures converted to LaTeX format
     """
+    # Every figure format starts with "![", so most text needs no regex passes
+    if "![" not in text:
+        return text
+
     # First protect code blocks from figure processing
     protected_blocks: list[str] = []
 
-    def protect_code_blocks(match: re.Match[str]) -> str:
-        return f"__CODE_BLOCK_{len(protected_blocks)}__"
-
-    # Protect inline code (backticks)
-    def protect_inline_code(match: re.Match[str]) -> str:
-        protected_blocks.append(match.group(0))
-        return f"__CODE_BLOCK_{len(protected_blocks) - 1}__"
-
-    text = re.sub(r"`[^`]+`", protect_inline_code, text)
+    def restore_code(match: re.Match[str]) -> str:
+        return protected_blocks[int(match.group(1))]
 
-    # Protect fenced code blocks
-    def protect_fenced_code(match: re.Match[str]) -> str:
-        protected_blocks.append(match.group(0))
-        return f"__CODE_BLOCK_{len(protected_blocks) - 1}__"
+    def protect_code(match: re.Match[str]) -> str:
+        # A fenced block may enclose placeholders of inline code protected
+        # before it; store it with the original code put back
+        protected_blocks.append(_PROTECTED_CODE_PATTERN.sub(restore_code, match[0]))
+        return f"XXFIGURECODEXX{len(protected_blocks) - 1}XXFIGURECODEXX"
 
-    text = re.sub(r"```.*?```", protect_fenced_code, text, flags=re.DOTALL)
+    # Protect inline code (backticks), then fenced code blocks
+    text = _INLINE_CODE_PATTERN.sub(protect_code, text)
+    text = _FENCED_CODE_PATTERN.sub(protect_code, text)
 
-    # Process different figure formats
-    text = _process_new_figure_format(text)
-    text = _process_figure_with_attributes(text)
-    text = _process_figure_without_attributes(text)
+    # Process all figure formats in a single pass
+    text = _FIGURE_PATTERN.sub(_convert_figure, text)
 
-    # Restore protected code blocks
-    for i, block in enumerate(protected_blocks):
-        text = text.replace(f"__CODE_BLOCK_{i}__", block)
+    # Restore all protected code blocks in a single pass. Placeholders stay
+    # in place (rather than splitting the text around code) so that captions
+    # may contain inline code.
+    if protected_blocks:
+        text = _PROTECTED_CODE_PATTERN.sub(restore_code, text)
 
     return text
 
@@ -75,10 +113,12 @@ def convert_figure_references_to_latex(text: MarkdownContent) -> LatexContent:
         Text with figure references converted to LaTeX format with "Figure" prefix
     """
     # Convert @fig:id to Figure \ref{fig:id}
-    text = re.sub(r"@fig:([a-zA-Z0-9_-]+)", r"Fig. \\ref{fig:\1}", text)
+    if "@fig:" in text:
+        text = _FIGURE_REF_PATTERN.sub(r"Fig. \\ref{fig:\1}", text)
 
     # Convert @sfig:id to Figure \ref{sfig:id} (supplementary figures)
-    text = re.sub(r"@sfig:([a-zA-Z0-9_-]+)", r"Fig. \\ref{sfig:\1}", text)
+    if "@sfig:" in text:
+        text = _SUPPLEMENTARY_FIGURE_REF_PATTERN.sub(r"Fig. \\ref{sfig:\1}", text)
 
     return text
 
@@ -95,7 +135,8 @@ def convert_equation_references_to_latex(text: MarkdownContent) -> LatexContent:
         Text with equation references converted to LaTeX format
     """
     # Convert @eq:id to \eqref{eq:id} for numbered equations
-    text = re.sub(r"@eq:([a-zA-Z0-9_-]+)", r"\\eqref{eq:\1}", text)
+    if "@eq:" in text:
+        text = _EQUATION_REF_PATTERN.sub(r"\\eqref{eq:\1}", text)
 
     return text
 
@@ -111,40 +152,35 @@ def parse_figure_attributes(attr_string: str) -> FigureAttributes:
     """
     attributes: FigureAttributes = {}
 
-    # Extract ID (starts with #)
-    id_match = re.search(r"#([a-zA-Z0-9_:-]+)", attr_string)
-    if id_match:
-        attributes["id"] = id_match.group(1)
-
-    # Extract other attributes (key="value" or key=value)
-    attr_matches = re.findall(r'(\w+)=(["\'])([^"\']*)\2', attr_string)
-    for match in attr_matches:
-        key, _, value = match
-        attributes[key] = value
+    # Tokenize the ID (starts with #) and key="value" pairs in one scan
+    for match in _ATTRIBUTE_TOKEN_PATTERN.finditer(attr_string):
+        figure_id = match.group("id")
+        if figure_id is not None:
+            attributes.setdefault("id", figure_id)
+        else:
+            attributes[match.group("key")] = match.group("value")
 
     return attributes
 
 
-def create_latex_figure_environment(
-    path: FigurePath,
-    caption: FigureCaption,
-    attributes: Optional[FigureAttributes] = None,
-    is_supplementary: bool = False,
-) -> LatexContent:
-    """Create a complete LaTeX figure environment.
+def _convert_emphasis(match: re.Match) -> str:
+    """Convert a bold or italic caption span to LaTeX."""
+    if match.group("bold") is not None:
+        return f"\\textbf{{{match.group('bold')}}}"
+    italic = _BOLD_PATTERN.sub(r"\\textbf{\1}", match.group("italic"))
+    return f"\\textit{{{italic}}}"
+
+
+@lru_cache(maxsize=512)
+def _figure_latex_path(path: FigurePath) -> str:
+    """Return the path LaTeX uses to include a markdown figure.
 
     Args:
-        path: Path to the figure file
-        caption: Figure caption text
-        attributes: Optional figure attributes (position, width, id)
-        is_supplementary: Whether this is a supplementary figure
+        path: Figure path as written in the markdown
 
     Returns:
-        Complete LaTeX figure environment
+        Path of the figure in the LaTeX output directory
     """
-    if attributes is None:
-        attributes = {}
-
     # Convert path from FIGURES/ to Figures/ for LaTeX and handle new
     # subdirectory structure
     latex_path = path.replace("FIGURES/", "Figures/")
@@ -154,8 +190,6 @@ def create_latex_figure_environment(
         "/" not in latex_path.split("Figures/")[-1]
     ):  # Only if not already in subdirectory
         # Extract figure name from path like "Figures/Figure_1.svg"
-        import os
-
         figure_name = os.path.splitext(os.path.basename(latex_path))[0]
         figure_ext = os.path.splitext(latex_path)[1]
 
@@ -166,6 +200,31 @@ def create_latex_figure_environment(
     if latex_path.endswith(".svg"):
         latex_path = latex_path.replace(".svg", ".png")
 
+    return latex_path
+
+
+def create_latex_figure_environment(
+    path: FigurePath,
+    caption: FigureCaption,
+    attributes: Optional[FigureAttributes] = None,
+    is_supplementary: bool = False,
+) -> LatexContent:
+    """Create a complete LaTeX figure environment.
+
+    Args:
+        path: Path to the figure file
+        caption: Figure caption text
+        attributes: Optional figure attributes (position, width, id)
+        is_supplementary: Whether this is a supplementary figure
+
+    Returns:
+        Complete LaTeX figure environment
+    """
+    if attributes is None:
+        attributes = {}
+
+    latex_path = _figure_latex_path(path)
+
     # Get positioning (default to 'ht' if not specified)
     position: FigurePosition = attributes.get("tex_position", "ht")
 
@@ -191,76 +250,44 @@ def create_latex_figure_environment(
     )
 
     # Process caption text to remove markdown formatting
-    processed_caption = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", caption)
-    processed_caption = re.sub(r"\*([^*]+)\*", r"\\textit{\1}", processed_caption)
+    processed_caption = _EMPHASIS_PATTERN.sub(_convert_emphasis, caption)
 
     # Create LaTeX figure environment - use figure* for 2-column spanning
     figure_env = "figure*" if is_twocolumn else "figure"
-    latex_figure = f"""\\begin{{{figure_env}}}[{position}]
-\\centering
-\\includegraphics[width={width}]{{{latex_path}}}
-\\caption{{{processed_caption}}}"""
+    lines = [
+        f"\\begin{{{figure_env}}}[{position}]",
+        "\\centering",
+        f"\\includegraphics[width={width}]{{{latex_path}}}",
+        f"\\caption{{{processed_caption}}}",
+    ]
 
     # Add label if ID is present
     if "id" in attributes:
-        latex_figure += f"\n\\label{{{attributes['id']}}}"
-
-    latex_figure += f"\n\\end{{{figure_env}}}"
-
-    return latex_figure
-
-
-def _process_new_figure_format(text: MarkdownContent) -> LatexContent:
-    r"""Process new figure format: ![](path)\n{attributes} **Caption text**."""
-
-    def process_new_figure_format_full(match: re.Match[str]) -> str:
-        path = match.group(1)
-        attr_string = match.group(2)
-        caption_text = match.group(3).strip()
-
-        # Parse attributes
-        attributes = parse_figure_attributes(attr_string)
-        return create_latex_figure_environment(path, caption_text, attributes)
-
-    # Handle new format: ![](path)\n{attributes} **Caption text**
-    return re.sub(
-        r"!\[\]\(([^)]+)\)\s*\n\{([^}]+)\}\s*(.+?)(?=\n\n|\n$|$)",
-        process_new_figure_format_full,
-        text,
-        flags=re.MULTILINE | re.DOTALL,
-    )
+        lines.append(f"\\label{{{attributes['id']}}}")
 
+    lines.append(f"\\end{{{figure_env}}}")
 
-def _process_figure_with_attributes(text: MarkdownContent) -> LatexContent:
-    """Process figures with attributes: ![caption](path){attributes}."""
+    return "\n".join(lines)
 
-    def process_figure_with_attributes(match: re.Match[str]) -> str:
-        caption = match.group(1)
-        path = match.group(2)
-        attr_string = match.group(3)
 
-        # Parse attributes
-        attributes = parse_figure_attributes(attr_string)
-        return create_latex_figure_environment(path, caption, attributes)
+def _convert_figure(match: re.Match[str]) -> LatexContent:
+    """Convert a figure matched by ``_FIGURE_PATTERN`` to LaTeX."""
+    # New format: ![](path)\n{attributes} **Caption text**
+    if match.group("new_path") is not None:
+        attributes = parse_figure_attributes(match.group("new_attributes"))
+        return create_latex_figure_environment(
+            match.group("new_path"), match.group("new_caption").strip(), attributes
+        )
 
-    # Handle figures with attributes (old format)
-    return re.sub(
-        r"!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}", process_figure_with_attributes, text
+    # Old format, with or without attributes: ![caption](path){attributes}
+    attr_string = match.group("attributes")
+    return create_latex_figure_environment(
+        match.group("path"),
+        match.group("caption"),
+        parse_figure_attributes(attr_string) if attr_string is not None else None,
     )
 
 
-def _process_figure_without_attributes(text: MarkdownContent) -> LatexContent:
-    """Process figures without attributes: ![caption](path)."""
-
-    def process_figure_without_attributes(match: re.Match[str]) -> str:
-        caption = match.group(1)
-        path = match.group(2)
-        return create_latex_figure_environment(path, caption)
-
-    # Handle figures without attributes (remaining ones)
-    return re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", process_figure_without_attributes, text)
-
-
 def validate_figure_path(path: FigurePath) -> bool:
     """Validate that a figure path is properly formatted.
 
@@ -284,14 +311,17 @@ def extract_figure_ids_from_text(text: MarkdownContent) -> list[FigureId]:
     Returns:
         List of unique figure IDs found in the text
     """
-    figure_ids: list[FigureId] = []
-
-    # Find figure attribute blocks
-    attr_matches = re.findall(r"\{#([a-zA-Z0-9_:-]+)[^}]*\}", text)
-    for match in attr_matches:
-        if (
-            match.startswith("fig:") or match.startswith("sfig:")
-        ) and match not in figure_ids:
-            figure_ids.append(match)
+    if "{#" not in text:
+        return []
 
-    return figure_ids
+    # Stream figure attribute blocks, keeping the first occurrence of each ID
+    figure_ids = (
+        match.group(1) for match in _ATTRIBUTE_BLOCK_ID_PATTERN.finditer(text)
+    )
+    return list(
+        dict.fromkeys(
+            figure_id
+            for figure_id in figure_ids
+            if figure_id.startswith(("fig:", "sfig:"))
+        )
+    )
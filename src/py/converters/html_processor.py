@@ -8,6 +8,30 @@ import re
 
 from .types import LatexContent, MarkdownContent
 
+_HTML_COMMENT_PATTERN = re.compile(r"<!--(.*?)-->", re.DOTALL)
+
+# Supported HTML tags and their LaTeX replacements, applied in order
+_HTML_TAG_REPLACEMENTS = tuple(
+    (re.compile(pattern, flags), replacement)
+    for pattern, replacement, flags in [
+        (r"<br\s*/?>", r"\\\\", re.IGNORECASE),
+        (r"<b>(.*?)</b>", r"\\textbf{\1}", re.IGNORECASE | re.DOTALL),
+        (r"<strong>(.*?)</strong>", r"\\textbf{\1}", re.IGNORECASE | re.DOTALL),
+        (r"<i>(.*?)</i>", r"\\textit{\1}", re.IGNORECASE | re.DOTALL),
+        (r"<em>(.*?)</em>", r"\\textit{\1}", re.IGNORECASE | re.DOTALL),
+        (r"<code>(.*?)</code>", r"\\texttt{\1}", re.IGNORECASE | re.DOTALL),
+    ]
+)
+
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_HTML_TAG_NAME_PATTERN = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*(/?)>")
+
+# Unsupported elements removed together with their content
+_REMOVED_ELEMENT_PATTERNS = tuple(
+    re.compile(rf"<{tag}[^>]*>.*?</{tag}>", re.IGNORECASE | re.DOTALL)
+    for tag in ["script", "style", "head", "meta", "link"]
+)
+
 
 def convert_html_comments_to_latex(text: MarkdownContent) -> LatexContent:
     """Convert HTML comments to LaTeX comments.
@@ -32,7 +56,7 @@ def convert_html_comments_to_latex(text: MarkdownContent) -> LatexContent:
                 latex_comment_lines.append("%")
         return "\n".join(latex_comment_lines)
 
-    return re.sub(r"<!--(.*?)-->", replace_comment, text, flags=re.DOTALL)
+    return _HTML_COMMENT_PATTERN.sub(replace_comment, text)
 
 
 def convert_html_tags_to_latex(text: MarkdownContent) -> LatexContent:
@@ -44,32 +68,9 @@ def convert_html_tags_to_latex(text: MarkdownContent) -> LatexContent:
     Returns:
         Text with HTML tags converted to LaTeX
     """
-    # Convert line breaks
-    text = re.sub(r"<br\s*/?>", r"\\\\", text, flags=re.IGNORECASE)
-
-    # Convert bold tags
-    text = re.sub(
-        r"<b>(.*?)</b>", r"\\textbf{\1}", text, flags=re.IGNORECASE | re.DOTALL
-    )
-    text = re.sub(
-        r"<strong>(.*?)</strong>",
-        r"\\textbf{\1}",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-
-    # Convert italic tags
-    text = re.sub(
-        r"<i>(.*?)</i>", r"\\textit{\1}", text, flags=re.IGNORECASE | re.DOTALL
-    )
-    text = re.sub(
-        r"<em>(.*?)</em>", r"\\textit{\1}", text, flags=re.IGNORECASE | re.DOTALL
-    )
-
-    # Convert code tags
-    text = re.sub(
-        r"<code>(.*?)</code>", r"\\texttt{\1}", text, flags=re.IGNORECASE | re.DOTALL
-    )
+    # Convert line breaks, then bold, italic and code tags
+    for pattern, replacement in _HTML_TAG_REPLACEMENTS:
+        text = pattern.sub(replacement, text)
 
     return text
 
@@ -115,7 +116,7 @@ def strip_html_tags(text: MarkdownContent) -> MarkdownContent:
         Text with HTML tags removed
     """
     # Remove all HTML tags but keep their content
-    return re.sub(r"<[^>]+>", "", text)
+    return _HTML_TAG_PATTERN.sub("", text)
 
 
 def validate_html_structure(text: MarkdownContent) -> bool:
@@ -131,9 +132,8 @@ def validate_html_structure(text: MarkdownContent) -> bool:
     stack: list[str] = []
 
     # Find all HTML tags
-    tags = re.findall(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>", text)
-
-    for is_closing, tag_name in tags:
+    for match in _HTML_TAG_NAME_PATTERN.finditer(text):
+        is_closing, tag_name = match.group(1, 2)
         tag_name = tag_name.lower()
 
         # Self-closing tags don't need to be tracked
@@ -165,9 +165,7 @@ def extract_html_tags_from_text(text: MarkdownContent) -> list[tuple[str, str, b
     tags: list[tuple[str, str, bool]] = []
 
     # Find all HTML tags
-    tag_pattern = r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*(/?)>"
-
-    for match in re.finditer(tag_pattern, text):
+    for match in _HTML_TAG_NAME_PATTERN.finditer(text):
         bool(match.group(1))
         tag_name = match.group(2).lower()
         is_self_closing = bool(match.group(3)) or tag_name in [
@@ -204,11 +202,8 @@ def clean_html_for_latex(text: MarkdownContent) -> LatexContent:
 
     # Remove any remaining unsupported HTML tags
     # List of tags to completely remove (including content)
-    remove_tags = ["script", "style", "head", "meta", "link"]
-    for tag in remove_tags:
-        text = re.sub(
-            rf"<{tag}[^>]*>.*?</{tag}>", "", text, flags=re.IGNORECASE | re.DOTALL
-        )
+    for pattern in _REMOVED_ELEMENT_PATTERNS:
+        text = pattern.sub("", text)
 
     # Remove remaining HTML tags but keep content
     text = strip_html_tags(text)
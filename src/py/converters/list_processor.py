@@ -5,9 +5,28 @@ to LaTeX list environments (itemize and enumerate).
 """
 
 import re
+from functools import lru_cache
 
 from .types import LatexContent, MarkdownContent
 
+# List item markers; the text patterns also capture the item content
+_UNORDERED_MARKER = r"[-*]"
+_ORDERED_MARKER = r"\d+[.)]"
+_UNORDERED_ITEM_PATTERN = re.compile(rf"^\s*{_UNORDERED_MARKER}\s+")
+_ORDERED_ITEM_PATTERN = re.compile(rf"^\s*{_ORDERED_MARKER}\s+")
+_UNORDERED_ITEM_TEXT_PATTERN = re.compile(rf"^\s*{_UNORDERED_MARKER}\s+(.+)$")
+_ORDERED_ITEM_TEXT_PATTERN = re.compile(rf"^\s*{_ORDERED_MARKER}\s+(.+)$")
+
+# Markers rewritten by normalize_list_markers
+_STAR_MARKER_PATTERN = re.compile(r"^(\s*)\*(\s+)")
+_PAREN_NUMBER_MARKER_PATTERN = re.compile(r"^(\s*\d+)\)(\s+)")
+
+
+@lru_cache(maxsize=128)
+def _list_item_pattern(marker: str, max_indent: int) -> re.Pattern[str]:
+    """Compile the pattern for list items indented by at most max_indent."""
+    return re.compile(rf"^\s{{0,{max_indent}}}{marker}\s+")
+
 
 def convert_lists_to_latex(text: MarkdownContent) -> LatexContent:
     """Convert markdown lists to LaTeX list environments.
@@ -26,10 +45,10 @@ def convert_lists_to_latex(text: MarkdownContent) -> LatexContent:
         line = lines[i]
 
         # Check for unordered list (- or * at start of line)
-        if re.match(r"^\s*[-*]\s+", line):
+        if _UNORDERED_ITEM_PATTERN.match(line):
             i = _process_unordered_list(lines, i, result_lines)
         # Check for ordered list (number followed by . or ))
-        elif re.match(r"^\s*\d+[.)]\s+", line):
+        elif _ORDERED_ITEM_PATTERN.match(line):
             i = _process_ordered_list(lines, i, result_lines)
         else:
             # Regular line, not a list
@@ -54,22 +73,21 @@ def _process_unordered_list(
     """
     list_lines: list[str] = []
     indent_level = len(lines[start_index]) - len(lines[start_index].lstrip())
+    item_pattern = _list_item_pattern(_UNORDERED_MARKER, indent_level + 2)
     i = start_index
 
     # Collect all consecutive list items at the same indent level
     while i < len(lines):
         current_line = lines[i]
-        if re.match(rf"^\s{{0,{indent_level + 2}}}[-*]\s+", current_line):
+        if item_pattern.match(current_line):
             # Extract the list item content (remove the bullet)
-            item_content = re.sub(r"^\s*[-*]\s+", "", current_line)
+            item_content = _UNORDERED_ITEM_PATTERN.sub("", current_line)
             list_lines.append(f"  \\item {item_content}")
             i += 1
         elif current_line.strip() == "":
             # Empty line, might continue list
             i += 1
-            if i < len(lines) and re.match(
-                rf"^\s{{0,{indent_level + 2}}}[-*]\s+", lines[i]
-            ):
+            if i < len(lines) and item_pattern.match(lines[i]):
                 continue
             else:
                 break
@@ -100,22 +118,21 @@ def _process_ordered_list(
     """
     list_lines: list[str] = []
     indent_level = len(lines[start_index]) - len(lines[start_index].lstrip())
+    item_pattern = _list_item_pattern(_ORDERED_MARKER, indent_level + 2)
     i = start_index
 
     # Collect all consecutive list items at the same indent level
     while i < len(lines):
         current_line = lines[i]
-        if re.match(rf"^\s{{0,{indent_level + 2}}}\d+[.)]\s+", current_line):
+        if item_pattern.match(current_line):
             # Extract the list item content (remove the number)
-            item_content = re.sub(r"^\s*\d+[.)]\s+", "", current_line)
+            item_content = _ORDERED_ITEM_PATTERN.sub("", current_line)
             list_lines.append(f"  \\item {item_content}")
             i += 1
         elif current_line.strip() == "":
             # Empty line, might continue list
             i += 1
-            if i < len(lines) and re.match(
-                rf"^\s{{0,{indent_level + 2}}}\d+[.)]\s+", lines[i]
-            ):
+            if i < len(lines) and item_pattern.match(lines[i]):
                 continue
             else:
                 break
@@ -147,12 +164,12 @@ def extract_list_items_from_text(text: MarkdownContent) -> tuple[list[str], list
 
     for line in lines:
         # Check for unordered list items
-        unordered_match = re.match(r"^\s*[-*]\s+(.+)$", line)
+        unordered_match = _UNORDERED_ITEM_TEXT_PATTERN.match(line)
         if unordered_match:
             unordered_items.append(unordered_match.group(1).strip())
 
         # Check for ordered list items
-        ordered_match = re.match(r"^\s*\d+[.)]\s+(.+)$", line)
+        ordered_match = _ORDERED_ITEM_TEXT_PATTERN.match(line)
         if ordered_match:
             ordered_items.append(ordered_match.group(1).strip())
 
@@ -172,12 +189,12 @@ def validate_list_structure(text: MarkdownContent) -> bool:
 
     for _i, line in enumerate(lines):
         # Check for proper list item formatting
-        if re.match(r"^\s*[-*]\s", line):
+        if _UNORDERED_ITEM_PATTERN.match(line):
             # Unordered list item should have content after marker
-            if not re.match(r"^\s*[-*]\s+.+", line):
+            if not _UNORDERED_ITEM_TEXT_PATTERN.match(line):
                 return False
-        elif re.match(r"^\s*\d+[.)]\s", line) and not re.match(
-            r"^\s*\d+[.)]\s+.+", line
+        elif _ORDERED_ITEM_PATTERN.match(line) and not (
+            _ORDERED_ITEM_TEXT_PATTERN.match(line)
         ):
             # Ordered list item should have content after marker
             return False
@@ -199,12 +216,12 @@ def normalize_list_markers(text: MarkdownContent) -> MarkdownContent:
 
     for line in lines:
         # Normalize unordered list markers to use dashes
-        if re.match(r"^\s*\*\s+", line):
-            normalized = re.sub(r"^(\s*)\*(\s+)", r"\1-\2", line)
+        if _STAR_MARKER_PATTERN.match(line):
+            normalized = _STAR_MARKER_PATTERN.sub(r"\1-\2", line)
             result_lines.append(normalized)
         # Normalize ordered list markers to use periods
-        elif re.match(r"^\s*\d+\)\s+", line):
-            normalized = re.sub(r"^(\s*\d+)\)(\s+)", r"\1.\2", line)
+        elif _PAREN_NUMBER_MARKER_PATTERN.match(line):
+            normalized = _PAREN_NUMBER_MARKER_PATTERN.sub(r"\1.\2", line)
             result_lines.append(normalized)
         else:
             result_lines.append(line)
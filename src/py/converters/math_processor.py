@@ -8,6 +8,42 @@ import re
 
 from .types import LatexContent, MarkdownContent
 
+# Display math first, then inline math that is not part of a $$ delimiter
+_DISPLAY_MATH_PATTERN = re.compile(r"\$\$.*?\$\$", re.DOTALL)
+_INLINE_MATH_PATTERN = re.compile(r"(?<!\$)\$(?!\$)([^$\n]+?)(?<!\$)\$(?!\$)")
+
+# LaTeX math environments preserved by process_latex_math_blocks
+_LATEX_MATH_ENVIRONMENT_PATTERNS = tuple(
+    re.compile(rf"\\begin\{{{env}\*?\}}.*?\\end\{{{env}\*?\}}", re.DOTALL)
+    for env in [
+        "align",
+        "align*",
+        "equation",
+        "equation*",
+        "gather",
+        "gather*",
+        "multiline",
+        "multiline*",
+        "split",
+        "array",
+        "matrix",
+        "pmatrix",
+        "bmatrix",
+        "vmatrix",
+        "Vmatrix",
+    ]
+)
+
+# Math block attributes like {#eq:id .align}
+_MATH_ID_PATTERN = re.compile(r"#([a-zA-Z0-9_:-]+)")
+_MATH_ENVIRONMENT_PATTERN = re.compile(r"\.([a-zA-Z]+)")
+
+# ONLY $$...$$ followed by attributes containing #, so that regular display
+# math is left alone; the \s* allows for optional whitespace between $$ and {
+_ATTRIBUTED_MATH_BLOCK_PATTERN = re.compile(
+    r"\$\$(.*?)\$\$\s*\{([^}]*#[^}]*)\}", re.DOTALL
+)
+
 
 def protect_math_expressions(
     content: MarkdownContent,
@@ -30,11 +66,11 @@ def protect_math_expressions(
         return placeholder
 
     # Protect display math ($$...$$) first - must be done before inline math
-    content = re.sub(r"\$\$.*?\$\$", protect_math, content, flags=re.DOTALL)
+    content = _DISPLAY_MATH_PATTERN.sub(protect_math, content)
 
     # Protect inline math ($...$)
     # Use negative lookbehind/lookahead to avoid matching display math delimiters
-    content = re.sub(r"(?<!\$)\$(?!\$)([^$\n]+?)(?<!\$)\$(?!\$)", protect_math, content)
+    content = _INLINE_MATH_PATTERN.sub(protect_math, content)
 
     return content, protected_math
 
@@ -69,25 +105,6 @@ def process_latex_math_blocks(content: MarkdownContent) -> LatexContent:
     Returns:
         Content with LaTeX math blocks processed
     """
-    # LaTeX math environments to preserve
-    math_environments = [
-        "align",
-        "align*",
-        "equation",
-        "equation*",
-        "gather",
-        "gather*",
-        "multiline",
-        "multiline*",
-        "split",
-        "array",
-        "matrix",
-        "pmatrix",
-        "bmatrix",
-        "vmatrix",
-        "Vmatrix",
-    ]
-
     # Protect LaTeX math environments from markdown processing
     protected_envs: dict[str, str] = {}
 
@@ -101,9 +118,8 @@ def process_latex_math_blocks(content: MarkdownContent) -> LatexContent:
         return placeholder
 
     # Protect each math environment
-    for env in math_environments:
-        pattern = rf"\\begin\{{{env}\*?\}}.*?\\end\{{{env}\*?\}}"
-        content = re.sub(pattern, protect_env, content, flags=re.DOTALL)
+    for pattern in _LATEX_MATH_ENVIRONMENT_PATTERNS:
+        content = pattern.sub(protect_env, content)
 
     # Process the content (this would be where other markdown processing happens)
     # For now, we just restore the environments
@@ -154,12 +170,12 @@ def parse_math_block_attributes(attr_string: str) -> dict[str, str]:
     attributes = {}
 
     # Extract ID (starts with #)
-    id_match = re.search(r"#([a-zA-Z0-9_:-]+)", attr_string)
+    id_match = _MATH_ID_PATTERN.search(attr_string)
     if id_match:
         attributes["id"] = id_match.group(1)
 
     # Extract environment/class (starts with .)
-    env_match = re.search(r"\.([a-zA-Z]+)", attr_string)
+    env_match = _MATH_ENVIRONMENT_PATTERN.search(attr_string)
     if env_match:
         attributes["environment"] = env_match.group(1)
     else:
@@ -215,12 +231,7 @@ def convert_attributed_math_blocks(content: MarkdownContent) -> LatexContent:
                 f"\\label{{{equation_id}}}\n\\end{{equation}}"
             )
 
-    # Pattern to match ONLY $$...$$ followed by attributes containing #
-    # This ensures we only process attributed math blocks, not regular ones
-    # The \s* allows for optional whitespace between $$ and {
-    pattern = r"\$\$(.*?)\$\$\s*\{([^}]*#[^}]*)\}"
-
-    content = re.sub(pattern, convert_math_block, content, flags=re.DOTALL)
+    content = _ATTRIBUTED_MATH_BLOCK_PATTERN.sub(convert_math_block, content)
 
     return content
 
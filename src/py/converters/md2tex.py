@@ -41,6 +41,41 @@ from .text_formatters import (
 from .types import LatexContent, MarkdownContent, ProtectedContent
 from .url_processor import convert_links_to_latex
 
+# Placeholders left by _protect_backtick_content
+_PROTECTED_BACKTICK_PATTERN = re.compile(
+    r"XXPROTECTEDBACKTICKXX\d+XXPROTECTEDBACKTICKXX"
+)
+
+# Inline code spans (double backticks are protected first)
+_DOUBLE_BACKTICK_PATTERN = re.compile(r"``[^`]+``")
+_BACKTICK_PATTERN = re.compile(r"`[^`]+`")
+
+# Markdown headers, one to four leading hashes
+_HEADER_PATTERN = re.compile(r"^(#{1,4}) (.+)$", re.MULTILINE)
+_HEADER_COMMANDS = {1: "section", 2: "subsection", 3: "subsubsection", 4: "paragraph"}
+
+# Page break markers on a line of their own
+_CLEARPAGE_LINE_PATTERN = re.compile(r"^\s*<clearpage>\s*$", re.MULTILINE)
+_NEWPAGE_LINE_PATTERN = re.compile(r"^\s*<newpage>\s*$", re.MULTILINE)
+_FLOAT_BARRIER_LINE_PATTERN = re.compile(r"^\s*<float-barrier>\s*$", re.MULTILINE)
+
+# Tables
+_MARKDOWN_TABLE_PATTERN = re.compile(r"(?:^[ \t]*\|.*\|[ \t]*$\s*)+", re.MULTILINE)
+_LATEX_TABLE_PATTERNS = tuple(
+    re.compile(rf"\\begin\{{{env}\*?\}}.*?\\end\{{{env}\*?\}}", re.DOTALL)
+    for env in ["table", "sidewaystable", "stable"]
+)
+
+# Lists
+_LIST_BLOCK_PATTERN = re.compile(
+    r"(\\begin\{(?:itemize|enumerate)\}.*?\\end\{(?:itemize|enumerate)\})",
+    re.DOTALL,
+)
+_LIST_ITEM_PATTERN = re.compile(r"(\\item\s+)([^\\]*)")
+_LIST_ITEM_ITALIC_PATTERN = re.compile(r"(\\item\s+)\*([^*]+?)\*")
+_LIST_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_LIST_ITALIC_PATTERN = re.compile(r"\*([^*]+?)\*")
+
 
 def convert_markdown_to_latex(
     content: MarkdownContent, is_supplementary: bool = False
@@ -117,10 +152,6 @@ def convert_markdown_to_latex(
     # Convert headers
     content = _convert_headers(content, is_supplementary)
 
-    # Post-processing: catch any remaining unconverted headers
-    # This is a safety net in case some headers weren't converted properly
-    content = re.sub(r"^### (.+)$", r"\\subsubsection{\1}", content, flags=re.MULTILINE)
-
     # Process supplementary note references BEFORE citations
     # (for both main and supplementary content)
     content = process_supplementary_note_references(content)
@@ -144,9 +175,6 @@ def convert_markdown_to_latex(
     # Restore protected seqsplit commands after escaping
     content = restore_protected_seqsplit(content)
 
-    # Final step: replace all placeholders with properly escaped underscores
-    content = content.replace("XUNDERSCOREX", "\\_")
-
     # Restore protected content
     content = _restore_protected_content(
         content, protected_tables, protected_verbatim_content
@@ -169,15 +197,13 @@ def _process_newpage_markers(content: MarkdownContent) -> LatexContent:
     """
     # Replace <clearpage> with \\clearpage, handling both with and without
     # surrounding whitespace
-    content = re.sub(
-        r"^\s*<clearpage>\s*$", r"\\clearpage", content, flags=re.MULTILINE
-    )
-    content = re.sub(r"<clearpage>", r"\\clearpage", content)
+    content = _CLEARPAGE_LINE_PATTERN.sub(r"\\clearpage", content)
+    content = content.replace("<clearpage>", "\\clearpage")
 
     # Replace <newpage> with \\newpage, handling both with and without
     # surrounding whitespace
-    content = re.sub(r"^\s*<newpage>\s*$", r"\\newpage", content, flags=re.MULTILINE)
-    content = re.sub(r"<newpage>", r"\\newpage", content)
+    content = _NEWPAGE_LINE_PATTERN.sub(r"\\newpage", content)
+    content = content.replace("<newpage>", "\\newpage")
 
     return content
 
@@ -193,10 +219,8 @@ def _process_float_barrier_markers(content: MarkdownContent) -> LatexContent:
     """
     # Replace <float-barrier> with \\FloatBarrier, handling both with and without
     # surrounding whitespace
-    content = re.sub(
-        r"^\s*<float-barrier>\s*$", r"\\FloatBarrier", content, flags=re.MULTILINE
-    )
-    content = re.sub(r"<float-barrier>", r"\\FloatBarrier", content)
+    content = _FLOAT_BARRIER_LINE_PATTERN.sub(r"\\FloatBarrier", content)
+    content = content.replace("<float-barrier>", "\\FloatBarrier")
 
     return content
 
@@ -219,16 +243,28 @@ def _protect_backtick_content(
     # Protect all backtick content globally (excluding fenced blocks which are
     # already processed)
     # Handle both single backticks and double backticks for inline code
-    content = re.sub(
-        r"``[^`]+``", protect_backtick_content_func, content
+    content = _DOUBLE_BACKTICK_PATTERN.sub(
+        protect_backtick_content_func, content
     )  # Double backticks first
-    content = re.sub(
-        r"`[^`]+`", protect_backtick_content_func, content
+    content = _BACKTICK_PATTERN.sub(
+        protect_backtick_content_func, content
     )  # Then single backticks
 
     return content, protected_backtick_content
 
 
+def _restore_backtick_content(
+    content: LatexContent, protected_backtick_content: ProtectedContent
+) -> LatexContent:
+    """Restore protected backtick content in a single scan."""
+    if not protected_backtick_content:
+        return content
+    return _PROTECTED_BACKTICK_PATTERN.sub(
+        lambda match: protected_backtick_content.get(match.group(0), match.group(0)),
+        content,
+    )
+
+
 def _protect_markdown_tables(
     content: MarkdownContent,
 ) -> tuple[LatexContent, ProtectedContent]:
@@ -247,12 +283,7 @@ def _protect_markdown_tables(
     # Protect entire markdown table blocks (including headers, separators,
     # and data rows)
     # This regex matches multi-line markdown tables
-    content = re.sub(
-        r"(?:^[ \t]*\|.*\|[ \t]*$\s*)+",
-        protect_markdown_table,
-        content,
-        flags=re.MULTILINE,
-    )
+    content = _MARKDOWN_TABLE_PATTERN.sub(protect_markdown_table, content)
 
     return content, protected_markdown_tables
 
@@ -278,9 +309,7 @@ def _process_tables_with_protection(
     for i, line in enumerate(table_lines):
         if "|" in line and line.strip().startswith("|") and line.strip().endswith("|"):
             # This is a table row - restore backticks in this line only
-            for placeholder, original in protected_backtick_content.items():
-                line = line.replace(placeholder, original)
-            table_lines[i] = line
+            table_lines[i] = _restore_backtick_content(line, protected_backtick_content)
 
     temp_content = "\n".join(table_lines)
 
@@ -299,10 +328,9 @@ def _process_tables_with_protection(
         return placeholder
 
     # Protect all LaTeX table environments from further processing
-    for env in ["table", "sidewaystable", "stable"]:
-        pattern = rf"\\begin\{{{env}\*?\}}.*?\\end\{{{env}\*?\}}"
-        table_processed_content = re.sub(
-            pattern, protect_latex_table, table_processed_content, flags=re.DOTALL
+    for pattern in _LATEX_TABLE_PATTERNS:
+        table_processed_content = pattern.sub(
+            protect_latex_table, table_processed_content
         )
 
     # Re-protect any backtick content that wasn't converted to \texttt{} in tables
@@ -320,31 +348,24 @@ def _process_tables_with_protection(
 def _convert_headers(
     content: LatexContent, is_supplementary: bool = False
 ) -> LatexContent:
-    """Convert markdown headers to LaTeX sections."""
-    if is_supplementary:
-        # For supplementary content, use \\section* for the first header
-        # to avoid "Note 1:" prefix
-        # First, find the first # header and replace it with \section*
-        content = re.sub(
-            r"^# (.+)$", r"\\section*{\1}", content, flags=re.MULTILINE, count=1
-        )
-        # Then replace any remaining # headers with regular \section
-        content = re.sub(r"^# (.+)$", r"\\section{\1}", content, flags=re.MULTILINE)
-    else:
-        content = re.sub(r"^# (.+)$", r"\\section{\1}", content, flags=re.MULTILINE)
-
-    content = re.sub(r"^## (.+)$", r"\\subsection{\1}", content, flags=re.MULTILINE)
-
-    # For supplementary content, ### headers are handled by the
-    # supplementary note processor
-    # For non-supplementary content, convert all ### headers normally
-    if not is_supplementary:
-        content = re.sub(
-            r"^### (.+)$", r"\\subsubsection{\1}", content, flags=re.MULTILINE
-        )
+    r"""Convert markdown headers to LaTeX sections in a single pass.
 
-    content = re.sub(r"^#### (.+)$", r"\\paragraph{\1}", content, flags=re.MULTILINE)
-    return content
+    All header levels are rewritten by one scan. For supplementary content,
+    the first # header becomes \section* to avoid the "Note 1:" prefix, and
+    any ### headers left over by the supplementary note processor are
+    converted to \subsubsection like in the main text.
+    """
+    first_section_pending = is_supplementary
+
+    def convert_header(match: re.Match[str]) -> str:
+        nonlocal first_section_pending
+        command = _HEADER_COMMANDS[len(match.group(1))]
+        if first_section_pending and command == "section":
+            first_section_pending = False
+            command = "section*"
+        return f"\\{command}{{{match.group(2)}}}"
+
+    return _HEADER_PATTERN.sub(convert_header, content)
 
 
 def _process_text_formatting(
@@ -355,8 +376,7 @@ def _process_text_formatting(
     # code spans is preserved as literal text
 
     # First restore protected backtick content so we can process it
-    for placeholder, original in protected_backtick_content.items():
-        content = content.replace(placeholder, original)
+    content = _restore_backtick_content(content, protected_backtick_content)
 
     # Then convert backticks to texttt with proper underscore handling
     content = process_code_spans(content)
@@ -366,7 +386,7 @@ def _process_text_formatting(
     content = protect_italic_outside_texttt(content)
 
     # Special handling for italic text in list items
-    content = re.sub(r"(\\item\s+)\*([^*]+?)\*", r"\1\\textit{\2}", content)
+    content = _LIST_ITEM_ITALIC_PATTERN.sub(r"\1\\textit{\2}", content)
 
     return content
 
@@ -384,30 +404,25 @@ def _process_list_item_formatting(content: MarkdownContent) -> LatexContent:
         Text with formatted list items
     """
     # Find all list environments
-    list_pattern = (
-        r"(\\begin\{(?:itemize|enumerate)\}.*?\\end\{(?:itemize|enumerate)\})"
-    )
-    list_blocks = re.findall(list_pattern, content, re.DOTALL)
+    list_blocks = _LIST_BLOCK_PATTERN.findall(content)
 
     for list_block in list_blocks:
         formatted_block = list_block
 
         # Find all list items and format their content
-        item_pattern = r"(\\item\s+)([^\\]*)"
-
         def format_item_content(match):
             item_prefix = match.group(1)  # \item part
             item_content = match.group(2)  # content after \item
 
             # Apply bold formatting
-            item_content = re.sub(r"\*\*(.+?)\*\*", r"\\textbf{\1}", item_content)
+            item_content = _LIST_BOLD_PATTERN.sub(r"\\textbf{\1}", item_content)
 
             # Apply italic formatting - use a more inclusive pattern
-            item_content = re.sub(r"\*([^*]+?)\*", r"\\textit{\1}", item_content)
+            item_content = _LIST_ITALIC_PATTERN.sub(r"\\textit{\1}", item_content)
 
             return item_prefix + item_content
 
-        formatted_block = re.sub(item_pattern, format_item_content, formatted_block)
+        formatted_block = _LIST_ITEM_PATTERN.sub(format_item_content, formatted_block)
 
         # Replace the original block with the formatted one
         content = content.replace(list_block, formatted_block)
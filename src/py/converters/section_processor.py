@@ -4,10 +4,39 @@ This module handles extraction of content sections from markdown files
 and mapping of section titles to standardized keys.
 """
 
+import os
 import re
 
 from .types import MarkdownContent, SectionDict, SectionKey, SectionTitle
 
+_YAML_FRONT_MATTER_PATTERN = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+_SECTION_HEADER_PATTERN = re.compile(r"^## (.+?)$", re.MULTILINE)
+# A single word ending in .md, e.g. "MANUSCRIPT/01_MAIN.md"
+_MARKDOWN_PATH_PATTERN = re.compile(r"\S+\.md")
+# Case-insensitive search, so sections are not lowercased just to test this
+_SUPPLEMENTARY_PATTERN = re.compile("supplementary", re.IGNORECASE)
+
+# Title keywords and the standard section key they map to, in priority order;
+# the first keyword found in the lowercased title wins
+_SECTION_TITLE_KEYWORDS: tuple[tuple[str, SectionKey], ...] = (
+    ("abstract", "abstract"),
+    ("introduction", "main"),
+    ("method", "methods"),
+    ("result", "results"),  # "results_and_discussion" if discussed too
+    ("discussion", "discussion"),
+    ("conclusion", "conclusion"),
+    ("data availability", "data_availability"),
+    ("data access", "data_availability"),
+    ("code availability", "code_availability"),
+    ("code access", "code_availability"),
+    ("manuscript prep", "manuscript_preparation"),
+    ("contribution", "author_contributions"),
+    ("acknowledge", "acknowledgements"),
+    ("funding", "funding"),
+    ("financial support", "funding"),
+    ("grant", "funding"),
+)
+
 
 def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     """Extract content sections from markdown file and convert to LaTeX.
@@ -19,34 +48,37 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
         Dictionary mapping section keys to LaTeX content
 
     Raises:
-        FileNotFoundError: If article_md is a file path that doesn't exist
+        FileNotFoundError: If article_md is a single word ending in .md that
+            names no existing file. Other one-line strings that do not name an
+            existing file are converted as markdown content.
     """
     # Import here to avoid circular imports
     from .md2tex import convert_markdown_to_latex
 
-    # Check if article_md is a file path or content
-    if article_md.startswith("#") or article_md.startswith("---") or "\n" in article_md:
-        # It's content, not a file path
-        content = article_md
-    else:
-        # It's a file path
+    # Check if article_md is a file path or content; multi-line strings are
+    # always content, and a single line is only a path if it names an
+    # existing file or looks like a markdown file name
+    if "\n" not in article_md and (
+        _MARKDOWN_PATH_PATTERN.fullmatch(article_md) or os.path.isfile(article_md)
+    ):
         with open(article_md, encoding="utf-8") as file:
             content = file.read()
+    else:
+        content = article_md
 
     # Remove YAML front matter
-    content = re.sub(r"^---\n.*?\n---\n", "", content, flags=re.DOTALL)
+    content = _YAML_FRONT_MATTER_PATTERN.sub("", content)
 
     # Dictionary to store extracted sections
     sections: SectionDict = {}
 
     # Split content by ## headers to find sections
-    section_pattern = r"^## (.+?)$"
-    section_matches = list(re.finditer(section_pattern, content, re.MULTILINE))
+    section_matches = list(_SECTION_HEADER_PATTERN.finditer(content))
 
     # If no sections found, treat entire content as main
     if not section_matches:
         # Check if entire content is supplementary
-        is_supplementary = "supplementary" in content.lower()
+        is_supplementary = bool(_SUPPLEMENTARY_PATTERN.search(content))
         sections["main"] = convert_markdown_to_latex(content, is_supplementary)
         return sections
 
@@ -55,7 +87,7 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     main_content = content[:first_section_start].strip()
     if main_content:
         # Check if main content is supplementary
-        is_main_supplementary = "supplementary" in main_content.lower()
+        is_main_supplementary = bool(_SUPPLEMENTARY_PATTERN.search(main_content))
         sections["main"] = convert_markdown_to_latex(
             main_content, is_main_supplementary
         )
@@ -74,9 +106,9 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
         section_content = content[section_start:section_end].strip()
 
         # Check if this is supplementary content (check both title and content)
-        is_supplementary = (
-            "supplementary" in section_title.lower()
-            or "supplementary" in section_content.lower()
+        is_supplementary = bool(
+            _SUPPLEMENTARY_PATTERN.search(section_title)
+            or _SUPPLEMENTARY_PATTERN.search(section_content)
         )
 
         section_content_latex = convert_markdown_to_latex(
@@ -102,36 +134,11 @@ def map_section_title_to_key(title: SectionTitle) -> SectionKey:
     """
     title_lower = title.lower()
 
-    if "abstract" in title_lower:
-        return "abstract"
-    elif "introduction" in title_lower:
-        return "main"
-    elif "method" in title_lower:
-        return "methods"
-    elif "result" in title_lower and "discussion" in title_lower:
-        return "results_and_discussion"
-    elif "result" in title_lower:
-        return "results"
-    elif "discussion" in title_lower:
-        return "discussion"
-    elif "conclusion" in title_lower:
-        return "conclusion"
-    elif "data availability" in title_lower or "data access" in title_lower:
-        return "data_availability"
-    elif "code availability" in title_lower or "code access" in title_lower:
-        return "code_availability"
-    elif "manuscript preparation" in title_lower or "manuscript prep" in title_lower:
-        return "manuscript_preparation"
-    elif "author contribution" in title_lower or "contribution" in title_lower:
-        return "author_contributions"
-    elif "acknowledgement" in title_lower or "acknowledge" in title_lower:
-        return "acknowledgements"
-    elif (
-        "funding" in title_lower
-        or "financial support" in title_lower
-        or "grant" in title_lower
-    ):
-        return "funding"
-    else:
-        # For other sections, return as lowercase with spaces replaced by underscores
-        return title_lower.replace(" ", "_").replace("-", "_")
+    for keyword, key in _SECTION_TITLE_KEYWORDS:
+        if keyword in title_lower:
+            if key == "results" and "discussion" in title_lower:
+                return "results_and_discussion"
+            return key
+
+    # For other sections, return as lowercase with spaces replaced by underscores
+    return title_lower.replace(" ", "_").replace("-", "_")
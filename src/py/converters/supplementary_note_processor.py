@@ -12,6 +12,20 @@ if TYPE_CHECKING:
 
 from .types import LatexContent, MarkdownContent
 
+# Markdown supplementary note headers: {#snote:id} **Title**
+_SNOTE_HEADER_PATTERN = re.compile(
+    r"\{#snote:([^}]+)\}\s*\*\*([^*]+)\*\*", re.MULTILINE
+)
+# References to supplementary notes: @snote:label
+_SNOTE_REFERENCE_PATTERN = re.compile(r"@snote:([a-zA-Z0-9_-]+)")
+
+# Numbered note headers and the label derived from their title
+_NUMBERED_NOTE_HEADER_PATTERN = re.compile(
+    r"^### Supplementary Note (\d+):?\s*(.+)$", re.MULTILINE
+)
+_LABEL_PUNCTUATION_PATTERN = re.compile(r"[^\w\s-]")
+_LABEL_SEPARATOR_PATTERN = re.compile(r"[-\s]+")
+
 
 def process_supplementary_notes(content: LatexContent) -> LatexContent:
     """Process supplementary note headers and create reference labels.
@@ -29,10 +43,8 @@ def process_supplementary_notes(content: LatexContent) -> LatexContent:
     """
     # Handle markdown format {#snote:id} **Title**
     # This runs before text formatting, so we expect markdown format
-    pattern = r"\{#snote:([^}]+)\}\s*\*\*([^*]+)\*\*"
-
     # Find all matches first and store them
-    matches = re.findall(pattern, content, flags=re.MULTILINE)
+    matches = _SNOTE_HEADER_PATTERN.findall(content)
 
     if not matches:
         return content
@@ -84,9 +96,7 @@ def process_supplementary_notes(content: LatexContent) -> LatexContent:
         return match.group(0)
 
     # Replace patterns with placeholders
-    processed_content = re.sub(
-        pattern, replace_with_placeholder, content, flags=re.MULTILINE
-    )
+    processed_content = _SNOTE_HEADER_PATTERN.sub(replace_with_placeholder, content)
 
     # Store the replacements for later restoration after text formatting
     # We use a global variable since strings don't have attributes
@@ -134,16 +144,13 @@ def process_supplementary_note_references(content: LatexContent) -> LatexContent
     Returns:
         Processed content with supplementary note references converted with prefix
     """
-    # Pattern to match supplementary note references
-    # Matches: @snote:label
-    pattern = r"@snote:([a-zA-Z0-9_-]+)"
 
     def replace_reference(match):
         label = match.group(1)
         return f"\\ref{{snote:{label}}}"
 
     # Replace supplementary note references
-    content = re.sub(pattern, replace_reference, content)
+    content = _SNOTE_REFERENCE_PATTERN.sub(replace_reference, content)
 
     return content
 
@@ -159,16 +166,15 @@ def extract_supplementary_note_info(
     Returns:
         List of tuples containing (note_number, title, reference_label)
     """
-    pattern = r"^### Supplementary Note (\d+):?\s*(.+)$"
     notes_info = []
 
-    for match in re.finditer(pattern, content, re.MULTILINE):
+    for match in _NUMBERED_NOTE_HEADER_PATTERN.finditer(content):
         note_num = int(match.group(1))
         title = match.group(2).strip()
 
         # Create reference label
-        label = re.sub(r"[^\w\s-]", "", title.lower())
-        label = re.sub(r"[-\s]+", "_", label).strip("_")
+        label = _LABEL_PUNCTUATION_PATTERN.sub("", title.lower())
+        label = _LABEL_SEPARATOR_PATTERN.sub("_", label).strip("_")
 
         notes_info.append((note_num, title, label))
 
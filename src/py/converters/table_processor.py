@@ -16,6 +16,41 @@ from .types import (
     TableHeaders,
 )
 
+# Caption lines like "Table 1: Caption text" or "Table* 1: Caption text"
+_TABLE_CAPTION_LINE_PATTERN = re.compile(r"^Table\*?\s+\d+[\s:.]\s*", re.IGNORECASE)
+_TABLE_CAPTION_TEXT_PATTERN = re.compile(
+    r"^Table\*?\s+\d+[\s:.]?\s*(.*)$", re.IGNORECASE
+)
+
+# Caption lines after the table: {#table:id rotate=90} **Caption**
+_ATTRIBUTED_CAPTION_LINE_PATTERN = re.compile(r"^\{#[a-zA-Z0-9_:-]+.*\}\s*\*\*.*\*\*")
+_ATTRIBUTED_CAPTION_PATTERN = re.compile(r"^\{#([a-zA-Z0-9_:-]+)([^}]*)\}\s*(.+)$")
+_ROTATION_PATTERN = re.compile(r"rotate=(\d+)")
+
+# Markdown formatting inside cells and captions
+_BOLD_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*([^*]+)\*")
+_CELL_ITALIC_PATTERN = re.compile(r"(?<!\*)\*([^*\s][^*]*[^*\s]|\w)\*(?!\*)")
+_HEADER_BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")
+_HEADER_ITALIC_PATTERN = re.compile(r"\*(.*?)\*")
+
+# Code spans in cells: `` `code` ``, ``code`` and `code`
+_NESTED_BACKTICK_CODE_PATTERN = re.compile(r"``\s*`([^`]+)`\s*``")
+_DOUBLE_BACKTICK_CODE_PATTERN = re.compile(r"``([^`]+)``")
+_BACKTICK_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+# LaTeX commands whose content is left alone
+_TEXTTT_SPLIT_PATTERN = re.compile(r"(\\texttt\{[^}]*\})")
+_CITE_SPLIT_PATTERN = re.compile(r"(\\cite\{[^}]*\})")
+_FORMATTING_COMMAND_SPLIT_PATTERN = re.compile(
+    r"(\\texttt\{[^}]*\}|\\textbf\{[^}]*\}|\\textit\{[^}]*\})"
+)
+
+# References to regular and supplementary tables
+_TABLE_REFERENCE_PATTERN = re.compile(r"@table:([a-zA-Z0-9_-]+)")
+_SUPPLEMENTARY_TABLE_REFERENCE_PATTERN = re.compile(r"@stable:([a-zA-Z0-9_-]+)")
+
 
 def convert_tables_to_latex(
     text: MarkdownContent,
@@ -51,17 +86,13 @@ def convert_tables_to_latex(
         caption_line_index = None
         if i > 0:
             # Check line immediately before
-            if re.match(
-                r"^Table\*?\s+\d+[\s:.]\s*", lines[i - 1].strip(), re.IGNORECASE
-            ):
+            if _TABLE_CAPTION_LINE_PATTERN.match(lines[i - 1].strip()):
                 caption_line_index = i - 1
             # Check line two positions back (in case of blank line)
             elif (
                 i > 1
                 and lines[i - 1].strip() == ""
-                and re.match(
-                    r"^Table\*?\s+\d+[\s:.]\s*", lines[i - 2].strip(), re.IGNORECASE
-                )
+                and _TABLE_CAPTION_LINE_PATTERN.match(lines[i - 2].strip())
             ):
                 caption_line_index = i - 2
 
@@ -71,9 +102,7 @@ def convert_tables_to_latex(
             if caption_line.lower().startswith("table*"):
                 table_width = "double"
             # Extract caption text after "Table X:" or "Table* X:" etc.
-            caption_match = re.match(
-                r"^Table\*?\s+\d+[\s:.]?\s*(.*)$", caption_line, re.IGNORECASE
-            )
+            caption_match = _TABLE_CAPTION_TEXT_PATTERN.match(caption_line)
             if caption_match:
                 table_caption = caption_match.group(1).strip()
 
@@ -189,12 +218,8 @@ def generate_latex_table(
     # syntax in the first column
     # Remove markdown formatting from header for comparison
     first_header_clean = headers[0].lower().strip() if headers else ""
-    first_header_clean = re.sub(
-        r"\*\*(.*?)\*\*", r"\1", first_header_clean
-    )  # Remove **bold**
-    first_header_clean = re.sub(
-        r"\*(.*?)\*", r"\1", first_header_clean
-    )  # Remove *italic*
+    first_header_clean = _HEADER_BOLD_PATTERN.sub(r"\1", first_header_clean)
+    first_header_clean = _HEADER_ITALIC_PATTERN.sub(r"\1", first_header_clean)
     is_markdown_syntax_table = first_header_clean == "markdown element"
 
     # Determine if we should use tabularx for better width handling
@@ -389,7 +414,7 @@ def _format_markdown_syntax_cell(cell: str) -> str:
         return f"\\texttt{{{code_content}}}"
 
     # Process backticks first to protect literal syntax
-    cell = re.sub(r"`([^`]+)`", process_code_only, cell)
+    cell = _BACKTICK_CODE_PATTERN.sub(process_code_only, cell)
 
     # Now apply markdown formatting only to text outside of \texttt{} blocks
     # Convert **bold** to \textbf{...} and *italic* to \textit{...} if not in \texttt
@@ -397,12 +422,12 @@ def _format_markdown_syntax_cell(cell: str) -> str:
         # Don't apply formatting inside \texttt{} blocks
         if "\\texttt{" in text:
             return text
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", text)
-        text = re.sub(r"\*([^*]+)\*", r"\\textit{\1}", text)
+        text = _BOLD_PATTERN.sub(r"\\textbf{\1}", text)
+        text = _ITALIC_PATTERN.sub(r"\\textit{\1}", text)
         return text
 
     # Split by \texttt blocks and apply formatting only to the non-texttt parts
-    parts = re.split(r"(\\texttt\{[^}]*\})", cell)
+    parts = _TEXTTT_SPLIT_PATTERN.split(cell)
     for i in range(len(parts)):
         if not parts[i].startswith("\\texttt{"):
             parts[i] = apply_markdown_formatting(parts[i])
@@ -422,21 +447,19 @@ def _format_regular_table_cell(cell: str) -> str:
         # For multiline code in tables, replace newlines with spaces
         code_content = code_content.replace("\n", " ")
         # Remove multiple spaces
-        code_content = re.sub(r"\s+", " ", code_content).strip()
+        code_content = _WHITESPACE_RUN_PATTERN.sub(" ", code_content).strip()
         return f"\\texttt{{{code_content}}}"
 
     # Process code blocks - use simple approach that handles all cases
     # First handle the specific case of `` `code` `` (double backticks with
     # inner backticks)
-    cell = re.sub(
-        r"``\s*`([^`]+)`\s*``",
-        lambda m: f"\\texttt{{{_escape_for_texttt(m.group(1))}}}",
-        cell,
+    cell = _NESTED_BACKTICK_CODE_PATTERN.sub(
+        lambda m: f"\\texttt{{{_escape_for_texttt(m.group(1))}}}", cell
     )
     # Then handle regular double backticks
-    cell = re.sub(r"``([^`]+)``", process_code_in_table, cell)
+    cell = _DOUBLE_BACKTICK_CODE_PATTERN.sub(process_code_in_table, cell)
     # Finally handle single backticks
-    cell = re.sub(r"`([^`]+)`", process_code_in_table, cell)
+    cell = _BACKTICK_CODE_PATTERN.sub(process_code_in_table, cell)
 
     # Apply formatting outside texttt blocks
     cell = _apply_formatting_outside_texttt(cell)
@@ -584,29 +607,25 @@ def _apply_formatting_outside_texttt(text: str) -> str:
 
     # Handle bold first (double asterisks) - but only outside \texttt{}
     def replace_bold_outside_texttt(text: str) -> str:
-        parts = re.split(r"(\\texttt\{[^}]*\})", text)
+        parts = _TEXTTT_SPLIT_PATTERN.split(text)
         result: list[str] = []
         for _i, part in enumerate(parts):
             if part.startswith("\\texttt{"):
                 result.append(part)
             else:
-                part = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", part)
+                part = _BOLD_PATTERN.sub(r"\\textbf{\1}", part)
                 result.append(part)
         return "".join(result)
 
     # Handle italic (single asterisks) - but only outside \texttt{}
     def replace_italic_outside_texttt(text: str) -> str:
-        parts = re.split(r"(\\texttt\{[^}]*\})", text)
+        parts = _TEXTTT_SPLIT_PATTERN.split(text)
         result: list[str] = []
         for _i, part in enumerate(parts):
             if part.startswith("\\texttt{"):
                 result.append(part)
             else:
-                part = re.sub(
-                    r"(?<!\*)\*([^*\s][^*]*[^*\s]|\w)\*(?!\*)",
-                    r"\\textit{\1}",
-                    part,
-                )
+                part = _CELL_ITALIC_PATTERN.sub(r"\\textit{\1}", part)
                 result.append(part)
         return "".join(result)
 
@@ -618,7 +637,7 @@ def _apply_formatting_outside_texttt(text: str) -> str:
 def _escape_underscores_outside_cite(text: str) -> str:
     r"""Escape underscores but not inside \cite{} commands."""
     # Split text on cite commands to preserve them
-    parts = re.split(r"(\\cite\{[^}]*\})", text)
+    parts = _CITE_SPLIT_PATTERN.split(text)
     result: list[str] = []
     for part in parts:
         if part.startswith("\\cite{"):
@@ -634,7 +653,7 @@ def _escape_underscores_outside_cite(text: str) -> str:
 def _escape_outside_latex_commands(text: str) -> str:
     """Escape special characters outside LaTeX formatting commands."""
     # Split on all LaTeX formatting commands to protect them
-    parts = re.split(r"(\\texttt\{[^}]*\}|\\textbf\{[^}]*\}|\\textit\{[^}]*\})", text)
+    parts = _FORMATTING_COMMAND_SPLIT_PATTERN.split(text)
     result: list[str] = []
     for _i, part in enumerate(parts):
         if part.startswith(("\\texttt{", "\\textbf{", "\\textit{")):
@@ -694,15 +713,13 @@ def _parse_table_caption(
         i < len(lines)
         and lines[i].strip() == ""
         and i + 1 < len(lines)
-        and re.match(r"^\{#[a-zA-Z0-9_:-]+.*\}\s*\*\*.*\*\*", lines[i + 1].strip())
+        and _ATTRIBUTED_CAPTION_LINE_PATTERN.match(lines[i + 1].strip())
     ):
         # Found new format caption, parse it
         caption_line = lines[i + 1].strip()
 
         # Parse caption with optional attributes like rotate=90
-        caption_match = re.match(
-            r"^\{#([a-zA-Z0-9_:-]+)([^}]*)\}\s*(.+)$", caption_line
-        )
+        caption_match = _ATTRIBUTED_CAPTION_PATTERN.match(caption_line)
         if caption_match:
             table_id = caption_match.group(1)
             attributes_str = caption_match.group(2).strip()
@@ -710,16 +727,14 @@ def _parse_table_caption(
 
             # Extract rotation attribute if present
             if attributes_str:
-                rotation_match = re.search(r"rotate=(\d+)", attributes_str)
+                rotation_match = _ROTATION_PATTERN.search(attributes_str)
                 if rotation_match:
                     rotation_angle = int(rotation_match.group(1))
 
             # Process caption text to handle markdown formatting
-            new_format_caption = re.sub(
-                r"\*\*([^*]+)\*\*", r"\\textbf{\1}", caption_text
-            )
-            new_format_caption = re.sub(
-                r"\*([^*]+)\*", r"\\textit{\1}", new_format_caption
+            new_format_caption = _BOLD_PATTERN.sub(r"\\textbf{\1}", caption_text)
+            new_format_caption = _ITALIC_PATTERN.sub(
+                r"\\textit{\1}", new_format_caption
             )
 
     return new_format_caption, table_id, rotation_angle
@@ -750,23 +765,19 @@ def _split_table_row_respecting_backticks(row: str) -> list[str]:
 
     # Split on pipes that are not inside backticks
     cells = []
-    current_cell = ""
+    cell_start = 0
 
     for i, char in enumerate(row):
         if char == "|":
             # Check if this pipe is inside backticks
             inside_backticks = any(start <= i <= end for start, end in backtick_ranges)
             if not inside_backticks:
-                cells.append(current_cell.strip())
-                current_cell = ""
-            else:
-                current_cell += char
-        else:
-            current_cell += char
+                cells.append(row[cell_start:i].strip())
+                cell_start = i + 1
 
     # Add the last cell
-    if current_cell:
-        cells.append(current_cell.strip())
+    if cell_start < len(row):
+        cells.append(row[cell_start:].strip())
 
     # Remove empty cells at the beginning and end (markdown table format)
     while cells and not cells[0]:
@@ -790,10 +801,10 @@ def convert_table_references_to_latex(text: MarkdownContent) -> LatexContent:
         Text with table references converted to LaTeX format with "Table" prefix
     """
     # Convert @table:id to Table \ref{table:id} (regular tables)
-    text = re.sub(r"@table:([a-zA-Z0-9_-]+)", r"Table \\ref{table:\1}", text)
+    text = _TABLE_REFERENCE_PATTERN.sub(r"Table \\ref{table:\1}", text)
 
     # Convert @stable:id to Table \ref{stable:id} (supplementary tables)
-    text = re.sub(r"@stable:([a-zA-Z0-9_-]+)", r"Table \\ref{stable:\1}", text)
+    text = _SUPPLEMENTARY_TABLE_REFERENCE_PATTERN.sub(r"Table \\ref{stable:\1}", text)
 
     return text
 
@@ -8,6 +8,44 @@ import re
 
 from .types import LatexContent, MarkdownContent
 
+# Inline markdown formatting
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*(.+?)\*")
+_BOLD_WITHOUT_ASTERISKS_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+_SINGLE_ITALIC_PATTERN = re.compile(r"(?<!\*)\*([^*]+?)\*(?!\*)")
+_SUBSCRIPT_PATTERN = re.compile(r"~([^~\s]+)~")
+_SUPERSCRIPT_PATTERN = re.compile(r"\^([^\^\s]+)\^")
+
+# Markdown headers for convert_headers_to_latex
+_H2_PATTERN = re.compile(r"^## (.+)$", re.MULTILINE)
+_H3_PATTERN = re.compile(r"^### (.+)$", re.MULTILINE)
+_H4_PATTERN = re.compile(r"^#### (.+)$", re.MULTILINE)
+
+# Code spans and the placeholders they leave behind
+_DOUBLE_BACKTICK_CODE_PATTERN = re.compile(r"``([^`]+)``")
+_BACKTICK_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_PROTECTED_DETOKENIZE_PATTERN = re.compile(
+    r"PROTECTED_DETOKENIZE_START\{([^}]+)\}PROTECTED_DETOKENIZE_END"
+)
+
+# LaTeX commands, \texttt blocks and environments left alone by formatting
+_LATEX_COMMAND_SPLIT_PATTERN = re.compile(r"(\\[a-zA-Z]+\{[^}]*\})")
+_TEXTTT_SPLIT_PATTERN = re.compile(r"(\\texttt\{[^}]*\})")
+_TEXTTT_OR_ENVIRONMENT_SPLIT_PATTERN = re.compile(
+    r"(\\texttt\{[^}]*\}|\\begin\{[^}]*\*?\}.*?\\end\{[^}]*\*?\})", re.DOTALL
+)
+# \texttt blocks with one level of nested braces
+_TEXTTT_BLOCK_PATTERN = re.compile(
+    r"\\texttt\{((?:[^{}]*(?:\{[^}]*\})*[^{}]*)*)\}", re.DOTALL
+)
+
+# File names and paths whose underscores are escaped
+_PARENTHESIZED_PATTERN = re.compile(r"\(([^)]+)\)")
+_FILENAME_PATTERN = re.compile(
+    r"\b[\w]+_[\w._]*\.(md|yml|yaml|bib|tex|py|csv|pdf|png|svg|jpg)\b"
+)
+_NUMBERED_FILE_PATTERN = re.compile(r"\b\d+_[A-Z_]+\b")
+
 
 def convert_text_formatting_to_latex(text: MarkdownContent) -> LatexContent:
     """Convert markdown text formatting to LaTeX.
@@ -19,14 +57,14 @@ def convert_text_formatting_to_latex(text: MarkdownContent) -> LatexContent:
         LaTeX formatted text
     """
     # Convert bold and italic
-    text = re.sub(r"\*\*(.+?)\*\*", r"\\textbf{\1}", text)
-    text = re.sub(r"\*(.+?)\*", r"\\textit{\1}", text)
+    text = _BOLD_PATTERN.sub(r"\\textbf{\1}", text)
+    text = _ITALIC_PATTERN.sub(r"\\textit{\1}", text)
 
     # Convert simple subscript and superscript using markdown-style syntax
     # H~2~O becomes H\textsubscript{2}O
-    text = re.sub(r"~([^~\s]+)~", r"\\textsubscript{\1}", text)
+    text = _SUBSCRIPT_PATTERN.sub(r"\\textsubscript{\1}", text)
     # E=mc^2^ becomes E=mc\textsuperscript{2}
-    text = re.sub(r"\^([^\^\s]+)\^", r"\\textsuperscript{\1}", text)
+    text = _SUPERSCRIPT_PATTERN.sub(r"\\textsuperscript{\1}", text)
 
     # Note: Code conversion is handled by process_code_spans function
     # to properly support line breaking for long code spans
@@ -43,9 +81,9 @@ def convert_headers_to_latex(text: MarkdownContent) -> LatexContent:
     Returns:
         LaTeX text with section commands
     """
-    text = re.sub(r"^## (.+)$", r"\\section{\1}", text, flags=re.MULTILINE)
-    text = re.sub(r"^### (.+)$", r"\\subsection{\1}", text, flags=re.MULTILINE)
-    text = re.sub(r"^#### (.+)$", r"\\subsubsection{\1}", text, flags=re.MULTILINE)
+    text = _H2_PATTERN.sub(r"\\section{\1}", text)
+    text = _H3_PATTERN.sub(r"\\subsection{\1}", text)
+    text = _H4_PATTERN.sub(r"\\subsubsection{\1}", text)
 
     return text
 
@@ -95,19 +133,16 @@ def process_code_spans(text: MarkdownContent) -> LatexContent:
                 return f"\\texttt{{{escaped_content}}}"
 
     # Process both double and single backticks
-    text = re.sub(r"``([^`]+)``", process_code_blocks, text)  # Double backticks first
-    text = re.sub(r"`([^`]+)`", process_code_blocks, text)  # Then single backticks
+    # Double backticks first, then single backticks
+    text = _DOUBLE_BACKTICK_CODE_PATTERN.sub(process_code_blocks, text)
+    text = _BACKTICK_CODE_PATTERN.sub(process_code_blocks, text)
 
     # Convert protected detokenize placeholders to actual LaTeX
     def replace_protected_detokenize(match: re.Match[str]) -> str:
         content = match.group(1)
         return f"\\texttt{{\\detokenize{{{content}}}}}"
 
-    text = re.sub(
-        r"PROTECTED_DETOKENIZE_START\{([^}]+)\}PROTECTED_DETOKENIZE_END",
-        replace_protected_detokenize,
-        text,
-    )
+    text = _PROTECTED_DETOKENIZE_PATTERN.sub(replace_protected_detokenize, text)
 
     return text
 
@@ -132,14 +167,14 @@ def apply_bold_italic_formatting(text: MarkdownContent) -> LatexContent:
 
     # Replace bold/italic but skip if inside LaTeX commands
     # Split by LaTeX commands and only process text parts
-    parts = re.split(r"(\\[a-zA-Z]+\{[^}]*\})", text)
+    parts = _LATEX_COMMAND_SPLIT_PATTERN.split(text)
     processed_parts: list[str] = []
 
     for i, part in enumerate(parts):
         if i % 2 == 0:  # This is regular text, not a LaTeX command
             # Apply bold/italic formatting
-            part = re.sub(r"\*\*(.+?)\*\*", safe_bold_replace, part)
-            part = re.sub(r"\*(.+?)\*", safe_italic_replace, part)
+            part = _BOLD_PATTERN.sub(safe_bold_replace, part)
+            part = _ITALIC_PATTERN.sub(safe_italic_replace, part)
         # If i % 2 == 1, it's a LaTeX command - leave it unchanged
         processed_parts.append(part)
 
@@ -156,7 +191,7 @@ def protect_bold_outside_texttt(text: MarkdownContent) -> LatexContent:
         Text with bold formatting applied outside code blocks
     """
     # Split by \texttt{} blocks and process only non-texttt parts
-    parts = re.split(r"(\\texttt\{[^}]*\})", text)
+    parts = _TEXTTT_SPLIT_PATTERN.split(text)
     result: list[str] = []
 
     for _i, part in enumerate(parts):
@@ -165,7 +200,7 @@ def protect_bold_outside_texttt(text: MarkdownContent) -> LatexContent:
             result.append(part)
         else:
             # This is regular text, apply bold formatting
-            part = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", part)
+            part = _BOLD_WITHOUT_ASTERISKS_PATTERN.sub(r"\\textbf{\1}", part)
             result.append(part)
     return "".join(result)
 
@@ -181,8 +216,7 @@ def protect_italic_outside_texttt(text: MarkdownContent) -> LatexContent:
     """
     # Split by both \texttt{} blocks and LaTeX environments
     # This regex captures \texttt{} and LaTeX environments (\begin{...}...\end{...})
-    pattern = r"(\\texttt\{[^}]*\}|\\begin\{[^}]*\*?\}.*?\\end\{[^}]*\*?\})"
-    parts = re.split(pattern, text, flags=re.DOTALL)
+    parts = _TEXTTT_OR_ENVIRONMENT_SPLIT_PATTERN.split(text)
     result: list[str] = []
 
     for _i, part in enumerate(parts):
@@ -192,11 +226,7 @@ def protect_italic_outside_texttt(text: MarkdownContent) -> LatexContent:
         else:
             # This is regular text, apply italic formatting
             # Process italic markers - handle various contexts including list items
-            part = re.sub(
-                r"(?<!\*)\*([^*]+?)\*(?!\*)",
-                r"\\textit{\1}",
-                part,
-            )
+            part = _SINGLE_ITALIC_PATTERN.sub(r"\\textit{\1}", part)
             result.append(part)
     return "".join(result)
 
@@ -216,8 +246,6 @@ def escape_special_characters(text: MarkdownContent) -> LatexContent:
     # Find all texttt environments that contain listings
     def replace_listings_texttt(text: str) -> str:
         # Simple approach: find texttt blocks with listings and replace with verb
-        import re
-
         # Debug output
         if "\\texttt{" in text and "\\begin{lstlisting}" in text:
             print("DEBUG: escape_special_characters found texttt with listings in text")
@@ -257,15 +285,8 @@ def escape_special_characters(text: MarkdownContent) -> LatexContent:
                 # Return unchanged
                 return f"\\texttt{{{full_content}}}"
 
-        # Use re.DOTALL to match across newlines, and handle nested braces properly
-        # This pattern handles one level of nested braces
-        pattern = r"\\texttt\{((?:[^{}]*(?:\{[^}]*\})*[^{}]*)*)\}"
-        text = re.sub(pattern, process_texttt_block, text, flags=re.DOTALL)
-
-        return text
-        text = re.sub(pattern, process_texttt_block, text, flags=re.DOTALL)
-
-        return text
+        # Match across newlines, and handle one level of nested braces
+        return _TEXTTT_BLOCK_PATTERN.sub(process_texttt_block, text)
 
     text = replace_listings_texttt(text)
 
@@ -346,29 +367,27 @@ def escape_special_characters(text: MarkdownContent) -> LatexContent:
             or paren_content.endswith(".py")
             or paren_content.endswith(".csv")
         ):
-            return f"({paren_content.replace('_', 'XUNDERSCOREX')})"
+            escaped_content = paren_content.replace("_", "\\_")
+            return f"({escaped_content})"
         return match.group(0)
 
-    text = re.sub(r"\(([^)]+)\)", escape_file_paths_in_parens, text)
+    text = _PARENTHESIZED_PATTERN.sub(escape_file_paths_in_parens, text)
 
     # Handle remaining underscores in file names and paths
     # Match common filename patterns: WORD_WORD.ext, word_word.ext, etc.
     def escape_filenames(match: re.Match[str]) -> str:
         filename = match.group(0)
         # Escape underscores in anything that looks like a filename
-        return filename.replace("_", "XUNDERSCOREX")
+        return filename.replace("_", "\\_")
 
     # Match filenames with extensions
-    text = re.sub(
-        r"\b[\w]+_[\w._]*\.(md|yml|yaml|bib|tex|py|csv|pdf|png|svg|jpg)\b",
-        escape_filenames,
-        text,
-    )
+    text = _FILENAME_PATTERN.sub(escape_filenames, text)
 
     # Also match numbered files like 00_CONFIG, 01_MAIN, etc.
-    text = re.sub(r"\b\d+_[A-Z_]+\b", escape_filenames, text)
+    text = _NUMBERED_FILE_PATTERN.sub(escape_filenames, text)
 
-    # Final step: replace all placeholders with properly escaped underscores
+    # Final step: replace the placeholders left by code spans with properly
+    # escaped underscores (file paths above are escaped directly)
     text = text.replace("XUNDERSCOREX", "\\_")
 
     # Handle Unicode arrows that can cause LaTeX math mode issues
@@ -424,9 +443,6 @@ def restore_protected_seqsplit(text: LatexContent) -> LatexContent:
                 if remaining.startswith(end_marker):
                     end_marker_end = pos + len(end_marker)
 
-                    # Replace XUNDERSCOREX back to actual underscores
-                    content = content.replace("XUNDERSCOREX", "\\_")
-
                     # Replace with seqsplit
                     replacement = f"\\texttt{{\\seqsplit{{{content}}}}}"
                     text = text[:start_pos] + replacement + text[end_marker_end:]
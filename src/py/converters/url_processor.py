@@ -8,9 +8,34 @@ import re
 
 from .types import LatexContent, MarkdownContent
 
+# Markdown links [text](url) and bare URLs
+_MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_BARE_URL_PATTERN = re.compile(r"https?://[^\s\}>\]]+")
+
+# Everything convert_links_to_latex handles, in priority order: existing
+# \url/\href commands are kept as they are, markdown links and bare URLs
+# are converted
+_LINK_PATTERN = re.compile(
+    r"(?P<command>\\url\{[^}]+\}|\\href\{[^}]+\}\{[^}]+\})"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)"
+    r"|(?P<bare_url>https?://[^\s\}>\]]+)"
+)
+
+_URL_FORMAT_PATTERN = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+_EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+# Links that already carry their own target, followed by plain email addresses
+_EMAIL_OUTSIDE_LINKS_PATTERN = re.compile(
+    r"(?P<link>\[[^\]]+\]\([^)]+\)|\\href\{[^}]+\}\{[^}]+\})"
+    rf"|{_EMAIL_PATTERN.pattern}"
+)
+
 
 def convert_links_to_latex(text: MarkdownContent) -> LatexContent:
-    """Convert markdown links to LaTeX URLs.
+    r"""Convert markdown links and bare URLs to LaTeX URLs.
+
+    Existing \url{} and \href{} commands are matched in the same scan and
+    left untouched, so URLs inside them are not converted twice.
 
     Args:
         text: Text containing markdown links
@@ -19,10 +44,17 @@ def convert_links_to_latex(text: MarkdownContent) -> LatexContent:
         Text with links converted to LaTeX format
     """
 
-    # Handle markdown links [text](url)
     def process_link(match: re.Match[str]) -> str:
-        link_text = match.group(1)
-        url = match.group(2)
+        if match.group("command"):
+            return match.group(0)
+
+        bare_url = match.group("bare_url")
+        if bare_url:
+            return f"\\url{{{escape_url_for_latex(bare_url)}}}"
+
+        # Markdown link [text](url)
+        link_text = match.group("link_text")
+        url = match.group("link_url")
 
         # Escape special LaTeX characters in URL
         url_escaped = escape_url_for_latex(url)
@@ -34,13 +66,7 @@ def convert_links_to_latex(text: MarkdownContent) -> LatexContent:
             # Use \href{url}{text} for links with different text
             return f"\\href{{{url_escaped}}}{{{link_text}}}"
 
-    # Convert [text](url) format
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", process_link, text)
-
-    # Handle bare URLs (convert standalone URLs to \url{})
-    text = _convert_bare_urls(text)
-
-    return text
+    return _LINK_PATTERN.sub(process_link, text)
 
 
 def escape_url_for_latex(url: str) -> str:
@@ -65,39 +91,6 @@ def escape_url_for_latex(url: str) -> str:
     return url
 
 
-def _convert_bare_urls(text: MarkdownContent) -> LatexContent:
-    """Convert bare URLs to LaTeX format."""
-
-    def process_bare_url(match: re.Match[str]) -> str:
-        url = match.group(0)
-        url_escaped = escape_url_for_latex(url)
-        return f"\\url{{{url_escaped}}}"
-
-    # First pass: protect existing LaTeX commands by temporarily replacing them
-    latex_url_pattern = r"\\url\{[^}]+\}"
-    latex_href_pattern = r"\\href\{[^}]+\}\{[^}]+\}"
-
-    # Store existing LaTeX commands to avoid double-processing
-    protected_commands: list[str] = []
-
-    def protect_latex_command(match: re.Match[str]) -> str:
-        protected_commands.append(match.group(0))
-        return f"__PROTECTED_LATEX_CMD_{len(protected_commands) - 1}__"
-
-    # Protect existing LaTeX URL commands
-    text = re.sub(latex_url_pattern, protect_latex_command, text)
-    text = re.sub(latex_href_pattern, protect_latex_command, text)
-
-    # Now convert bare URLs
-    text = re.sub(r"https?://[^\s\}>\]]+", process_bare_url, text)
-
-    # Restore protected LaTeX commands
-    for i, cmd in enumerate(protected_commands):
-        text = text.replace(f"__PROTECTED_LATEX_CMD_{i}__", cmd)
-
-    return text
-
-
 def validate_url_format(url: str) -> bool:
     """Validate that a URL has proper format.
 
@@ -108,8 +101,7 @@ def validate_url_format(url: str) -> bool:
         True if URL format is valid, False otherwise
     """
     # Basic URL validation pattern
-    url_pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(url_pattern, url, re.IGNORECASE))
+    return bool(_URL_FORMAT_PATTERN.match(url))
 
 
 def extract_urls_from_text(text: MarkdownContent) -> list[tuple[str, str]]:
@@ -124,12 +116,12 @@ def extract_urls_from_text(text: MarkdownContent) -> list[tuple[str, str]]:
     urls: list[tuple[str, str]] = []
 
     # Find markdown-style links [text](url)
-    markdown_links = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", text)
+    markdown_links = _MARKDOWN_LINK_PATTERN.findall(text)
     for link_text, url in markdown_links:
         urls.append((link_text.strip(), url.strip()))
 
     # Find bare URLs
-    bare_urls = re.findall(r"https?://[^\s\}>\]]+", text)
+    bare_urls = _BARE_URL_PATTERN.findall(text)
     for url in bare_urls:
         # For bare URLs, use the URL as both text and link
         urls.append((url, url))
@@ -162,7 +154,7 @@ def normalize_urls(text: MarkdownContent) -> MarkdownContent:
         return f"[{link_text}]({url})"
 
     # Normalize markdown links
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", normalize_url, text)
+    text = _MARKDOWN_LINK_PATTERN.sub(normalize_url, text)
 
     return text
 
@@ -177,34 +169,14 @@ def convert_email_links_to_latex(text: MarkdownContent) -> LatexContent:
         Text with email addresses converted to LaTeX
     """
 
-    # Convert plain email addresses
+    # Convert plain email addresses, keeping existing links as they are
     def process_email(match: re.Match[str]) -> str:
+        if match.group("link"):
+            return match.group(0)
         email = match.group(0)
         return f"\\href{{mailto:{email}}}{{{email}}}"
 
-    # Email pattern
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-
-    # Only convert emails not already in links
-    # First protect existing links
-    protected_links: list[str] = []
-
-    def protect_link(match: re.Match[str]) -> str:
-        protected_links.append(match.group(0))
-        return f"__PROTECTED_LINK_{len(protected_links) - 1}__"
-
-    # Protect markdown links and LaTeX commands
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", protect_link, text)
-    text = re.sub(r"\\href\{[^}]+\}\{[^}]+\}", protect_link, text)
-
-    # Convert unprotected emails
-    text = re.sub(email_pattern, process_email, text)
-
-    # Restore protected links
-    for i, link in enumerate(protected_links):
-        text = text.replace(f"__PROTECTED_LINK_{i}__", link)
-
-    return text
+    return _EMAIL_OUTSIDE_LINKS_PATTERN.sub(process_email, text)
 
 
 def sanitize_url_for_latex(url: str) -> str:
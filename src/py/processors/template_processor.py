@@ -5,6 +5,7 @@ This module handles template content generation and replacement operations.
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -19,12 +20,29 @@ from processors.author_processor import (
     generate_extended_author_info,
 )
 
+# Matches template placeholders such as <PY-RPL:LONG-TITLE-STR>
+_PLACEHOLDER_PATTERN = re.compile(r"<PY-RPL:([A-Z-]+)>")
 
+
+@lru_cache(maxsize=1)
 def get_template_path():
-    """Get the path to the template file."""
+    """Get the path to the template file (fixed relative to this module)."""
     return Path(__file__).parent.parent.parent / "tex" / "template.tex"
 
 
+def read_template(template_path):
+    """Read a template file, reusing the content while the file is unchanged."""
+    template_path = Path(template_path)
+    return _load_template(str(template_path), template_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_template(path, mtime_ns):
+    """Read a template file; cached per (path, modification time)."""
+    with open(path) as template_file:
+        return template_file.read()
+
+
 def find_supplementary_md():
     """Find supplementary information file in the manuscript directory."""
     current_dir = Path.cwd()
@@ -268,7 +286,13 @@ def generate_bibliography(yaml_metadata):
 
 
 def process_template_replacements(template_content, yaml_metadata, article_md):
-    """Process all template replacements with metadata and content."""
+    """Process all template replacements with metadata and content.
+
+    The values for every ``<PY-RPL:...>`` placeholder are collected first and
+    substituted in a single pass over the template.
+    """
+    replacements = {}
+
     # Process draft watermark based on status field
     is_draft = False
     if "status" in yaml_metadata:
@@ -288,12 +312,12 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         use_line_numbers = str(yaml_metadata["use_line_numbers"]).lower() == "true"
         if use_line_numbers:
             txt = "% Add number to the lines\n\\usepackage{lineno}\n\\linenumbers\n"
-    template_content = template_content.replace("<PY-RPL:USE-LINE-NUMBERS>", txt)
+    replacements["USE-LINE-NUMBERS"] = txt
 
     # Process date
     date_str = yaml_metadata.get("date", "")
     txt = f"\\renewcommand{{\\today}}{{{date_str}}}\n" if date_str else ""
-    template_content = template_content.replace("<PY-RPL:DATE>", txt)
+    replacements["DATE"] = txt
 
     # Process lead author
     lead_author = "Unknown"
@@ -319,7 +343,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         elif isinstance(first_author, str):
             lead_author = first_author.split()[-1]
     txt = f"\\leadauthor{{{lead_author}}}\n"
-    template_content = template_content.replace("<PY-RPL:LEAD-AUTHOR>", txt)
+    replacements["LEAD-AUTHOR"] = txt
 
     # Process long title
     long_title = "Untitled Article"
@@ -337,7 +361,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         elif isinstance(yaml_metadata["title"], str):
             long_title = yaml_metadata["title"]
     txt = f"\\title{{{long_title}}}\n"
-    template_content = template_content.replace("<PY-RPL:LONG-TITLE-STR>", txt)
+    replacements["LONG-TITLE-STR"] = txt
 
     # Process short title
     short_title = "Untitled"
@@ -359,49 +383,35 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
                 else yaml_metadata["title"]
             )
     txt = f"\\shorttitle{{{short_title}}}\n"
-    template_content = template_content.replace("<PY-RPL:SHORT-TITLE-STR>", txt)
+    replacements["SHORT-TITLE-STR"] = txt
 
     # Generate authors and affiliations dynamically
     authors_and_affiliations = generate_authors_and_affiliations(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:AUTHORS-AND-AFFILIATIONS>", authors_and_affiliations
-    )
+    replacements["AUTHORS-AND-AFFILIATIONS"] = authors_and_affiliations
 
     # Generate corresponding authors section
     corresponding_authors = generate_corresponding_authors(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:CORRESPONDING-AUTHORS>", corresponding_authors
-    )
+    replacements["CORRESPONDING-AUTHORS"] = corresponding_authors
 
     # Generate extended author information section
     extended_author_info = generate_extended_author_info(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:EXTENDED-AUTHOR-INFO>", extended_author_info
-    )
+    replacements["EXTENDED-AUTHOR-INFO"] = extended_author_info
 
     # Generate keywords section
     keywords_section = generate_keywords(yaml_metadata)
-    template_content = template_content.replace("<PY-RPL:KEYWORDS>", keywords_section)
+    replacements["KEYWORDS"] = keywords_section
 
     # Generate bibliography section
     bibliography_section = generate_bibliography(yaml_metadata)
-    template_content = template_content.replace(
-        "<PY-RPL:BIBLIOGRAPHY>", bibliography_section
-    )
+    replacements["BIBLIOGRAPHY"] = bibliography_section
 
     # Extract content sections from markdown
     content_sections = extract_content_sections(article_md)
 
     # Replace content placeholders with extracted sections
-    template_content = template_content.replace(
-        "<PY-RPL:ABSTRACT>", content_sections.get("abstract", "")
-    )
-    template_content = template_content.replace(
-        "<PY-RPL:MAIN-CONTENT>", content_sections.get("main", "")
-    )
-    template_content = template_content.replace(
-        "<PY-RPL:METHODS>", content_sections.get("methods", "")
-    )
+    replacements["ABSTRACT"] = content_sections.get("abstract", "")
+    replacements["MAIN-CONTENT"] = content_sections.get("main", "")
+    replacements["METHODS"] = content_sections.get("methods", "")
 
     # Handle main content sections conditionally
     # Results section
@@ -410,9 +420,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         results_section = f"\\section*{{Results}}\n{results_content}"
     else:
         results_section = ""
-    template_content = template_content.replace(
-        "<PY-RPL:RESULTS-SECTION>", results_section
-    )
+    replacements["RESULTS-SECTION"] = results_section
 
     # Discussion section
     discussion_content = content_sections.get("discussion", "").strip()
@@ -420,9 +428,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         discussion_section = f"\\section*{{Discussion}}\n{discussion_content}"
     else:
         discussion_section = ""
-    template_content = template_content.replace(
-        "<PY-RPL:DISCUSSION-SECTION>", discussion_section
-    )
+    replacements["DISCUSSION-SECTION"] = discussion_section
 
     # Conclusions section
     conclusions_content = content_sections.get("conclusion", "").strip()
@@ -430,9 +436,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
         conclusions_section = f"\\section*{{Conclusions}}\n{conclusions_content}"
     else:
         conclusions_section = ""
-    template_content = template_content.replace(
-        "<PY-RPL:CONCLUSIONS-SECTION>", conclusions_section
-    )
+    replacements["CONCLUSIONS-SECTION"] = conclusions_section
 
     # Handle optional sections conditionally
     # Data availability
@@ -443,9 +447,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{data}}"""
     else:
         data_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:DATA-AVAILABILITY-BLOCK>", data_block
-    )
+    replacements["DATA-AVAILABILITY-BLOCK"] = data_block
 
     # Code availability
     code_availability = content_sections.get("code_availability", "").strip()
@@ -455,9 +457,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{code}}"""
     else:
         code_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:CODE-AVAILABILITY-BLOCK>", code_block
-    )
+    replacements["CODE-AVAILABILITY-BLOCK"] = code_block
 
     # Author contributions
     author_contributions = content_sections.get("author_contributions", "").strip()
@@ -467,9 +467,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{contributions}}"""
     else:
         contributions_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:AUTHOR-CONTRIBUTIONS-BLOCK>", contributions_block
-    )
+    replacements["AUTHOR-CONTRIBUTIONS-BLOCK"] = contributions_block
 
     # Acknowledgements
     acknowledgements = content_sections.get("acknowledgements", "").strip()
@@ -479,13 +477,9 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
 \\end{{acknowledgements}}"""
     else:
         acknowledgements_block = ""
-    template_content = template_content.replace(
-        "<PY-RPL:ACKNOWLEDGEMENTS-BLOCK>", acknowledgements_block
-    )
+    replacements["ACKNOWLEDGEMENTS-BLOCK"] = acknowledgements_block
 
-    template_content = template_content.replace(
-        "<PY-RPL:FUNDING>", content_sections.get("funding", "")
-    )
+    replacements["FUNDING"] = content_sections.get("funding", "")
     # Generate manuscript preparation content
     manuscript_prep_content = content_sections.get("manuscript_preparation", "")
 
@@ -514,12 +508,12 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
     else:
         manuscript_prep_block = ""
 
-    template_content = template_content.replace(
-        "<PY-RPL:MANUSCRIPT-PREPARATION-BLOCK>",
-        manuscript_prep_block,
-    )
+    replacements["MANUSCRIPT-PREPARATION-BLOCK"] = manuscript_prep_block
 
-    return template_content
+    return _PLACEHOLDER_PATTERN.sub(
+        lambda match: replacements.get(match.group(1), match.group(0)),
+        template_content,
+    )
 
 
 def parse_supplementary_sections(content):
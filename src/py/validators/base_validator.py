@@ -106,6 +106,18 @@ class BaseValidator(ABC):
         self.manuscript_path = manuscript_path
         self.name = self.__class__.__name__
 
+    def get_dependencies(self) -> list[str]:
+        """Return the paths whose contents determine the validation result.
+
+        Directories stand for every file below them. Validators that read only
+        a few manuscript files narrow this down, so that unrelated edits keep
+        their cached results.
+
+        Returns:
+            List of file and directory paths
+        """
+        return [self.manuscript_path]
+
     @abstractmethod
     def validate(self) -> ValidationResult:
         """Perform validation and return results.
@@ -34,6 +34,14 @@ class CitationValidator(BaseValidator):
         self.bib_keys: set[str] = set()
         self.citations_found: dict[str, list[int]] = {}
 
+    def get_dependencies(self) -> list[str]:
+        """Return the manuscript files this validator reads."""
+        return [
+            os.path.join(self.manuscript_path, "01_MAIN.md"),
+            os.path.join(self.manuscript_path, "02_SUPPLEMENTARY_INFO.md"),
+            os.path.join(self.manuscript_path, "03_REFERENCES.bib"),
+        ]
+
     def validate(self) -> ValidationResult:
         """Validate citations in manuscript files."""
         errors = []
@@ -271,10 +279,10 @@ class CitationValidator(BaseValidator):
                     freq_dist[count] = 0
                 freq_dist[count] += 1
 
-        # Find unused bibliography entries
+        # Find unused bibliography entries (sorted for deterministic output)
         if self.bib_keys:
-            stats["unused_bib_entries"] = list(
-                self.bib_keys - set(self.citations_found.keys())
+            stats["unused_bib_entries"] = sorted(
+                self.bib_keys.difference(self.citations_found)
             )
 
         return stats
@@ -57,6 +57,14 @@ class FigureValidator(BaseValidator):
         self.found_figures: list[dict] = []
         self.available_files: set[str] = set()
 
+    def get_dependencies(self) -> list[str]:
+        """Return the manuscript files and the figures directory."""
+        return [
+            os.path.join(self.manuscript_path, "01_MAIN.md"),
+            os.path.join(self.manuscript_path, "02_SUPPLEMENTARY_INFO.md"),
+            self.figures_dir,
+        ]
+
     def validate(self) -> ValidationResult:
         """Validate figures in manuscript files."""
         errors = []
@@ -253,6 +253,13 @@ class MathValidator(BaseValidator):
         self.found_math: list[dict] = []
         self.equation_labels: set[str] = set()
 
+    def get_dependencies(self) -> list[str]:
+        """Return the manuscript files this validator reads."""
+        return [
+            os.path.join(self.manuscript_path, "01_MAIN.md"),
+            os.path.join(self.manuscript_path, "02_SUPPLEMENTARY_INFO.md"),
+        ]
+
     def validate(self) -> ValidationResult:
         """Validate mathematical expressions in manuscript files."""
         errors = []
@@ -58,6 +58,13 @@ class ReferenceValidator(BaseValidator):
             "snote": [],
         }
 
+    def get_dependencies(self) -> list[str]:
+        """Return the manuscript files this validator reads."""
+        return [
+            os.path.join(self.manuscript_path, "01_MAIN.md"),
+            os.path.join(self.manuscript_path, "02_SUPPLEMENTARY_INFO.md"),
+        ]
+
     def validate(self) -> ValidationResult:
         """Validate cross-references in manuscript files."""
         errors = []
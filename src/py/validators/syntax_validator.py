@@ -93,6 +93,13 @@ class SyntaxValidator(BaseValidator):
             "special_chars": [],
         }
 
+    def get_dependencies(self) -> list[str]:
+        """Return the manuscript files this validator reads."""
+        return [
+            os.path.join(self.manuscript_path, "01_MAIN.md"),
+            os.path.join(self.manuscript_path, "02_SUPPLEMENTARY_INFO.md"),
+        ]
+
     def validate(self) -> ValidationResult:
         """Validate special syntax elements in manuscript files."""
         errors = []
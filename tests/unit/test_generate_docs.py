@@ -9,7 +9,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 # Import the module under test
-from src.py.commands.generate_docs import generate_enhanced_index, generate_module_docs
+from src.py.commands.generate_docs import (
+    _iter_python_modules,
+    _reset_docs_dir,
+    generate_all_module_docs,
+    generate_enhanced_index,
+    generate_module_docs,
+)
 
 
 @pytest.fixture
@@ -38,17 +44,20 @@ class TestGenerateModuleDocs:
         assert "lazydocs" in cmd_args
         assert "dummy_module.py" in cmd_args
         assert "--src-base-url" in cmd_args
+        assert mock_run.call_args.kwargs["stdout"] == subprocess.DEVNULL
 
     @patch("subprocess.run")
-    def test_generate_module_docs_failure(self, mock_run, temp_docs_dir):
+    def test_generate_module_docs_failure(self, mock_run, temp_docs_dir, capsys):
         """Test failure in module docs generation."""
         mock_run.side_effect = subprocess.CalledProcessError(
-            1, "lazydocs", stderr="Error"
+            1, "lazydocs", stderr="Error in m\u00f3dule".encode()
         )
 
         result = generate_module_docs(temp_docs_dir, "dummy_module.py")
 
         assert result is False
+        assert "text" not in mock_run.call_args.kwargs
+        assert "STDERR: Error in m\u00f3dule" in capsys.readouterr().out
 
     def test_generate_module_docs_with_empty_file(self, temp_docs_dir):
         """Test generating docs for an empty file."""
@@ -67,6 +76,78 @@ class TestGenerateModuleDocs:
             pytest.fail("generate_module_docs raised an exception with an empty file")
 
 
+class TestGenerateAllModuleDocs:
+    """Tests for the batched generate_all_module_docs function."""
+
+    @patch("subprocess.run")
+    def test_single_lazydocs_call_for_all_modules(self, mock_run, temp_docs_dir):
+        """Test that all modules are passed to one lazydocs run."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        result = generate_all_module_docs(temp_docs_dir, ["a.py", "pkg/b.py"])
+
+        assert result is True
+        mock_run.assert_called_once()
+        cmd_args = mock_run.call_args[0][0]
+        assert cmd_args[:3] == ["lazydocs", "a.py", "pkg/b.py"]
+        assert "--output-path" in cmd_args
+
+    @patch("subprocess.run")
+    def test_batch_failure_returns_false(self, mock_run, temp_docs_dir):
+        """Test that a failing batch run reports failure."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, "lazydocs", stderr="No module named '__init__'"
+        )
+
+        assert generate_all_module_docs(temp_docs_dir, ["a.py"]) is False
+
+
+class TestIterPythonModules:
+    """Tests for Python module discovery."""
+
+    def test_skips_pycache_and_test_modules(self, tmp_path):
+        """Test that caches, tests and non-Python files are not documented."""
+        for rel in [
+            "utils.py",
+            "commands/build.py",
+            "commands/test_build.py",
+            "commands/__pycache__/build.py",
+            "commands/notes.txt",
+        ]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+        modules = sorted(_iter_python_modules(tmp_path))
+
+        assert modules == [tmp_path / "commands" / "build.py", tmp_path / "utils.py"]
+
+
+class TestResetDocsDir:
+    """Tests for clearing the docs directory before generation."""
+
+    def test_old_docs_removed_and_gitkeep_preserved(self, tmp_path):
+        """Test that only .gitkeep survives and no trash is left behind."""
+        docs_dir = tmp_path / "docs" / "api"
+        (docs_dir / "nested").mkdir(parents=True)
+        (docs_dir / ".gitkeep").write_text("")
+        (docs_dir / "old_module.py.md").write_text("# old")
+        (docs_dir / "nested" / "page.md").write_text("# nested")
+
+        cleanup = _reset_docs_dir(docs_dir)
+        cleanup.join()
+
+        assert [p.name for p in docs_dir.iterdir()] == [".gitkeep"]
+        assert list((tmp_path / "docs").iterdir()) == [docs_dir]
+
+    def test_missing_docs_dir_is_created(self, tmp_path):
+        """Test that a missing docs directory is simply created."""
+        docs_dir = tmp_path / "docs" / "api"
+
+        assert _reset_docs_dir(docs_dir) is None
+        assert docs_dir.is_dir()
+
+
 class TestGenerateEnhancedIndex:
     """Tests for the generate_enhanced_index function."""
 
@@ -99,6 +180,18 @@ class TestGenerateEnhancedIndex:
             assert "processors_template_processor.py.md" in content
             assert "utils.py.md" in content
 
+    def test_readme_matches_index(self, temp_docs_dir):
+        """Test that README.md carries the same content as index.md."""
+        index_path = generate_enhanced_index(
+            temp_docs_dir, [Path("converters/md2tex.py"), Path("utils.py")]
+        )
+
+        readme_path = temp_docs_dir / "README.md"
+        assert readme_path.read_text() == index_path.read_text()
+        assert "- [converters.md2tex.py](converters_md2tex.py.md)" in (
+            readme_path.read_text()
+        )
+
     def test_generate_enhanced_index_with_empty_list(self, temp_docs_dir):
         """Test generating an enhanced index with no modules."""
         # Should handle empty module lists gracefully
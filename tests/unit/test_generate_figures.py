@@ -0,0 +1,544 @@
+"""Unit tests for the generate_figures command."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.py.commands.generate_figures import FigureGenerator
+
+MMDC_VERSION = "11.4.0"
+
+
+def fake_mmdc(cmd, **kwargs):
+    """Stand-in for subprocess.run that mimics a successful mmdc call."""
+    if "--version" in cmd:
+        return MagicMock(returncode=0, stdout=f"{MMDC_VERSION}\n".encode())
+    if "-o" in cmd:
+        output_file = Path(cmd[cmd.index("-o") + 1])
+        output_file.write_text(f"rendered {output_file.suffix}")
+    return MagicMock(returncode=0, stdout=None, stderr=b"")
+
+
+@pytest.fixture(autouse=True)
+def reset_tool_checks(monkeypatch):
+    """Forget the process-wide mmdc/Rscript availability between tests."""
+    monkeypatch.delenv("FIGURE_CACHE_DIR", raising=False)
+    FigureGenerator._mermaid_cli_available = None
+    FigureGenerator._mermaid_cli_version = None
+    FigureGenerator._rscript_available = None
+    yield
+    FigureGenerator._mermaid_cli_available = None
+    FigureGenerator._mermaid_cli_version = None
+    FigureGenerator._rscript_available = None
+
+
+@pytest.fixture
+def figures_dir(tmp_path):
+    """Create a FIGURES directory containing one Mermaid diagram."""
+    figures = tmp_path / "FIGURES"
+    figures.mkdir()
+    (figures / "Figure_1.mmd").write_text("graph TD\n    A --> B\n")
+    return figures
+
+
+def render_calls(mock_run):
+    """Return the mmdc render calls (excluding version checks)."""
+    return [c for c in mock_run.call_args_list if "-o" in c.args[0]]
+
+
+def version_checks(mock_run):
+    """Return the mmdc availability checks."""
+    return [c for c in mock_run.call_args_list if "--version" in c.args[0]]
+
+
+class TestMermaidCache:
+    """Tests for the content-addressed Mermaid render cache."""
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_unchanged_diagram_is_not_rerendered(self, mock_run, figures_dir):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        assert len(render_calls(mock_run)) == 3
+
+        mock_run.reset_mock()
+        (figures_dir / "Figure_1" / "Figure_1.png").unlink()
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert render_calls(mock_run) == []
+        output = figures_dir / "Figure_1" / "Figure_1.png"
+        assert output.read_text() == "rendered .png"
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_changed_diagram_is_rerendered(self, mock_run, figures_dir):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        mock_run.reset_mock()
+
+        (figures_dir / "Figure_1.mmd").write_text("graph TD\n    A --> C\n")
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert len(render_calls(mock_run)) == 3
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_disabled_cache_rerenders(self, mock_run, figures_dir):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        mock_run.reset_mock()
+
+        FigureGenerator(
+            figures_dir, figures_dir, use_cache=False
+        ).generate_all_figures()
+
+        assert len(render_calls(mock_run)) == 3
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_new_mmdc_version_rerenders(self, mock_run, figures_dir):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        mock_run.reset_mock()
+
+        FigureGenerator._mermaid_cli_available = None
+        with patch(f"{__name__}.MMDC_VERSION", "11.5.0"):
+            FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert len(render_calls(mock_run)) == 3
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_index_records_renders(self, mock_run, figures_dir):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        cache_dir = figures_dir / ".figure_cache"
+        index = json.loads((cache_dir / "index.json").read_text())
+        assert len(index) == 3
+        for entry in index.values():
+            assert entry["figure"] == "Figure_1"
+            assert entry["mmdc"] == MMDC_VERSION
+            assert (cache_dir / entry["file"]).exists()
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_identical_diagrams_render_once(self, mock_run, figures_dir):
+        source = (figures_dir / "Figure_1.mmd").read_text()
+        (figures_dir / "Figure_2.mmd").write_text(source)
+
+        FigureGenerator(figures_dir, figures_dir, jobs=2).generate_all_figures()
+
+        assert len(render_calls(mock_run)) == 3
+        for name in ("Figure_1", "Figure_2"):
+            output = figures_dir / name / f"{name}.svg"
+            assert output.read_text() == "rendered .svg"
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_hit_miss_summary(self, mock_run, figures_dir, capsys):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        assert "Mermaid cache: 0 hit(s), 3 miss(es)" in capsys.readouterr().out
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        assert "Mermaid cache: 3 hit(s), 0 miss(es)" in capsys.readouterr().out
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_cache_dir_from_environment(
+        self, mock_run, figures_dir, tmp_path, monkeypatch
+    ):
+        shared = tmp_path / "shared-cache"
+        monkeypatch.setenv("FIGURE_CACHE_DIR", str(shared))
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert (shared / "rxiv-figure-cache" / "index.json").exists()
+        assert not (figures_dir / ".figure_cache").exists()
+
+    def test_cached_render_used_without_cli(self, figures_dir):
+        with patch("subprocess.run", side_effect=fake_mmdc):
+            FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        (figures_dir / "Figure_1" / "Figure_1.svg").unlink()
+
+        FigureGenerator._mermaid_cli_available = None
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        output = figures_dir / "Figure_1" / "Figure_1.svg"
+        assert output.read_text() == "rendered .svg"
+
+
+class TestMermaidRender:
+    """Tests for the mmdc subprocess handling."""
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_render_output_is_not_captured_as_text(self, mock_run, figures_dir):
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        for call in render_calls(mock_run):
+            assert call.kwargs["stdout"] == subprocess.DEVNULL
+            assert call.kwargs["stderr"] == subprocess.PIPE
+            assert "text" not in call.kwargs
+
+    @patch("os.geteuid", return_value=0)
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_puppeteer_config_written_once(self, mock_run, _, figures_dir):
+        (figures_dir / "Figure_2.mmd").write_text("graph LR\n    X --> Y\n")
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        paths = {
+            c.args[0][c.args[0].index("--puppeteerConfigFile") + 1]
+            for c in render_calls(mock_run)
+        }
+        assert len(paths) == 1
+        config = json.loads(Path(paths.pop()).read_text())
+        assert config == {"args": ["--no-sandbox"]}
+        assert not (figures_dir / "puppeteer-config.json").exists()
+
+    @patch("subprocess.run")
+    def test_render_error_is_decoded(self, mock_run, figures_dir, capsys):
+        mock_run.return_value = MagicMock(
+            returncode=1, stdout=b"", stderr="Parse error on line 2 \u2717".encode()
+        )
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert "Parse error on line 2 \u2717" in capsys.readouterr().out
+        assert not (figures_dir / ".figure_cache").exists()
+
+
+class TestMermaidCliCheck:
+    """Tests for the process-wide mmdc availability check."""
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_cli_is_probed_once_per_process(self, mock_run, figures_dir):
+        (figures_dir / "Figure_2.mmd").write_text("graph LR\n    X --> Y\n")
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert len(version_checks(mock_run)) == 1
+        assert len(render_calls(mock_run)) == 6
+
+    @patch("subprocess.run", side_effect=FileNotFoundError)
+    def test_missing_cli_is_remembered(self, mock_run, figures_dir):
+        generator = FigureGenerator(figures_dir, figures_dir)
+
+        assert generator._check_mermaid_cli() is False
+        assert generator._check_mermaid_cli() is False
+        assert mock_run.call_count == 1
+
+
+class TestParallelMermaid:
+    """Tests for concurrent rendering of several Mermaid diagrams."""
+
+    @patch("subprocess.run", side_effect=fake_mmdc)
+    def test_all_diagrams_rendered_with_ordered_output(
+        self, mock_run, figures_dir, capsys
+    ):
+        for i in range(2, 6):
+            (figures_dir / f"Figure_{i}.mmd").write_text(f"graph TD\n    A --> N{i}\n")
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        assert len(render_calls(mock_run)) == 15
+        for i in range(1, 6):
+            assert (figures_dir / f"Figure_{i}" / f"Figure_{i}.pdf").exists()
+
+        # Each diagram's messages stay grouped under its own heading
+        out = capsys.readouterr().out
+        blocks = out.split("  - Figure_")[1:]
+        assert len(blocks) == 5
+        for block in blocks:
+            name = block.split(".mmd", 1)[0]
+            assert f"Figure_{name}/Figure_{name}.svg" in block
+            assert f"Figure_{name}/Figure_{name}.pdf" in block
+
+    @patch("src.py.commands.generate_figures.ThreadPoolExecutor")
+    def test_single_job_runs_serially(self, mock_executor, figures_dir):
+        with patch("subprocess.run", side_effect=fake_mmdc):
+            FigureGenerator(figures_dir, figures_dir, jobs=1).generate_all_figures()
+
+        mock_executor.assert_not_called()
+        assert (figures_dir / "Figure_1" / "Figure_1.pdf").exists()
+
+    def test_jobs_must_be_positive(self, figures_dir):
+        with pytest.raises(ValueError):
+            FigureGenerator(figures_dir, figures_dir, jobs=-2)
+        with pytest.raises(ValueError):
+            FigureGenerator(figures_dir, figures_dir, jobs=0)
+
+
+class TestRscriptCheck:
+    """Tests for the process-wide Rscript availability check."""
+
+    @patch("subprocess.run", side_effect=FileNotFoundError)
+    def test_rscript_is_probed_once(self, mock_run, figures_dir):
+        for name in ("Figure_2.R", "Figure_3.R"):
+            (figures_dir / name).write_text("plot(1)\n")
+
+        FigureGenerator(figures_dir, figures_dir).generate_all_figures()
+
+        rscript_calls = [
+            c for c in mock_run.call_args_list if c.args[0][0] == "Rscript"
+        ]
+        assert len(rscript_calls) == 1
+
+
+class TestLazyCommandsPackage:
+    """Tests for the lazily resolved exports of src.py.commands."""
+
+    def test_package_import_does_not_load_commands(self):
+        code = (
+            "import sys, src.py.commands; "
+            "print('src.py.commands.generate_figures' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parents[2],
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_exports_resolve_to_command_objects(self):
+        from src.py.commands import FigureGenerator as exported
+
+        assert exported is FigureGenerator
+
+    def test_generate_preprint_export_is_the_function(self):
+        # In a fresh interpreter, so that the submodule of the same name has
+        # not been imported directly by another test
+        code = (
+            "import src.py.commands as commands; "
+            "from src.py.commands import generate_preprint; "
+            "print(callable(generate_preprint), "
+            "commands.generate_preprint is generate_preprint)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parents[2],
+        )
+        assert result.stdout.strip() == "True True"
+
+
+class TestParallelScripts:
+    """Tests for concurrent execution of Python figure scripts."""
+
+    def test_python_scripts_run_in_their_figure_dirs(self, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        for name in ("Figure_A", "Figure_B", "Figure_C"):
+            (figures / f"{name}.py").write_text(
+                f"open('{name}.png', 'w').close()\nprint('done {name}')\n"
+            )
+
+        FigureGenerator(figures, figures).generate_all_figures()
+
+        out = capsys.readouterr().out
+        for name in ("Figure_A", "Figure_B", "Figure_C"):
+            assert (figures / name / f"{name}.png").exists()
+            block = out.split(f"  - {name}.py\n", 1)[1].split("  - ", 1)[0]
+            assert f"done {name}" in block
+
+    def test_stderr_is_only_reported_on_failure(self, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        (figures / "Figure_A.py").write_text(
+            "import sys\n"
+            "print('warning: noisy', file=sys.stderr)\n"
+            "open('Figure_A.png', 'w').close()\n"
+        )
+        (figures / "Figure_B.py").write_text(
+            "import sys\nprint('partial output')\nsys.exit('broken input')\n"
+        )
+
+        FigureGenerator(figures, figures).generate_all_figures()
+
+        out = capsys.readouterr().out
+        assert "noisy" not in out
+        assert "partial output" in out
+        assert "Error executing Figure_B.py" in out
+        assert "broken input" in out
+
+
+class TestScriptCache:
+    """Tests for skipping figure scripts whose inputs did not change."""
+
+    @pytest.fixture
+    def script_figures(self, tmp_path):
+        figures = tmp_path / "FIGURES"
+        (figures / "DATA" / "Figure_A").mkdir(parents=True)
+        (figures / "DATA" / "Figure_A" / "values.csv").write_text("x,y\n1,2\n")
+        (figures / "Figure_A.py").write_text("open('Figure_A.png', 'w').close()\n")
+        return figures
+
+    def run(self, figures, capsys):
+        FigureGenerator(figures, figures).generate_all_figures()
+        return capsys.readouterr().out
+
+    def test_unchanged_script_is_skipped(self, script_figures, capsys):
+        assert "Executing Figure_A.py" in self.run(script_figures, capsys)
+        out = self.run(script_figures, capsys)
+        assert "Executing Figure_A.py" not in out
+        assert "Figure_A.py is unchanged" in out
+
+    def test_data_change_reruns_script(self, script_figures, capsys):
+        self.run(script_figures, capsys)
+        (script_figures / "DATA" / "Figure_A" / "values.csv").write_text("x,y\n3,4\n")
+        assert "Executing Figure_A.py" in self.run(script_figures, capsys)
+
+    def test_helper_module_change_reruns_script(self, script_figures, capsys):
+        (script_figures / "style.py").write_text("COLOR = 'red'\n")
+        self.run(script_figures, capsys)
+        (script_figures / "style.py").write_text("COLOR = 'blue'\n")
+        assert "Executing Figure_A.py" in self.run(script_figures, capsys)
+
+    def test_disabled_cache_reruns_script(self, script_figures, capsys):
+        self.run(script_figures, capsys)
+        FigureGenerator(
+            script_figures, script_figures, use_cache=False
+        ).generate_all_figures()
+        assert "Executing Figure_A.py" in capsys.readouterr().out
+
+    def test_missing_output_reruns_script(self, script_figures, capsys):
+        self.run(script_figures, capsys)
+        (script_figures / "Figure_A" / "Figure_A.png").unlink()
+        assert "Executing Figure_A.py" in self.run(script_figures, capsys)
+        assert (script_figures / "Figure_A" / "Figure_A.png").exists()
+
+    def test_unchanged_stamp_skips_hashing(self, script_figures, capsys):
+        self.run(script_figures, capsys)
+        data_file = script_figures / "DATA" / "Figure_A" / "values.csv"
+        stat = data_file.stat()
+
+        # Same size and mtime: the inputs are trusted without being read
+        data_file.write_text("x,y\n5,6\n")
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert "Figure_A.py is unchanged" in self.run(script_figures, capsys)
+
+    def test_touched_input_refreshes_stamp(self, script_figures, capsys):
+        self.run(script_figures, capsys)
+        data_file = script_figures / "DATA" / "Figure_A" / "values.csv"
+        os.utime(data_file, ns=(0, 10**9))
+
+        assert "Figure_A.py is unchanged" in self.run(script_figures, capsys)
+        index_file = script_figures / ".figure_cache" / "scripts.json"
+        index = json.loads(index_file.read_text())
+        entry = index[str((script_figures / "Figure_A.py").resolve())]
+        assert ["DATA/Figure_A/values.csv", 10**9, 8] in entry["stamp"]
+
+    def test_manuscripts_sharing_a_cache_keep_their_entries(
+        self, script_figures, tmp_path, capsys, monkeypatch
+    ):
+        monkeypatch.setenv("FIGURE_CACHE_DIR", str(tmp_path / "shared-cache"))
+        other = tmp_path / "OTHER" / "FIGURES"
+        other.mkdir(parents=True)
+        (other / "Figure_A.py").write_text("open('Figure_A.pdf', 'w').close()\n")
+
+        self.run(script_figures, capsys)
+        self.run(other, capsys)
+
+        assert "Figure_A.py is unchanged" in self.run(script_figures, capsys)
+        assert "Figure_A.py is unchanged" in self.run(other, capsys)
+
+    @patch("src.py.commands.generate_figures.FigureGenerator._check_rscript")
+    def test_unchanged_r_script_is_skipped(self, _, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        (figures / "Figure_R.R").write_text("png('Figure_R.png')\n")
+        rscript_calls = []
+        popen = subprocess.Popen
+
+        def fake_rscript(cmd, **kwargs):
+            # Stand in for Rscript with a Python one-liner
+            rscript_calls.append(cmd)
+            code = "open('Figure_R.png', 'w').write('plot')"
+            return popen([sys.executable, "-c", code], **kwargs)
+
+        with patch("subprocess.Popen", side_effect=fake_rscript):
+            assert "Executing Figure_R.R" in self.run(figures, capsys)
+            out = self.run(figures, capsys)
+
+        assert len(rscript_calls) == 1
+        assert "Figure_R.R is unchanged" in out
+
+
+class TestInProcessScripts:
+    """Tests for executing Python figure scripts in-process."""
+
+    def test_script_runs_in_figure_dir(self, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        (figures / "Figure_A.py").write_text(
+            "import sys\n"
+            "open('Figure_A.png', 'w').close()\n"
+            "print('argv', sys.argv[1:])\n"
+        )
+        cwd, argv = os.getcwd(), sys.argv[:]
+
+        FigureGenerator(figures, figures, in_process=True).generate_all_figures()
+
+        out = capsys.readouterr().out
+        assert (figures / "Figure_A" / "Figure_A.png").exists()
+        assert "argv []" in out
+        assert "Generated figures" in out
+        assert os.getcwd() == cwd
+        assert sys.argv == argv
+
+    def test_script_failure_is_reported(self, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        (figures / "Figure_A.py").write_text("raise ValueError('bad data')\n")
+
+        FigureGenerator(figures, figures, in_process=True).generate_all_figures()
+
+        out = capsys.readouterr().out
+        assert "retrying in a subprocess" in out
+        assert "Error executing Figure_A.py" in out
+        assert "ValueError: bad data" in out
+
+    def test_failure_falls_back_to_subprocess(self, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        # Only succeeds in a fresh interpreter
+        (figures / "Figure_A.py").write_text(
+            "import sys\n"
+            "assert 'pytest' not in sys.modules\n"
+            "open('Figure_A.png', 'w').close()\n"
+        )
+
+        FigureGenerator(figures, figures, in_process=True).generate_all_figures()
+
+        out = capsys.readouterr().out
+        assert "retrying in a subprocess" in out
+        assert "Figure_A/Figure_A.png" in out
+
+    def test_open_figures_are_closed(self, tmp_path, capsys):
+        plt = pytest.importorskip("matplotlib.pyplot")
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        (figures / "Figure_A.py").write_text(
+            "import matplotlib.pyplot as plt\n"
+            "plt.figure()\n"
+            "plt.savefig('Figure_A.png')\n"
+        )
+
+        FigureGenerator(figures, figures, in_process=True).generate_all_figures()
+
+        assert (figures / "Figure_A" / "Figure_A.png").exists()
+        assert plt.get_fignums() == []
+
+
+class TestOutputDetection:
+    """Tests for detecting the figures a script produced."""
+
+    def test_only_new_or_rewritten_files_are_reported(self, tmp_path, capsys):
+        figures = tmp_path / "FIGURES"
+        (figures / "Figure_A").mkdir(parents=True)
+        (figures / "Figure_A" / "Figure_A_old.png").write_text("stale")
+        (figures / "Figure_A.py").write_text("open('panel.svg', 'w').write('<svg/>')\n")
+
+        FigureGenerator(figures, figures).generate_all_figures()
+
+        out = capsys.readouterr().out
+        assert "Figure_A/panel.svg" in out
+        assert "Figure_A_old.png" not in out
@@ -2,11 +2,19 @@
 
 import re
 
+import pytest
+
 from src.py.converters.citation_processor import convert_citations_to_latex
-from src.py.converters.code_processor import convert_code_blocks_to_latex
+from src.py.converters.code_processor import (
+    convert_code_blocks_to_latex,
+    protect_code_content,
+    restore_protected_code,
+)
 from src.py.converters.figure_processor import (
     convert_figure_references_to_latex,
     convert_figures_to_latex,
+    extract_figure_ids_from_text,
+    parse_figure_attributes,
 )
 from src.py.converters.html_processor import convert_html_comments_to_latex
 from src.py.converters.list_processor import convert_lists_to_latex
@@ -19,7 +27,11 @@ from src.py.converters.table_processor import (
     convert_table_references_to_latex,
     convert_tables_to_latex,
 )
-from src.py.converters.url_processor import escape_url_for_latex
+from src.py.converters.url_processor import (
+    convert_email_links_to_latex,
+    convert_links_to_latex,
+    escape_url_for_latex,
+)
 
 
 class TestMarkdownToLatexConversion:
@@ -48,6 +60,16 @@ class TestMarkdownToLatexConversion:
         assert r"\subsubsection{Subsubsection}" in result
         assert r"\paragraph{Paragraph}" in result
 
+    def test_convert_supplementary_headers(self):
+        """Test that only the first supplementary section is unnumbered."""
+        markdown = "# First\n## Sub\n# Second\n### Detail\n##### Not a header"
+        result = convert_markdown_to_latex(markdown, is_supplementary=True)
+        assert r"\section*{First}" in result
+        assert r"\section{Second}" in result
+        assert r"\subsection{Sub}" in result
+        assert r"\subsubsection{Detail}" in result
+        assert "##### Not a header" in result
+
     def test_convert_code_blocks(self):
         """Test conversion of inline code."""
         markdown = "Use `code_here` for testing."
@@ -77,6 +99,19 @@ class TestMarkdownToLatexConversion:
                 f"Failed for: {markdown}\nExpected: {expected}\nGot: {result}"
             )
 
+    def test_protected_code_round_trips(self):
+        """Test that every protected verbatim block is restored in place."""
+        blocks = [
+            f"\\begin{{verbatim}}\nblock {i}\n\\end{{verbatim}}" for i in range(12)
+        ]
+        text = "\n\ntext\n\n".join(blocks)
+
+        protected, protected_content = protect_code_content(text)
+        assert len(protected_content) == 12
+        assert "block" not in protected
+
+        assert restore_protected_code(protected, protected_content) == text
+
     def test_list_items_with_formatting(self):
         """Test list items that contain formatting (bold and italic)."""
         markdown = "- *Citation Processing* function\n- **Bold Processing** function"
@@ -146,6 +181,56 @@ class TestFigureConversion:
         result = convert_figure_references_to_latex(text)
         assert result == expected
 
+    def test_converted_figures_are_not_rescanned(self):
+        """Test that a figure inside a converted caption stays untouched."""
+        markdown = "![](FIGURES/a.png)\n{#fig:a} Caption with ![b](FIGURES/b.png)"
+        result = convert_figures_to_latex(markdown)
+
+        assert result.count(r"\begin{figure}") == 1
+        assert r"\caption{Caption with ![b](FIGURES/b.png)}" in result
+
+    def test_code_is_protected_and_restored(self):
+        """Test that code stays verbatim, including inside captions."""
+        markdown = (
+            "![](FIGURES/a.png)\n{#fig:a} Caption with `x` code\n\n"
+            "```\n![b](FIGURES/b.png) `y`\n```"
+        )
+        result = convert_figures_to_latex(markdown)
+
+        assert result.count(r"\begin{figure}") == 1
+        assert r"\caption{Caption with `x` code}" in result
+        assert result.endswith("```\n![b](FIGURES/b.png) `y`\n```")
+        assert "XXFIGURECODEXX" not in result
+
+    def test_text_without_figures_is_unchanged(self):
+        """Test that text without figure markers is returned as is."""
+        text = "Plain `code` and **bold** text with @eq:one."
+        assert convert_figures_to_latex(text) is text
+        assert convert_figure_references_to_latex(text) is text
+
+    def test_figure_ids_are_unique_and_ordered(self):
+        """Test that figure IDs are deduplicated in order of appearance."""
+        text = "{#fig:b} {#eq:x} {#sfig:a width=50%} {#fig:b} {#fig:a}"
+        assert extract_figure_ids_from_text(text) == ["fig:b", "sfig:a", "fig:a"]
+
+    def test_figure_attributes_are_parsed(self):
+        """Test parsing the figure ID and quoted key=value attributes."""
+        attributes = parse_figure_attributes(
+            '{#fig:a tex_position="!ht" width=\'0.5\' alt="see #b"}'
+        )
+        assert attributes == {
+            "id": "fig:a",
+            "tex_position": "!ht",
+            "width": "0.5",
+            "alt": "see #b",
+        }
+
+    def test_caption_emphasis_is_converted(self):
+        """Test bold and italic captions, including bold nested in italics."""
+        markdown = "![](FIGURES/a.png)\n{#fig:a} *See **this** part* and **bold**."
+        result = convert_figures_to_latex(markdown)
+        assert r"\caption{\textit{See \textbf{this} part} and \textbf{bold}.}" in result
+
 
 class TestTableReferenceConversion:
     """Test table reference conversion functionality."""
@@ -217,6 +302,9 @@ class TestSectionExtraction:
             == "results_and_discussion"
         )
         assert map_section_title_to_key("Acknowledgements") == "acknowledgements"
+        assert map_section_title_to_key("Discussion of Methods") == "methods"
+        assert map_section_title_to_key("Grant Support") == "funding"
+        assert map_section_title_to_key("Study Limits") == "study_limits"
 
     def test_extract_sections_with_yaml(self, temp_dir, sample_markdown):
         """Test extraction of sections from markdown with YAML frontmatter."""
@@ -231,6 +319,17 @@ class TestSectionExtraction:
         # Check that YAML frontmatter is removed
         assert "---" not in sections["main"]
 
+    def test_extract_sections_from_single_line_content(self):
+        """Test that a one-line markdown string is not opened as a file."""
+        sections = extract_content_sections("Some **bold** text")
+
+        assert sections == {"main": r"Some \textbf{bold} text"}
+
+    def test_extract_sections_from_missing_file(self, temp_dir):
+        """Test that a missing markdown path raises instead of being converted."""
+        with pytest.raises(FileNotFoundError):
+            extract_content_sections(str(temp_dir / "01_MAIN.md"))
+
 
 class TestHTMLCommentConversion:
     """Test HTML comment conversion."""
@@ -260,6 +359,24 @@ class TestURLEscaping:
         result = escape_url_for_latex(url)
         assert result == expected
 
+    def test_convert_links_keeps_existing_commands(self):
+        """Test that links and bare URLs convert without touching LaTeX commands."""
+        text = (
+            "[docs](https://example.com/a#b) https://example.com/c "
+            "\\url{https://example.com/d} \\href{https://example.com/e}{e}"
+        )
+        result = convert_links_to_latex(text)
+        assert result == (
+            "\\href{https://example.com/a\\#b}{docs} \\url{https://example.com/c} "
+            "\\url{https://example.com/d} \\href{https://example.com/e}{e}"
+        )
+
+    def test_convert_email_links_skips_existing_links(self):
+        """Test that only plain email addresses become mailto links."""
+        text = "a@b.org and [mail](mailto:c@d.org)"
+        result = convert_email_links_to_latex(text)
+        assert result == "\\href{mailto:a@b.org}{a@b.org} and [mail](mailto:c@d.org)"
+
 
 class TestListConversion:
     """Test markdown list conversion to LaTeX."""
@@ -1,5 +1,6 @@
 """Unit tests for the template_processor module."""
 
+import os
 from pathlib import Path
 
 from src.py.processors.template_processor import (
@@ -7,6 +8,7 @@ from src.py.processors.template_processor import (
     generate_keywords,
     get_template_path,
     process_template_replacements,
+    read_template,
 )
 
 
@@ -18,6 +20,19 @@ class TestTemplateProcessor:
         template_path = get_template_path()
         assert isinstance(template_path, (str, Path))
         assert "template.tex" in str(template_path)
+        assert get_template_path() is template_path
+
+    def test_read_template_tracks_file_changes(self, tmp_path):
+        """Test that template content is reused until the file changes."""
+        template = tmp_path / "template.tex"
+        template.write_text("first")
+        assert read_template(template) == "first"
+        assert read_template(template) is read_template(template)
+
+        template.write_text("second version")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert read_template(template) == "second version"
 
     def test_generate_keywords(self):
         """Test keyword generation from metadata."""
@@ -98,3 +113,19 @@ class TestTemplateProcessor:
         assert "Comprehensive Test" in result
         assert "Jane Doe" in result
         assert "comprehensive" in result
+
+    def test_process_template_replacements_single_pass(self):
+        """Test that substituted values are not scanned for placeholders."""
+        template_content = "<PY-RPL:LONG-TITLE-STR>|<PY-RPL:DATE>|<PY-RPL:UNKNOWN>"
+        yaml_metadata = {
+            "title": {"long": "About <PY-RPL:DATE>"},
+            "date": "2025-01-01",
+        }
+        article_md = "# Test Content"
+
+        result = process_template_replacements(
+            template_content, yaml_metadata, article_md
+        )
+        assert result.startswith("\\title{About <PY-RPL:DATE>}\n|")
+        assert "\\renewcommand{\\today}{2025-01-01}" in result
+        assert result.endswith("|<PY-RPL:UNKNOWN>")
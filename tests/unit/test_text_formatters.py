@@ -255,3 +255,13 @@ class TestRegressionTests:
         result = process_code_spans(input_text)
 
         assert "XUNDERSCOREX" in result
+
+    def test_file_path_underscores_escaped(self):
+        """Test that underscores in file names and paths are escaped once."""
+        input_text = "Edit `long_config_file_name.yml` (see 01_MAIN.md) and 00_CONFIG"
+        result = convert_markdown_to_latex(input_text, is_supplementary=False)
+
+        assert "long\\_config\\_file\\_name.yml" in result
+        assert "(see 01\\_MAIN.md)" in result
+        assert "00\\_CONFIG" in result
+        assert "XUNDERSCOREX" not in result
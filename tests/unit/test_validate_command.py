@@ -0,0 +1,142 @@
+"""Unit tests for the unified validate command."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.py.commands.validate import UnifiedValidator
+
+EXAMPLE_MANUSCRIPT = Path(__file__).parents[2] / "EXAMPLE_MANUSCRIPT"
+
+
+@pytest.fixture
+def manuscript(tmp_path):
+    """Copy the example manuscript into a temporary directory."""
+    return shutil.copytree(EXAMPLE_MANUSCRIPT, tmp_path / "MANUSCRIPT")
+
+
+class TestValidateAll:
+    """Tests for running all validators."""
+
+    def test_results_are_reported_in_order(self, manuscript, capsys):
+        validator = UnifiedValidator(str(manuscript), verbose=True, check_latex=False)
+
+        assert validator.validate_all() is True
+
+        names = ["Citations", "Cross-references", "Figures", "Mathematics", "Syntax"]
+        assert list(validator.validation_results) == names
+        out = capsys.readouterr().out
+        positions = [
+            out.index(f"Checking results of {name} validation") for name in names
+        ]
+        assert positions == sorted(positions)
+
+    def test_failing_validator_is_reported(self, manuscript, capsys):
+        validator = UnifiedValidator(str(manuscript), check_latex=False)
+
+        with patch(
+            "src.py.validators.MathValidator.validate", side_effect=RuntimeError("boom")
+        ):
+            assert validator.validate_all() is False
+
+        assert "Mathematics validation failed: boom" in capsys.readouterr().out
+        assert "Syntax" in validator.validation_results
+
+    def test_fail_fast_stops_at_first_failing_validator(self, manuscript, capsys):
+        validator = UnifiedValidator(
+            str(manuscript), check_latex=False, use_cache=False, fail_fast=True
+        )
+
+        with (
+            patch(
+                "src.py.validators.ReferenceValidator.validate",
+                side_effect=RuntimeError("boom"),
+            ),
+            patch("src.py.validators.SyntaxValidator.validate") as syntax,
+        ):
+            assert validator.validate_all() is False
+
+        syntax.assert_not_called()
+        assert list(validator.validation_results) == ["Citations"]
+        assert "Stopping after Cross-references" in capsys.readouterr().out
+
+    def test_missing_manuscript_fails_before_importing_validators(
+        self, tmp_path, capsys
+    ):
+        validator = UnifiedValidator(str(tmp_path / "missing"))
+
+        with patch.dict("sys.modules", {"src.py.validators": None}):
+            assert validator.validate_all() is False
+
+        assert "Manuscript directory not found" in capsys.readouterr().out
+
+
+class TestValidationCache:
+    """Tests for reusing validation results across runs."""
+
+    def test_unchanged_manuscript_reuses_results(self, manuscript):
+        first = UnifiedValidator(str(manuscript), check_latex=False)
+        first.validate_all()
+
+        second = UnifiedValidator(str(manuscript), check_latex=False)
+        with patch("src.py.validators.MathValidator.validate") as validate:
+            second.validate_all()
+
+        validate.assert_not_called()
+        assert second.validation_results == first.validation_results
+
+    def test_modified_manuscript_is_validated_again(self, manuscript):
+        UnifiedValidator(str(manuscript), check_latex=False).validate_all()
+        with open(manuscript / "01_MAIN.md", "a", encoding="utf-8") as f:
+            f.write("\nAn unbalanced $x + y equation.\n")
+
+        validator = UnifiedValidator(str(manuscript), check_latex=False)
+        with patch(
+            "src.py.validators.MathValidator.validate", side_effect=RuntimeError("boom")
+        ):
+            assert validator.validate_all() is False
+
+    def test_only_validators_depending_on_a_changed_file_rerun(self, manuscript):
+        UnifiedValidator(str(manuscript), check_latex=False).validate_all()
+        (manuscript / "FIGURES" / "new_figure.png").write_bytes(b"png")
+
+        validator = UnifiedValidator(str(manuscript), check_latex=False)
+        with (
+            patch("src.py.validators.CitationValidator.validate") as citations,
+            patch("src.py.validators.FigureValidator.validate") as figures,
+        ):
+            validator.validate_all()
+
+        citations.assert_not_called()
+        figures.assert_called_once()
+
+    def test_cache_can_be_disabled(self, manuscript):
+        UnifiedValidator(str(manuscript), check_latex=False).validate_all()
+
+        validator = UnifiedValidator(
+            str(manuscript), check_latex=False, use_cache=False
+        )
+        with patch(
+            "src.py.validators.MathValidator.validate", side_effect=RuntimeError("boom")
+        ):
+            assert validator.validate_all() is False
+
+
+class TestReports:
+    """Tests for the validation reports."""
+
+    def test_detailed_report_is_written_at_once(self, manuscript):
+        with open(manuscript / "01_MAIN.md", "a", encoding="utf-8") as f:
+            f.write("\nSee [@undefined_key].\n")
+        validator = UnifiedValidator(str(manuscript), verbose=True, check_latex=False)
+        validator.validate_all()
+
+        with patch("sys.stdout") as stdout:
+            validator.print_detailed_report()
+
+        stdout.write.assert_called_once()
+        report = stdout.write.call_args.args[0]
+        assert "Undefined citation: 'undefined_key'" in report
+        assert "📊 SUMMARY STATISTICS:" in report
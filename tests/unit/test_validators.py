@@ -165,6 +165,17 @@ This citation does not exist @nonexistent2023.
         error_messages = [error.message for error in result.errors]
         self.assertTrue(any("nonexistent2023" in msg for msg in error_messages))
 
+    def test_unused_bib_entries_are_sorted(self):
+        """Test that unused bibliography entries are reported in sorted order."""
+        with open(os.path.join(self.manuscript_dir, "01_MAIN.md"), "w") as f:
+            f.write("# Test Manuscript\n\nNo citations here.\n")
+
+        validator = CitationValidator(self.manuscript_dir)
+        validator.validate()
+        stats = validator.get_citation_statistics()
+
+        self.assertEqual(stats["unused_bib_entries"], ["jones2022", "smith2023"])
+
 
 @pytest.mark.validation
 @unittest.skipUnless(VALIDATORS_AVAILABLE, "Validators not available")